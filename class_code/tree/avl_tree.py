@@ -1,9 +1,19 @@
+import random
 import unittest
-from avltree import AvlTree
 
-class TestAvlTree(unittest.TestCase):
+from ordered_map import OrderedMap
+
+try:
+    from avltree import AvlTree
+except ImportError:
+    AvlTree = None
+
+class AvlTreeCases:
+    def new_tree(self):
+        raise NotImplementedError
+
     def setUp(self) -> None:
-        self.tree = AvlTree[int, str]()
+        self.tree = self.new_tree()
     
     def test_insert(self):
         self.tree[10] = "dez"
@@ -48,10 +58,105 @@ class TestAvlTree(unittest.TestCase):
         self.assertEqual(self.tree[30], "trinta")
 
     def test_empty_tree(self):
-        breakpoint()
         self.assertEqual(len(self.tree), 0)
-        
-        
+
+@unittest.skipIf(AvlTree is None, "pacote avltree não instalado")
+class TestAvlTree(AvlTreeCases, unittest.TestCase):
+    def new_tree(self):
+        return AvlTree[int, str]()
+
+class TestOrderedMap(AvlTreeCases, unittest.TestCase):
+    def new_tree(self):
+        return OrderedMap[int, str]()
+
+    def assert_same_as_dict(self, tree: OrderedMap, reference: dict):
+        self.assertEqual(list(tree.items()), sorted(reference.items()))
+        self.assertEqual(len(tree), len(reference))
+
+    def test_random_operations_keep_order(self):
+        generator = random.Random(7)
+        reference = {}
+        for _ in range(3000):
+            key = generator.randrange(500)
+            if generator.random() < 0.6:
+                self.tree[key] = str(key)
+                reference[key] = str(key)
+            elif key in reference:
+                del self.tree[key]
+                del reference[key]
+            else:
+                with self.assertRaises(KeyError):
+                    del self.tree[key]
+        self.assert_same_as_dict(self.tree, reference)
+
+    def test_from_sorted(self):
+        tree = OrderedMap.from_sorted((i, str(i)) for i in range(0, 1000, 2))
+        self.assertEqual(tree[500], "500")
+        self.assertNotIn(501, tree)
+        self.assertEqual(len(tree), 500)
+        with self.assertRaises(ValueError):
+            OrderedMap.from_sorted([(1, "um"), (1, "um")])
+
+    def test_range_floor_ceiling(self):
+        tree = OrderedMap.from_sorted((i, str(i)) for i in range(0, 100, 10))
+        self.assertEqual([key for key, _ in tree.range(15, 50)], [20, 30, 40])
+        self.assertEqual([key for key, _ in tree.range(hi=20)], [0, 10])
+        self.assertEqual([key for key, _ in tree.range(85)], [90])
+        self.assertEqual(list(tree.range(50, 50)), [])
+        self.assertEqual((tree.floor(35), tree.floor(30), tree.floor(-1)), (30, 30, None))
+        self.assertEqual((tree.ceiling(35), tree.ceiling(30), tree.ceiling(91)), (40, 30, None))
+
+    def test_batch_insert_and_delete(self):
+        generator = random.Random(8)
+        reference = {}
+        for size in (3, 2000, 10):
+            items = [(generator.randrange(5000), str(size)) for _ in range(size)]
+            self.tree.insert_many(items)
+            reference.update(items)
+            self.assert_same_as_dict(self.tree, reference)
+            keys = [generator.randrange(5000) for _ in range(size // 2)]
+            removed = self.tree.delete_many(keys)
+            self.assertEqual(removed, len(set(keys) & reference.keys()))
+            for key in keys:
+                reference.pop(key, None)
+            self.assert_same_as_dict(self.tree, reference)
+
+    def test_rank_select_count_range(self):
+        generator = random.Random(9)
+        reference = {}
+        for step in range(2000):
+            key = generator.randrange(400)
+            if generator.random() < 0.6:
+                self.tree[key] = str(key)
+                reference[key] = str(key)
+            elif key in reference:
+                del self.tree[key]
+                del reference[key]
+            if step % 400 == 0:
+                self.tree.insert_many((generator.randrange(400), "lote") for _ in range(300))
+                reference = dict(self.tree.items())
+        keys = sorted(reference)
+        for index, key in enumerate(keys):
+            self.assertEqual(self.tree.select(index), key)
+            self.assertEqual(self.tree.rank(key), index)
+        self.assertEqual(self.tree.select(-1), keys[-1])
+        self.assertEqual(self.tree.rank(-5), 0)
+        self.assertEqual(self.tree.rank(10_000), len(keys))
+        for lo, hi in ((10, 50), (0, 400), (50, 10), (None, 30), (200, None), (None, None)):
+            expected = sum(1 for key in keys if (lo is None or lo <= key) and (hi is None or key < hi))
+            self.assertEqual(self.tree.count_range(lo, hi), expected)
+            self.assertEqual(self.tree.count_range(lo, hi), len(list(self.tree.range(lo, hi))))
+        with self.assertRaises(IndexError):
+            self.tree.select(len(keys))
+
+    def test_sizes_after_bulk_build(self):
+        tree = OrderedMap.from_sorted((i, str(i)) for i in range(1000))
+        self.assertEqual(tree.rank(500), 500)
+        self.assertEqual(tree.select(999), 999)
+        self.assertEqual(tree.count_range(100, 200), 100)
+        tree.delete_many(range(0, 1000, 2))
+        self.assertEqual((tree.rank(500), tree.select(0), tree.count_range(100, 200)), (250, 1, 50))
+
 
 
 if __name__ == "__main__":
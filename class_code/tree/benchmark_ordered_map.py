@@ -0,0 +1,114 @@
+"""
+Compares OrderedMap with the avltree package (when installed):
+    - loading n sorted keys one by one versus OrderedMap.from_sorted;
+    - n lookups in random order;
+    - range queries returning about 100 keys each;
+    - rank, select and count_range (AvlTree has no order statistics: it answers them by iteration).
+
+Run:
+    python benchmark_ordered_map.py
+"""
+
+import random
+import time
+from typing import Callable
+
+from ordered_map import OrderedMap
+
+try:
+    from avltree import AvlTree
+except ImportError:
+    AvlTree = None
+
+SIZES = [10_000, 100_000, 1_000_000]
+RANGE_QUERIES = 1_000
+RANGE_WIDTH = 100
+ORDER_STATISTIC_QUERIES = 100_000
+# Iterating answers one query in O(n), so only a few are timed and the cost is reported per query
+ITERATION_QUERIES = 10
+
+
+def timed(function: Callable[[], object]) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def load_one_by_one(tree_class, keys: list[int]):
+    tree = tree_class()
+    for key in keys:
+        tree[key] = str(key)
+    return tree
+
+
+def lookups(tree, keys: list[int]) -> None:
+    for key in keys:
+        tree[key]
+
+
+def range_queries(tree: OrderedMap, starts: list[int]) -> int:
+    return sum(1 for start in starts for _ in tree.range(start, start + RANGE_WIDTH))
+
+
+def order_statistics(ordered_map: OrderedMap, avl_tree, size: int, generator: random.Random) -> None:
+    """
+    Microseconds per query: OrderedMap in O(log n) against counting by iteration, as the avltree API requires.
+    """
+    keys = [generator.randrange(size) for _ in range(ORDER_STATISTIC_QUERIES)]
+    queries = [
+        ("rank", lambda: [ordered_map.rank(key) for key in keys],
+         lambda tree, key: sum(1 for _ in tree.between(None, key, "exclusive"))),
+        ("select", lambda: [ordered_map.select(key) for key in keys],
+         lambda tree, key: next(item for position, item in enumerate(tree) if position == key)),
+        ("count_range", lambda: [ordered_map.count_range(key, key + size // 10) for key in keys],
+         # between() has no half-open mode: the upper key is included and dropped here
+         lambda tree, key: sum(1 for item in tree.between(key, key + size // 10) if item != key + size // 10)),
+    ]
+    for name, ours, by_iteration in queries:
+        seconds, _ = timed(ours)
+        ours_column = f"{1e6 * seconds / ORDER_STATISTIC_QUERIES:>9.2f}us"
+        theirs_column = f"{'-':>11}"
+        if avl_tree is not None:
+            iteration_seconds, _ = timed(lambda: [by_iteration(avl_tree, key) for key in keys[:ITERATION_QUERIES]])
+            theirs_column = f"{1e6 * iteration_seconds / ITERATION_QUERIES:>9.0f}us"
+        print(f"{size:>9} {name + ' per query':>28} {ours_column} {theirs_column}")
+
+
+def main() -> None:
+    if AvlTree is None:
+        print("avltree is not installed (pip install avltree): only OrderedMap is measured")
+    print(f"{'n':>9} {'operation':>28} {'OrderedMap':>11} {'avltree':>11}")
+    generator = random.Random(0)
+    for size in SIZES:
+        keys = list(range(size))
+        shuffled = keys[:]
+        generator.shuffle(shuffled)
+        starts = [generator.randrange(size) for _ in range(RANGE_QUERIES)]
+
+        loaded_seconds, ordered_map = timed(lambda: load_one_by_one(OrderedMap, keys))
+        bulk_seconds, ordered_map = timed(lambda: OrderedMap.from_sorted((key, str(key)) for key in keys))
+        lookup_seconds, _ = timed(lambda: lookups(ordered_map, shuffled))
+        range_seconds, _ = timed(lambda: range_queries(ordered_map, starts))
+        rows = [
+            ("sorted load, one by one", loaded_seconds, None),
+            ("sorted load, from_sorted", bulk_seconds, None),
+            ("random lookups", lookup_seconds, None),
+            (f"{RANGE_QUERIES} range queries", range_seconds, None),
+        ]
+        avl_tree = None
+        if AvlTree is not None:
+            avl_loaded_seconds, avl_tree = timed(lambda: load_one_by_one(AvlTree, keys))
+            avl_lookup_seconds, _ = timed(lambda: lookups(avl_tree, shuffled))
+            avl_range_seconds, _ = timed(lambda: sum(1 for start in starts for _ in avl_tree.between(start, start + RANGE_WIDTH - 1)))
+            rows[0] = (rows[0][0], loaded_seconds, avl_loaded_seconds)
+            rows[1] = (rows[1][0], bulk_seconds, avl_loaded_seconds)
+            rows[2] = (rows[2][0], lookup_seconds, avl_lookup_seconds)
+            rows[3] = (rows[3][0], range_seconds, avl_range_seconds)
+        for operation, ours, theirs in rows:
+            theirs_column = f"{theirs:>10.3f}s" if theirs is not None else f"{'-':>11}"
+            print(f"{size:>9} {operation:>28} {ours:>10.3f}s {theirs_column}")
+        order_statistics(ordered_map, avl_tree, size, generator)
+
+
+if __name__ == "__main__":
+    main()
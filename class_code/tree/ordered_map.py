@@ -0,0 +1,380 @@
+import gc
+from typing import Generic, Iterable, Iterator, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _Node:
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
+    def __init__(self, key, value, left: "_Node | None" = None, right: "_Node | None" = None, height: int = 1, size: int = 1):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = height
+        # Number of nodes in this subtree, kept up to date by _update after every change and rotation
+        self.size = size
+
+
+def _height(node: _Node | None) -> int:
+    return node.height if node else 0
+
+
+def _size(node: _Node | None) -> int:
+    return node.size if node else 0
+
+
+def _update(node: _Node) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: _Node) -> _Node:
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _build(items: list, start: int, end: int) -> _Node | None:
+    """
+    Perfectly balanced subtree from the non-empty items[start:end], already sorted by key.
+    Recursion depth is O(log n).
+    """
+    middle = (start + end) // 2
+    key, value = items[middle]
+    # Empty halves are not recursed into: they are about half of all calls
+    left = _build(items, start, middle) if start < middle else None
+    right = _build(items, middle + 1, end) if middle + 1 < end else None
+    return _Node(key, value, left, right, 1 + max(_height(left), _height(right)), end - start)
+
+
+def _build_all(items: list) -> _Node | None:
+    """
+    Builds the whole tree with the cyclic garbage collector paused: the new nodes form no cycles, and
+    collections triggered by a million allocations would otherwise take most of the time.
+    """
+    if not items:
+        return None
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _build(items, 0, len(items))
+    finally:
+        if collecting:
+            gc.enable()
+
+
+class OrderedMap(Generic[K, V]):
+    """
+    Ordered map on an AVL tree, with the same item-access API as avltree.AvlTree plus bulk loading
+    from sorted input, lazy range iteration, floor/ceiling lookups and batch insert/delete.
+    Insertion and deletion walk down with an explicit path and rebalance on the way back up.
+    Every node also stores its subtree size, which answers rank, select and count_range in O(log n).
+    """
+
+    def __init__(self, items: Iterable[tuple[K, V]] | None = None):
+        self._root: _Node | None = None
+        self._length = 0
+        if items is not None:
+            self.insert_many(items)
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[tuple[K, V]]) -> "OrderedMap[K, V]":
+        """
+        Builds the map in O(n) from (key, value) pairs with strictly increasing keys.
+
+        Raises:
+            ValueError: If the keys are not strictly increasing.
+        """
+        items = list(items)
+        for (previous, _), (key, _) in zip(items, items[1:]):
+            if not previous < key:
+                raise ValueError(f"Keys must be strictly increasing: {previous!r} before {key!r}")
+        tree = cls()
+        tree._root = _build_all(items)
+        tree._length = len(items)
+        return tree
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _find(self, key: K) -> _Node | None:
+        node = self._root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __getitem__(self, key: K) -> V:
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None
+
+    def _relink(self, path: list[tuple[_Node, bool]], subtree: _Node | None) -> None:
+        """
+        Walks back up the path (node, went_left) rebalancing each node and hanging 'subtree' under it.
+        """
+        for node, went_left in reversed(path):
+            if went_left:
+                node.left = subtree
+            else:
+                node.right = subtree
+            subtree = _rebalance(node)
+        self._root = subtree
+
+    def __setitem__(self, key: K, value: V) -> None:
+        path: list[tuple[_Node, bool]] = []
+        node = self._root
+        while node:
+            if key < node.key:
+                path.append((node, True))
+                node = node.left
+            elif node.key < key:
+                path.append((node, False))
+                node = node.right
+            else:
+                node.value = value
+                return
+        self._length += 1
+        self._relink(path, _Node(key, value))
+
+    def __delitem__(self, key: K) -> None:
+        path: list[tuple[_Node, bool]] = []
+        node = self._root
+        while node and (key < node.key or node.key < key):
+            went_left = key < node.key
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        if node is None:
+            raise KeyError(key)
+        self._length -= 1
+        if node.left is None or node.right is None:
+            self._relink(path, node.left or node.right)
+            return
+        # Two children: the successor (leftmost of the right subtree) takes the node's place
+        successor_path: list[tuple[_Node, bool]] = [(node, False)]
+        successor = node.right
+        while successor.left:
+            successor_path.append((successor, True))
+            successor = successor.left
+        node.key, node.value = successor.key, successor.value
+        self._relink(path + successor_path, successor.right)
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self.items():
+            yield key
+
+    def keys(self) -> Iterator[K]:
+        return iter(self)
+
+    def values(self) -> Iterator[V]:
+        for _, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        return self.range()
+
+    def range(self, lo: K | None = None, hi: K | None = None) -> Iterator[tuple[K, V]]:
+        """
+        Lazily yields the (key, value) pairs with lo <= key < hi in key order (None means unbounded),
+        in O(log n) to start plus O(1) amortized per pair.
+        """
+        stack: list[_Node] = []
+        node = self._root
+        while True:
+            while node:
+                # Subtrees entirely below lo are skipped without being visited
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and not node.key < hi:
+                return
+            yield node.key, node.value
+            node = node.right
+
+    def floor(self, key: K) -> K | None:
+        """
+        Largest key <= key, or None if there is none.
+        """
+        best = None
+        node = self._root
+        while node:
+            if key < node.key:
+                node = node.left
+            else:
+                best = node.key
+                if not node.key < key:
+                    break
+                node = node.right
+        return best
+
+    def ceiling(self, key: K) -> K | None:
+        """
+        Smallest key >= key, or None if there is none.
+        """
+        best = None
+        node = self._root
+        while node:
+            if node.key < key:
+                node = node.right
+            else:
+                best = node.key
+                if not key < node.key:
+                    break
+                node = node.left
+        return best
+
+    def rank(self, key: K) -> int:
+        """
+        Number of keys strictly smaller than key.
+        """
+        smaller = 0
+        node = self._root
+        while node:
+            if node.key < key:
+                smaller += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return smaller
+
+    def select(self, index: int) -> K:
+        """
+        The index-th smallest key (0-based; negative indexes count from the end, as in lists).
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("OrderedMap index out of range")
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.key
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo: K | None = None, hi: K | None = None) -> int:
+        """
+        Number of keys with lo <= key < hi (None means unbounded), the same pairs 'range' yields.
+        """
+        upper = self._length if hi is None else self.rank(hi)
+        lower = 0 if lo is None else self.rank(lo)
+        return max(upper - lower, 0)
+
+    def minimum(self) -> K | None:
+        node = self._root
+        while node and node.left:
+            node = node.left
+        return node.key if node else None
+
+    def maximum(self) -> K | None:
+        node = self._root
+        while node and node.right:
+            node = node.right
+        return node.key if node else None
+
+    def _large_batch(self, size: int) -> bool:
+        # One rebuild costs O(n + m); m single operations cost O(m log n)
+        return size * max(self._length.bit_length(), 1) >= self._length
+
+    def insert_many(self, items: Iterable[tuple[K, V]]) -> None:
+        """
+        Inserts or updates many pairs (the last value wins for repeated keys). Large batches are merged
+        with the current contents and rebuilt in O(n + m log m) instead of m separate insertions.
+        """
+        batch = dict(items)
+        if not self._large_batch(len(batch)):
+            for key, value in batch.items():
+                self[key] = value
+            return
+        merged: list[tuple[K, V]] = []
+        new_items = sorted(batch.items(), key=lambda item: item[0])
+        position = 0
+        for key, value in self.items():
+            while position < len(new_items) and new_items[position][0] < key:
+                merged.append(new_items[position])
+                position += 1
+            if position < len(new_items) and not key < new_items[position][0]:
+                merged.append(new_items[position])
+                position += 1
+            else:
+                merged.append((key, value))
+        merged.extend(new_items[position:])
+        self._root = _build_all(merged)
+        self._length = len(merged)
+
+    def delete_many(self, keys: Iterable[K]) -> int:
+        """
+        Removes many keys, ignoring the absent ones. Large batches are applied with a single rebuild.
+
+        Returns:
+            int: The number of keys removed.
+        """
+        batch = set(keys)
+        if not self._large_batch(len(batch)):
+            removed = 0
+            for key in batch:
+                if key in self:
+                    del self[key]
+                    removed += 1
+            return removed
+        kept = [item for item in self.items() if item[0] not in batch]
+        removed = self._length - len(kept)
+        self._root = _build_all(kept)
+        self._length = len(kept)
+        return removed
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.items())!r})"
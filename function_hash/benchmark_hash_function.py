@@ -0,0 +1,63 @@
+"""
+    Throughput (MB/s) of hash_function_reference, hash_function and hash_file.
+
+    Run the benchmark with the command:
+    1 - python benchmark_hash_function.py
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import Callable
+
+from main import hash_file, hash_function, hash_function_reference
+
+sizes = [100_000, 1_000_000, 10_000_000]
+# The reference takes seconds per MB: above this size only the new functions are measured
+reference_size_limit = 2_000_000
+
+
+def make_lines(size: int, generator: random.Random) -> list[str]:
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "ação", "índice", "日本語"]
+    lines: list[str] = []
+    length = 0
+    while length < size:
+        line = " ".join(generator.choice(words) for _ in range(12)) + "\n"
+        lines.append(line)
+        length += len(line.encode("utf-8"))
+    return lines
+
+
+def throughput(function: Callable[[], bytes], size: int) -> tuple[float, bytes]:
+    start = time.perf_counter()
+    digest = function()
+    return size / (time.perf_counter() - start) / 1e6, digest
+
+
+def main() -> None:
+    generator = random.Random(0)
+    print(f"{'bytes':>11} {'reference':>12} {'hash_function':>14} {'hash_file':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            lines = make_lines(size, generator)
+            path = os.path.join(directory, "data.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.writelines(lines)
+            size = os.path.getsize(path)
+
+            fast, digest = throughput(lambda: hash_function(lines), size)
+            streamed, streamed_digest = throughput(lambda: hash_file(path), size)
+            if streamed_digest != digest:
+                raise RuntimeError(f"hash_file and hash_function produced different digests for {size} bytes")
+            reference_column = f"{'-':>12}"
+            if size <= reference_size_limit:
+                reference, reference_digest = throughput(lambda: hash_function_reference(lines), size)
+                if reference_digest != digest:
+                    raise RuntimeError(f"hash_function_reference and hash_function produced different digests for {size} bytes")
+                reference_column = f"{reference:>7.2f} MB/s"
+            print(f"{size:>11} {reference_column} {fast:>9.2f} MB/s {streamed:>7.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
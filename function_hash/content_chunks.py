@@ -0,0 +1,193 @@
+import hashlib
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Tuple
+
+from merkle import Backend, sha256_backend
+
+"""
+    Content-defined chunking: chunk boundaries are placed where a Gear rolling hash of the last 32
+    bytes matches a mask, so they depend on the content around them and not on their offsets. An
+    insertion only changes the chunks around it, and the chunks after it are found again in the other
+    version of the file, with the same digests.
+
+    Run the code with the command:
+    1 - python content_chunks.py initial_file.txt modified_file.txt
+"""
+
+min_size_default = 2 << 10
+average_bits_default = 13  # Boundaries every 2 ** 13 = 8 KiB on average, after min_size
+max_size_default = 64 << 10
+read_size_default = 1 << 20
+
+# Each byte is shifted out of the 32-bit rolling hash after 32 more bytes
+window_size = 32
+hash_mask = 0xFFFFFFFF
+# Fixed pseudo-random value for each byte, the same on every machine
+gear = [int.from_bytes(hashlib.sha256(bytes([byte])).digest()[:4], "big") for byte in range(256)]
+
+
+class Chunk(NamedTuple):
+    offset: int
+    length: int
+    digest: bytes
+
+
+def boundary_mask(average_bits: int) -> int:
+    # The high bits of the hash depend on the most bytes of the window
+    return ((1 << average_bits) - 1) << (32 - average_bits)
+
+
+def cut_point(data: bytes, start: int, end: int, min_size: int, max_size: int, mask: int) -> int:
+    """
+    Length of the chunk that starts at data[start], where data[start:end] is everything left of the
+    input or at least max_size bytes of it.
+    """
+    limit = min(end - start, max_size)
+    if limit <= min_size:
+        return limit
+    rolling_hash = 0
+    # Only the last window_size bytes before min_size can still influence the hash at min_size
+    for byte in data[start + max(min_size - window_size, 0):start + min_size]:
+        rolling_hash = ((rolling_hash << 1) + gear[byte]) & hash_mask
+    length = min_size
+    for byte in data[start + min_size:start + limit]:
+        rolling_hash = ((rolling_hash << 1) + gear[byte]) & hash_mask
+        length += 1
+        if not rolling_hash & mask:
+            return length
+    return limit
+
+
+def iter_chunks(
+    file: BinaryIO,
+    min_size: int = min_size_default,
+    average_bits: int = average_bits_default,
+    max_size: int = max_size_default,
+    read_size: int = read_size_default,
+) -> Iterator[bytes]:
+    """
+    Reads the file in blocks of read_size bytes and yields its chunks in order, keeping at most
+    read_size + max_size bytes in memory.
+    """
+    mask = boundary_mask(average_bits)
+    buffer = b""
+    position = 0
+    end_of_file = False
+    while True:
+        if not end_of_file and len(buffer) - position < max_size:
+            block = file.read(max(read_size, max_size))
+            end_of_file = not block
+            buffer = buffer[position:] + block
+            position = 0
+            continue
+        if position == len(buffer):
+            return
+        length = cut_point(buffer, position, len(buffer), min_size, max_size, mask)
+        yield buffer[position:position + length]
+        position += length
+
+
+class ChunkIndex:
+    """
+    The chunks of one file in order, plus the offsets of every chunk by digest for deduplication.
+    Chunks with equal digests are taken as equal content, so the backend must be collision resistant:
+    sha256 by default, since hash_function keeps only 5 bits of each byte.
+    """
+
+    def __init__(self, chunks: List[Chunk]):
+        self.chunks = chunks
+        self.offsets_by_digest: Dict[bytes, List[int]] = {}
+        for chunk in chunks:
+            self.offsets_by_digest.setdefault(chunk.digest, []).append(chunk.offset)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        backend: Backend = sha256_backend,
+        min_size: int = min_size_default,
+        average_bits: int = average_bits_default,
+        max_size: int = max_size_default,
+    ) -> "ChunkIndex":
+        chunks = []
+        offset = 0
+        with open(path, "rb") as file:
+            for data in iter_chunks(file, min_size, average_bits, max_size):
+                chunks.append(Chunk(offset, len(data), backend(data)))
+                offset += len(data)
+        return cls(chunks)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        backend: Backend = sha256_backend,
+        min_size: int = min_size_default,
+        average_bits: int = average_bits_default,
+        max_size: int = max_size_default,
+    ) -> "ChunkIndex":
+        mask = boundary_mask(average_bits)
+        chunks = []
+        offset = 0
+        while offset < len(data):
+            length = cut_point(data, offset, len(data), min_size, max_size, mask)
+            chunks.append(Chunk(offset, length, backend(data[offset:offset + length])))
+            offset += length
+        return cls(chunks)
+
+    @property
+    def size(self) -> int:
+        return sum(chunk.length for chunk in self.chunks)
+
+    def deduplication(self) -> Dict[str, int]:
+        """
+        Bytes that would be stored keeping each distinct chunk once.
+        """
+        length_by_digest = {chunk.digest: chunk.length for chunk in self.chunks}
+        return {
+            "chunks": len(self.chunks),
+            "unique_chunks": len(self.offsets_by_digest),
+            "bytes": self.size,
+            "unique_bytes": sum(length_by_digest.values()),
+        }
+
+
+def _merged(chunks: List[Chunk]) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    for chunk in chunks:
+        if ranges and ranges[-1][1] == chunk.offset:
+            ranges[-1] = (ranges[-1][0], chunk.offset + chunk.length)
+        else:
+            ranges.append((chunk.offset, chunk.offset + chunk.length))
+    return ranges
+
+
+def delta(old: ChunkIndex, new: ChunkIndex) -> Dict[str, object]:
+    """
+    What changed from old to new, in O(number of chunks) dictionary lookups: the byte ranges [start, end)
+    of new whose chunks do not appear anywhere in old ('inserted'), and of old whose chunks are gone
+    from new ('removed'). Chunks that only moved count as reused.
+    """
+    inserted = [chunk for chunk in new.chunks if chunk.digest not in old.offsets_by_digest]
+    removed = [chunk for chunk in old.chunks if chunk.digest not in new.offsets_by_digest]
+    inserted_bytes = sum(chunk.length for chunk in inserted)
+    return {
+        "inserted": _merged(inserted),
+        "removed": _merged(removed),
+        "inserted_bytes": inserted_bytes,
+        "removed_bytes": sum(chunk.length for chunk in removed),
+        "reused_bytes": new.size - inserted_bytes,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    first_path, second_path = sys.argv[1:3]
+    # Small chunks, so that the two sample files are split into more than one chunk
+    sizes = {"min_size": 16, "average_bits": 6, "max_size": 256}
+    report = delta(ChunkIndex.from_file(first_path, **sizes), ChunkIndex.from_file(second_path, **sizes))
+    for start, end in report["removed"]:
+        print(f"{first_path}: bytes [{start}, {end}) removed")
+    for start, end in report["inserted"]:
+        print(f"{second_path}: bytes [{start}, {end}) inserted")
+    print(f"{report['reused_bytes']} bytes reused, {report['inserted_bytes']} bytes inserted")
@@ -0,0 +1,92 @@
+import io
+import random
+
+import pytest
+
+from content_chunks import ChunkIndex, delta, iter_chunks
+from merkle import MerkleTree, sha256_backend
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest content_chunks_test.py
+"""
+
+sizes = {"min_size": 256, "average_bits": 10, "max_size": 4096}
+
+
+def random_bytes(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def test_chunks_cover_the_data_within_the_size_limits():
+    data = random_bytes(300_000)
+    index = ChunkIndex.from_bytes(data, sha256_backend, **sizes)
+
+    assert b"".join(data[chunk.offset:chunk.offset + chunk.length] for chunk in index.chunks) == data
+    assert all(sizes["min_size"] <= chunk.length <= sizes["max_size"] for chunk in index.chunks[:-1])
+    # Boundaries come from the content, not only from max_size
+    assert len(index.chunks) > len(data) // sizes["max_size"] * 2
+
+
+def test_streamed_chunks_match_in_memory_chunks():
+    data = random_bytes(100_000, 1)
+    chunks = list(iter_chunks(io.BytesIO(data), read_size=1_000, **sizes))
+
+    assert [len(chunk) for chunk in chunks] == [
+        chunk.length for chunk in ChunkIndex.from_bytes(data, sha256_backend, **sizes).chunks
+    ]
+    assert b"".join(chunks) == data
+
+
+def test_insertion_only_changes_nearby_chunks():
+    data = random_bytes(200_000, 2)
+    modified = data[:1_000] + b"one inserted line\n" + data[1_000:]
+
+    report = delta(
+        ChunkIndex.from_bytes(data, sha256_backend, **sizes), ChunkIndex.from_bytes(modified, sha256_backend, **sizes)
+    )
+
+    assert report["inserted_bytes"] <= 3 * sizes["max_size"]
+    assert report["reused_bytes"] >= len(modified) - 3 * sizes["max_size"]
+    start, end = report["inserted"][0]
+    assert start <= 1_000 < end
+    # With fixed-size chunks everything after the insertion looks changed
+    fixed = MerkleTree.from_bytes(data, 4096, sha256_backend).compare(MerkleTree.from_bytes(modified, 4096, sha256_backend))
+    assert fixed[-1][1] - fixed[0][0] > len(data) - 4096
+
+
+def test_identical_and_duplicated_content():
+    block = random_bytes(50_000, 3)
+    index = ChunkIndex.from_bytes(block + block, sha256_backend, **sizes)
+
+    report = delta(index, index)
+    assert report["inserted"] == report["removed"] == []
+    assert report["reused_bytes"] == len(block) * 2
+    deduplication = index.deduplication()
+    assert deduplication["bytes"] == len(block) * 2
+    assert deduplication["unique_bytes"] < len(block) + 2 * sizes["max_size"]
+
+
+def test_default_backend_sees_case_only_edits():
+    data = b"debug=false\n" * 200
+    modified = data[:1_200] + b"DEBUG=FALSE\n" + data[1_212:]
+
+    report = delta(ChunkIndex.from_bytes(data, **sizes), ChunkIndex.from_bytes(modified, **sizes))
+
+    assert report["inserted_bytes"] > 0
+    start, end = report["inserted"][0]
+    assert start <= 1_200 < end
+    assert ChunkIndex.from_bytes(data + modified, **sizes).deduplication()["unique_bytes"] > len(data)
+
+
+def test_file_index_matches_bytes_index(tmp_path):
+    data = random_bytes(150_000, 4)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    assert ChunkIndex.from_file(str(path), **sizes).chunks == ChunkIndex.from_bytes(data, **sizes).chunks
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,173 @@
+import argparse
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from main import chunk_size_default
+
+"""
+    Integrity scanner: walks a directory, hashes its files with a hashlib algorithm and compares the
+    digests with the manifest written by the previous scan. Files whose (inode, size, mtime) did not
+    change since then keep their cached digest; the others are hashed in a process pool.
+
+    Run the code with the command:
+    1 - python directory_scan.py <directory> [--manifest manifest.json] [--algorithm sha256] [--workers 4]
+"""
+
+manifest_name_default = ".function_hash_manifest.json"
+manifest_version = 2
+# hash_function keeps only 5 bits of each character, so it cannot tell "debug" from "DEBUG"
+algorithm_default = "sha256"
+# Below this many files to hash they are hashed in the current process
+parallel_files_minimum = 8
+
+Hasher = Callable[[str], bytes]
+
+
+def hash_file_with(algorithm: str, file_path: str, chunk_size: int = chunk_size_default) -> bytes:
+    digest = hashlib.new(algorithm)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def load_manifest(manifest_path: str, algorithm: str = algorithm_default) -> Dict[str, object]:
+    """
+    Previous manifest, or an empty one if the file is missing or has another version.
+
+    Raises:
+        ValueError: If the manifest digests were computed with another algorithm.
+    """
+    empty = {"version": manifest_version, "algorithm": algorithm, "scanned_at_ns": 0, "files": {}}
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return empty
+    if manifest.get("version") != manifest_version:
+        return empty
+    if manifest["algorithm"] != algorithm:
+        raise ValueError(
+            f"{manifest_path} has {manifest['algorithm']} digests, not {algorithm}: scan with the same algorithm or remove it"
+        )
+    return manifest
+
+
+def write_manifest(manifest_path: str, manifest: Dict[str, object]) -> None:
+    # Written next to the final path and renamed, so an interrupted scan never leaves half a manifest
+    temporary_path = f"{manifest_path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(temporary_path, manifest_path)
+
+
+def list_files(directory: str, excluded: List[str]) -> Dict[str, os.stat_result]:
+    """
+    Regular files below directory by path relative to it ('/'-separated). Symbolic links are not followed.
+    """
+    excluded_paths = {os.path.abspath(path) for path in excluded}
+    files: Dict[str, os.stat_result] = {}
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and os.path.abspath(entry.path) not in excluded_paths:
+                    relative_path = os.path.relpath(entry.path, directory).replace(os.sep, "/")
+                    files[relative_path] = entry.stat(follow_symlinks=False)
+    return files
+
+
+def _hash_all(paths: List[str], hasher: Hasher, workers: Optional[int]) -> List[bytes]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < parallel_files_minimum:
+        return [hasher(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Several files per task, so small files do not pay one round trip each
+        return list(executor.map(hasher, paths, chunksize=max(len(paths) // (workers * 4), 1)))
+
+
+def scan_directory(
+    directory: str,
+    manifest_path: Optional[str] = None,
+    algorithm: str = algorithm_default,
+    workers: Optional[int] = None,
+) -> Dict[str, object]:
+    """
+    Scans the directory, writes the new manifest and reports what changed since the previous one.
+    Files are hashed in chunks with hashlib.new(algorithm), which is recorded in the manifest.
+
+    Returns:
+        dict: 'added', 'removed' and 'modified' (sorted relative paths), plus how many files were
+        'hashed' and how many digests were reused from the manifest ('cached').
+    """
+    manifest_path = manifest_path or os.path.join(directory, manifest_name_default)
+    previous = load_manifest(manifest_path, algorithm)
+    previous_files: Dict[str, Dict[str, object]] = previous["files"]
+    scanned_at_ns = time.time_ns()
+    files = list_files(directory, [manifest_path, f"{manifest_path}.tmp"])
+
+    entries: Dict[str, Dict[str, object]] = {}
+    to_hash: List[str] = []
+    for relative_path, stat in files.items():
+        entry = {"inode": stat.st_ino, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        cached = previous_files.get(relative_path)
+        # A file written during the previous scan can change again without changing its mtime
+        if (
+            cached is not None
+            and all(cached[key] == value for key, value in entry.items())
+            and stat.st_mtime_ns < previous["scanned_at_ns"]
+        ):
+            entry["digest"] = cached["digest"]
+        else:
+            to_hash.append(relative_path)
+        entries[relative_path] = entry
+
+    hasher = functools.partial(hash_file_with, algorithm)
+    digests = _hash_all([os.path.join(directory, path) for path in to_hash], hasher, workers)
+    for relative_path, digest in zip(to_hash, digests):
+        entries[relative_path]["digest"] = digest.hex()
+
+    write_manifest(
+        manifest_path,
+        {"version": manifest_version, "algorithm": algorithm, "scanned_at_ns": scanned_at_ns, "files": entries},
+    )
+    return {
+        "added": sorted(path for path in entries if path not in previous_files),
+        "removed": sorted(path for path in previous_files if path not in entries),
+        "modified": sorted(
+            path
+            for path, entry in entries.items()
+            if path in previous_files and previous_files[path]["digest"] != entry["digest"]
+        ),
+        "hashed": len(to_hash),
+        "cached": len(entries) - len(to_hash),
+    }
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reports files added, removed or modified since the last scan")
+    parser.add_argument("directory")
+    parser.add_argument("--manifest", help=f"manifest path (default: <directory>/{manifest_name_default})")
+    parser.add_argument("--algorithm", default=algorithm_default, choices=sorted(hashlib.algorithms_guaranteed))
+    parser.add_argument("--workers", type=int, help="hashing processes (default: number of CPUs)")
+    options = parser.parse_args(arguments)
+
+    report = scan_directory(options.directory, options.manifest, options.algorithm, options.workers)
+    for change in ("added", "removed", "modified"):
+        for path in report[change]:
+            print(f"{change:>8}: {path}")
+    print(f"{report['hashed']} files hashed, {report['cached']} digests reused from the manifest")
+    # Non-zero exit status when anything changed, so a deploy script can stop
+    return 1 if report["added"] or report["removed"] or report["modified"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
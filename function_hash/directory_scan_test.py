@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from directory_scan import load_manifest, main, scan_directory
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest directory_scan_test.py
+"""
+
+
+def make_tree(directory, count: int = 3) -> None:
+    (directory / "configs").mkdir()
+    for index in range(count):
+        (directory / "configs" / f"file_{index}.txt").write_text(f"content {index}\n", encoding="utf-8")
+    (directory / "data.txt").write_text("data\n", encoding="utf-8")
+    (directory / "configs" / "binary.bin").write_bytes(bytes(range(256)))
+
+
+def test_first_scan_adds_every_file(tmp_path):
+    make_tree(tmp_path)
+
+    report = scan_directory(str(tmp_path), workers=1)
+
+    assert report["added"] == ["configs/binary.bin", "configs/file_0.txt", "configs/file_1.txt", "configs/file_2.txt", "data.txt"]
+    assert report["removed"] == report["modified"] == []
+    assert report["hashed"] == 5
+    assert len(load_manifest(str(tmp_path / ".function_hash_manifest.json"))["files"]) == 5
+
+
+def test_unchanged_files_are_not_hashed_again(tmp_path):
+    make_tree(tmp_path)
+    scan_directory(str(tmp_path), workers=1)
+
+    report = scan_directory(str(tmp_path), workers=1)
+
+    assert report == {"added": [], "removed": [], "modified": [], "hashed": 0, "cached": 5}
+
+
+def test_reports_added_removed_and_modified_files(tmp_path):
+    make_tree(tmp_path)
+    scan_directory(str(tmp_path), workers=1)
+    (tmp_path / "configs" / "file_0.txt").write_text("changed content\n", encoding="utf-8")
+    (tmp_path / "configs" / "file_1.txt").unlink()
+    (tmp_path / "new.txt").write_text("new\n", encoding="utf-8")
+    # Same content with a new mtime: hashed again, but not modified
+    stat = os.stat(tmp_path / "data.txt")
+    os.utime(tmp_path / "data.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    report = scan_directory(str(tmp_path), workers=1)
+
+    assert report["added"] == ["new.txt"]
+    assert report["removed"] == ["configs/file_1.txt"]
+    assert report["modified"] == ["configs/file_0.txt"]
+    assert report["hashed"] == 3
+    assert report["cached"] == 2
+
+
+def test_case_only_edit_of_the_same_size_is_modified(tmp_path):
+    config = tmp_path / "app.cfg"
+    config.write_text("debug=false\n", encoding="utf-8")
+    stat = os.stat(config)
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    scan_directory(str(tmp_path), workers=1)
+
+    config.write_text("DEBUG=FALSE\n", encoding="utf-8")
+
+    assert scan_directory(str(tmp_path), workers=1)["modified"] == ["app.cfg"]
+    config.write_text("debug=false\n", encoding="utf-8")
+    assert main([str(tmp_path), "--workers", "1"]) == 1
+
+
+def test_manifest_of_another_algorithm_is_rejected(tmp_path):
+    make_tree(tmp_path)
+    scan_directory(str(tmp_path), workers=1)
+
+    with pytest.raises(ValueError):
+        scan_directory(str(tmp_path), algorithm="blake2b", workers=1)
+    assert load_manifest(str(tmp_path / ".function_hash_manifest.json"))["algorithm"] == "sha256"
+
+
+def test_parallel_scan_matches_serial_scan(tmp_path):
+    make_tree(tmp_path, count=20)
+    serial_manifest = str(tmp_path.parent / f"{tmp_path.name}_serial.json")
+    parallel_manifest = str(tmp_path.parent / f"{tmp_path.name}_parallel.json")
+
+    scan_directory(str(tmp_path), serial_manifest, workers=1)
+    scan_directory(str(tmp_path), parallel_manifest, workers=2)
+
+    assert load_manifest(serial_manifest)["files"] == load_manifest(parallel_manifest)["files"]
+
+
+def test_main_exit_status(tmp_path, capsys):
+    make_tree(tmp_path)
+
+    assert main([str(tmp_path), "--workers", "1"]) == 1
+    assert main([str(tmp_path), "--workers", "1"]) == 0
+    assert "0 files hashed, 5 digests reused" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main()
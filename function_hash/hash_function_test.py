@@ -1,6 +1,16 @@
+import random
+
 import pytest
 
-from main import hash_function
+from main import (
+    StreamingHasher,
+    file_to_lines,
+    hash_file,
+    hash_function,
+    hash_function_reference,
+    validate_file,
+    validate_path,
+)
 
 """
     Run the tests with the command:
@@ -23,5 +33,64 @@ def test_hash_function_when_not_iguals_inputs():
     assert hash_function(input_first) != hash_function(input_second)
 
 
+def test_streaming_hasher_matches_hash_function_for_any_chunking():
+    text = "linha ção\r\nsegunda 日本語\rterceira\n\r\n€ fim"
+    data = text.encode("utf-8")
+    expected = hash_function(text.replace("\r\n", "\n").replace("\r", "\n").splitlines(keepends=True))
+    generator = random.Random(0)
+
+    for _ in range(50):
+        hasher = StreamingHasher()
+        position = 0
+        while position < len(data):
+            size = generator.randint(1, 5)
+            hasher.update(data[position:position + size])
+            position += size
+        assert hasher.digest() == expected
+
+
+def test_streaming_hasher_digest_does_not_consume_pending_data():
+    hasher = StreamingHasher(b"a\r")
+    assert hasher.digest() == hash_function(["a\n"])
+    hasher.update(b"\nb")
+    assert hasher.digest() == hash_function(["a\n", "b"])
+
+
+def test_hash_file_matches_file_to_lines(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes("primeira\r\nsegunda ção\n".encode("utf-8") * 1000)
+
+    expected = hash_function(file_to_lines(str(path)))
+    assert hash_file(str(path), chunk_size=7) == expected
+    assert validate_path(str(path), expected) == (True, expected)
+    assert validate_file(["outro"], expected)[0] is False
+    assert validate_file(["hello"], expected) == validate_file("hello", expected)
+
+
+def random_lines(generator: random.Random, alphabet: str) -> list[str]:
+    return [
+        "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 80)))
+        for _ in range(generator.randint(0, 30))
+    ]
+
+
+def test_hash_function_matches_reference_on_random_inputs():
+    generator = random.Random(22)
+    ascii_alphabet = "".join(map(chr, range(128)))
+    unicode_alphabet = ascii_alphabet + "çãéü€日本語\U0001F600\u2028\ud800"
+
+    for alphabet in (ascii_alphabet, unicode_alphabet):
+        for _ in range(100):
+            lines = random_lines(generator, alphabet)
+            assert hash_function(lines) == hash_function_reference(lines)
+
+
+def test_hash_function_matches_reference_across_blocks():
+    lines = ["x" * 40_000, "", "ção\n", "y" * 70_000, "z"]
+
+    assert hash_function(lines) == hash_function_reference(lines)
+    assert hash_function([]) == hash_function_reference([])
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,7 +1,13 @@
+import codecs
+import io
 from typing import List, Tuple
 
 path_first_file_default = "./initial_file.txt"
 path_second_file_default = "./modified_file.txt"
+# Bytes read from disk at a time by hash_file: memory stays constant whatever the file size
+chunk_size_default = 1 << 20
+# Granularity of the byte ranges main reports when the files differ
+differing_chunk_size = 1 << 12
 
 """
     Run the code with the command:
@@ -9,7 +15,10 @@ path_second_file_default = "./modified_file.txt"
 """
 
 
-def hash_function(data: list[str]) -> bytes:
+def hash_function_reference(data: list[str]) -> bytes:
+    """
+    Original character-by-character implementation, kept as the reference for hash_function.
+    """
     hash_state = 0x811C9DC5  # Estado inicial do hash
     prime_number = 104729  # Número primo para multiplicação
 
@@ -33,6 +42,98 @@ def hash_function(data: list[str]) -> bytes:
     return hash_state.to_bytes(32, byteorder="big")
 
 
+class _HashedValues(dict):
+    """
+    Table code point -> (ord(char) * 104729) % 32, filled on first use, in the format str.translate expects.
+    """
+
+    def __missing__(self, code_point: int) -> int:
+        hashed_value = self[code_point] = (code_point * 104729) % 32
+        return hashed_value
+
+
+hashed_values = _HashedValues()
+# h + (h << 1) + (h << 4) + (h << 7) + (h << 8) + (h << 24) is h * (1 + 2 + 16 + 128 + 256 + 2**24)
+shift_multiplier = 16777619
+hash_mask = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+# Lines are joined into blocks of about this many characters before being hashed
+block_size = 1 << 16
+
+
+def update_hash_state(hash_state: int, text: str) -> int:
+    """
+    Same steps as hash_function_reference for every character of text. The whole block is mapped to
+    its hashed values by str.translate first, so the loop only handles small integers.
+    """
+    for hashed_value in text.translate(hashed_values).encode("ascii"):
+        hash_state = ((hash_state ^ hashed_value) * shift_multiplier) & hash_mask
+
+    return hash_state
+
+
+def hash_function(data: list[str]) -> bytes:
+    hash_state = 0x811C9DC5  # Estado inicial do hash
+    block: list[str] = []
+    block_length = 0
+
+    for line in data:
+        block.append(line)
+        block_length += len(line)
+        if block_length >= block_size:
+            hash_state = update_hash_state(hash_state, "".join(block))
+            block.clear()
+            block_length = 0
+
+    hash_state = update_hash_state(hash_state, "".join(block))
+    return hash_state.to_bytes(32, byteorder="big")
+
+
+class StreamingHasher:
+    """
+    Incremental version of hash_function: feeding the UTF-8 bytes of a file to update, in chunks of
+    any size, gives the same digest as hash_function(file_to_lines(path)).
+    Bytes are decoded the way open(path, "r", encoding="utf-8") does, so characters split between
+    chunks are joined and newlines ("\r\n", "\r") are translated to "\n" before hashing.
+    """
+
+    def __init__(self, data: bytes = b""):
+        self._hash_state = 0x811C9DC5
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(), translate=True
+        )
+        if data:
+            self.update(data)
+
+    def update(self, data: bytes) -> None:
+        self._hash_state = update_hash_state(self._hash_state, self._decoder.decode(data))
+
+    def digest(self) -> bytes:
+        """
+        Digest of everything passed to update so far; more data can still be added afterwards.
+
+        Raises:
+            UnicodeDecodeError: If the data ends in the middle of a UTF-8 character.
+        """
+        # Flushes a pending "\r" or partial character without consuming it from the decoder
+        state = self._decoder.getstate()
+        pending = self._decoder.decode(b"", final=True)
+        self._decoder.setstate(state)
+        return update_hash_state(self._hash_state, pending).to_bytes(32, byteorder="big")
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+
+def hash_file(file_path: str, chunk_size: int = chunk_size_default) -> bytes:
+    hasher = StreamingHasher()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb") as file:
+        while size := file.readinto(buffer):
+            hasher.update(view[:size])
+    return hasher.digest()
+
+
 def file_to_lines(file_path: str) -> list[str]:
     with open(file_path, "r", encoding="utf-8") as file:
         return file.readlines()
@@ -43,24 +144,32 @@ def validate_file(data: List[str], expected_digest: bytes) -> Tuple[bool, bytes]
     return (new_digest == expected_digest), new_digest
 
 
+def validate_path(file_path: str, expected_digest: bytes) -> Tuple[bool, bytes]:
+    new_digest = hash_file(file_path)
+    return (new_digest == expected_digest), new_digest
+
+
 def main(
     path_first_file: str = path_first_file_default,
     path_second_file: str = path_second_file_default,
 ) -> None:
 
-    list_first_content = file_to_lines(path_first_file)
-    initial_digest = hash_function(list_first_content)
+    initial_digest = hash_file(path_first_file)
 
     print(f"Hash result of file {path_first_file} is: {initial_digest.hex()}\n")
 
     # verify if the modified file is valid
-    list_second_content = file_to_lines(path_second_file)
-    has_valid, second_digest = validate_file(list_second_content, initial_digest)
+    has_valid, second_digest = validate_path(path_second_file, initial_digest)
 
     if not has_valid:
         print(
             f"File {path_second_file} is not valid - hash is different: {second_digest.hex()} x {initial_digest.hex()}"
         )
+        # Imported here because merkle itself imports hash_function from this module
+        from merkle import differing_ranges
+
+        for start, end in differing_ranges(path_first_file, path_second_file, chunk_size=differing_chunk_size):
+            print(f"  bytes [{start}, {end}) differ")
         return None
 
     print(
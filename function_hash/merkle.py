@@ -0,0 +1,181 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from main import hash_function
+
+"""
+    Chunked Merkle digests: the file is split into fixed-size chunks, each chunk is hashed by a backend
+    and pairs of digests are hashed again up to a single root. Two trees are compared top-down, so only
+    the branches above the k differing chunks are visited: O(k log n) digest comparisons.
+
+    Run the code with the command:
+    1 - python merkle.py initial_file.txt modified_file.txt
+"""
+
+Backend = Callable[[bytes], bytes]
+
+chunk_size_default = 1 << 16
+# Below this many chunks the file is hashed in the current process
+parallel_chunks_minimum = 64
+# Chunks are sent to the workers in batches, a few batches per worker
+batches_per_worker = 4
+
+# Leaves and inner nodes are hashed with different prefixes, so a chunk can never pass for a node
+leaf_prefix = b"\x00"
+node_prefix = b"\x01"
+
+
+def hash_function_backend(data: bytes) -> bytes:
+    # Every byte becomes the character with the same code, so chunks may split UTF-8 characters
+    return hash_function([data.decode("latin-1")])
+
+
+def sha256_backend(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+backends = {"hash_function": hash_function_backend, "sha256": sha256_backend}
+
+
+def _hash_chunks(path: str, start: int, count: int, chunk_size: int, backend: Backend) -> List[bytes]:
+    digests = []
+    with open(path, "rb") as file:
+        file.seek(start * chunk_size)
+        for _ in range(count):
+            digests.append(backend(leaf_prefix + file.read(chunk_size)))
+    return digests
+
+
+class MerkleTree:
+    """
+    levels[0] holds the chunk digests and levels[-1] the root. A node without a sibling is promoted
+    to the next level unchanged. Equal digests are taken as equal chunks, so the default backend is
+    sha256: hash_function_backend keeps only 5 bits of each byte and cannot tell "A" from "a".
+    """
+
+    def __init__(self, leaves: List[bytes], size: int, chunk_size: int, backend: Backend = sha256_backend):
+        self.size = size
+        self.chunk_size = chunk_size
+        self.levels = [leaves]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [backend(node_prefix + level[index] + level[index + 1]) for index in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, chunk_size: int = chunk_size_default, backend: Backend = sha256_backend
+    ) -> "MerkleTree":
+        leaves = [backend(leaf_prefix + data[start:start + chunk_size]) for start in range(0, len(data), chunk_size)]
+        return cls(leaves or [backend(leaf_prefix)], len(data), chunk_size, backend)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        chunk_size: int = chunk_size_default,
+        backend: Backend = sha256_backend,
+        workers: Optional[int] = None,
+    ) -> "MerkleTree":
+        """
+        Hashes the chunks of the file in 'workers' processes (os.cpu_count() by default). Every worker
+        reads its own chunks from disk, so only digests travel between processes. The backend must be
+        a module-level function so that it can be sent to the workers.
+        """
+        size = os.path.getsize(path)
+        chunk_count = max(-(-size // chunk_size), 1)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or chunk_count < parallel_chunks_minimum:
+            return cls(_hash_chunks(path, 0, chunk_count, chunk_size, backend), size, chunk_size, backend)
+
+        batch = -(-chunk_count // (workers * batches_per_worker))
+        starts = range(0, chunk_count, batch)
+        leaves: List[bytes] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_hash_chunks, path, start, min(batch, chunk_count - start), chunk_size, backend)
+                for start in starts
+            ]
+            for future in futures:
+                leaves.extend(future.result())
+        return cls(leaves, size, chunk_size, backend)
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    def _covers(self, level: int, index: int) -> int:
+        # Number of chunks below node (level, index)
+        first = index << level
+        return max(min((index + 1) << level, len(self.levels[0])) - first, 0)
+
+    def compare(self, other: "MerkleTree") -> List[Tuple[int, int]]:
+        """
+        Byte ranges [start, end) where the two files differ, in increasing order and with adjacent
+        chunks merged. A range past the end of the shorter file ends at the size of the longer one.
+
+        Raises:
+            ValueError: If the trees were built with different chunk sizes.
+        """
+        if self.chunk_size != other.chunk_size:
+            raise ValueError(f"Chunk sizes differ: {self.chunk_size} x {other.chunk_size}")
+        if self.size == other.size and self.root == other.root:
+            return []
+
+        differing_chunks: List[int] = []
+        top = max(len(self.levels), len(other.levels)) - 1
+        stack = [(top, 0)]
+        while stack:
+            level, index = stack.pop()
+            covered = self._covers(level, index)
+            other_covered = other._covers(level, index)
+            if covered == 0 and other_covered == 0:
+                continue
+            # Digests are only trusted when both nodes stand for the same chunks
+            if (
+                covered == other_covered
+                and level < len(self.levels)
+                and level < len(other.levels)
+                and self.levels[level][index] == other.levels[level][index]
+            ):
+                continue
+            if level == 0:
+                differing_chunks.append(index)
+                continue
+            stack.append((level - 1, 2 * index + 1))
+            stack.append((level - 1, 2 * index))
+
+        end_of_data = max(self.size, other.size)
+        ranges: List[Tuple[int, int]] = []
+        for chunk in differing_chunks:
+            start = chunk * self.chunk_size
+            end = min(start + self.chunk_size, end_of_data)
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
+
+def differing_ranges(
+    path_first_file: str,
+    path_second_file: str,
+    chunk_size: int = chunk_size_default,
+    backend: Backend = sha256_backend,
+    workers: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    first = MerkleTree.from_file(path_first_file, chunk_size, backend, workers)
+    second = MerkleTree.from_file(path_second_file, chunk_size, backend, workers)
+    return first.compare(second)
+
+
+if __name__ == "__main__":
+    import sys
+
+    first_path, second_path = sys.argv[1:3]
+    for start, end in differing_ranges(first_path, second_path, chunk_size=64):
+        print(f"bytes [{start}, {end}) differ")
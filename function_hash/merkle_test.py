@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from merkle import MerkleTree, differing_ranges, hash_function_backend
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest merkle_test.py
+"""
+
+
+def random_bytes(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def test_identical_data_has_no_differences():
+    data = random_bytes(10_000)
+
+    first = MerkleTree.from_bytes(data, chunk_size=100)
+    second = MerkleTree.from_bytes(data, chunk_size=100)
+
+    assert first.root == second.root
+    assert first.compare(second) == []
+
+
+def test_compare_reports_the_changed_chunks():
+    data = random_bytes(10_000)
+    modified = bytearray(data)
+    for position in (5, 150, 160, 9_999):
+        modified[position] ^= 0xFF
+
+    ranges = MerkleTree.from_bytes(data, chunk_size=100).compare(MerkleTree.from_bytes(bytes(modified), chunk_size=100))
+
+    assert ranges == [(0, 200), (9_900, 10_000)]
+
+
+def test_compare_matches_brute_force_for_different_sizes():
+    generator = random.Random(1)
+    for _ in range(50):
+        data = random_bytes(generator.randint(0, 3_000), generator.randint(0, 10))
+        modified = bytearray(data[: generator.randint(0, len(data))] + random_bytes(generator.randint(0, 500), 99))
+        for _ in range(generator.randint(0, 5)):
+            if modified:
+                modified[generator.randrange(len(modified))] ^= 1
+        modified = bytes(modified)
+
+        expected = []
+        for start in range(0, max(len(data), len(modified)), 64):
+            if data[start:start + 64] != modified[start:start + 64]:
+                end = min(start + 64, max(len(data), len(modified)))
+                if expected and expected[-1][1] == start:
+                    expected[-1] = (expected[-1][0], end)
+                else:
+                    expected.append((start, end))
+
+        first = MerkleTree.from_bytes(data, chunk_size=64)
+        second = MerkleTree.from_bytes(modified, chunk_size=64)
+        assert first.compare(second) == expected
+        assert second.compare(first) == expected
+
+
+def test_parallel_file_tree_matches_in_memory_tree(tmp_path):
+    data = random_bytes(200_000)
+    modified = data[:123_456] + b"x" + data[123_457:]
+    first_path = tmp_path / "first.bin"
+    second_path = tmp_path / "second.bin"
+    first_path.write_bytes(data)
+    second_path.write_bytes(modified)
+
+    parallel = MerkleTree.from_file(str(first_path), chunk_size=1_000, workers=2)
+
+    assert parallel.levels == MerkleTree.from_bytes(data, chunk_size=1_000).levels
+    assert differing_ranges(str(first_path), str(second_path), chunk_size=1_000, workers=2) == [(123_000, 124_000)]
+
+
+def test_compare_rejects_different_chunk_sizes():
+    with pytest.raises(ValueError):
+        MerkleTree.from_bytes(b"abc", chunk_size=1).compare(MerkleTree.from_bytes(b"abc", chunk_size=2))
+
+
+def test_default_backend_reports_case_only_edits():
+    data = b"debug = False\n" * 100
+    modified = data.replace(b"False", b"FALSE", 1)
+
+    assert MerkleTree.from_bytes(data, chunk_size=64).compare(MerkleTree.from_bytes(modified, chunk_size=64)) == [(0, 64)]
+    # hash_function keeps 5 bits of each byte, so the opt-in backend misses the same edit
+    first = MerkleTree.from_bytes(data, chunk_size=64, backend=hash_function_backend)
+    second = MerkleTree.from_bytes(modified, chunk_size=64, backend=hash_function_backend)
+    assert first.compare(second) == []
+
+
+if __name__ == "__main__":
+    pytest.main()
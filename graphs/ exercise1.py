@@ -1,34 +1,11 @@
-class Node:
+from tree_node import NodeMethods
+
+
+class Node(NodeMethods):
     def __init__(self, value: str):
         self.value: str = value
         self.right: Node | None = None
         self.left: Node | None = None
-    
-    def in_order(self) -> list[str]:
-        result = []
-        if self.left:
-            result = self.left.in_order()
-        result = result + [self.value]
-        if self.right:
-            result = result + self.right.in_order()
-        return result
-
-    def pre_order(self) -> list[str]:
-        result = [self.value]
-        if self.left:
-            result = result + self.left.pre_order()
-        if self.right:
-            result = result + self.right.pre_order()
-        return result
-
-    def post_order(self) -> list[str]:
-        result = []
-        if self.left:
-            result = self.left.post_order()
-        if self.right:
-            result = result + self.right.post_order()
-        result = result + [self.value]
-        return result
 
 def factory_node() -> Node:
     root = Node(value="1")
@@ -58,3 +35,4 @@ if __name__ == "__main__":
     print("In-order:", root.in_order())
     print("Pre-order:", root.pre_order())
     print("Post-order:", root.post_order())
+    print("Level-order:", root.level_order())
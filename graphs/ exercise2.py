@@ -1,15 +1,15 @@
-class Node:
+from collections import defaultdict
+from hashlib import blake2b
+from typing import Iterable
+
+from tree_node import NodeMethods
+
+
+class Node(NodeMethods):
     def __init__(self, value: str):
         self.value: str = value
         self.right: Node | None = None
         self.left: Node | None = None
-    
-    def print_tree(self, prefix: str = '', is_left: bool = True):
-        if self.right:
-            self.right.print_tree(prefix + ('│   ' if is_left else '    '), False)
-        print(prefix + ('└── ' if is_left else '┌── ') + str(self.value))
-        if self.left:
-            self.left.print_tree(prefix + ('    ' if is_left else '│   '), True)
 
 def factory_node(tree_identify: int = 1) -> Node:
 
@@ -64,22 +64,96 @@ def factory_node(tree_identify: int = 1) -> Node:
 
     return root
 
-def compare_trees(tree_1: Node | None, tree_2: Node | None) -> dict[str, str]:
-    if tree_1 is None and tree_2 is None:
-        return {'Output': 'True', 'Explanation': 'Ambas as árvores são iguais'}
-    if tree_1 is None or tree_2 is None:
-        return {'Output': 'False', 'Explanation': 'As árvores têm estruturas diferentes'}
-    if tree_1.value != tree_2.value:
-        return {'Output': 'False', 'Explanation': 'As árvores têm a mesma estrutura, porém, com valores de nós diferentes'}
-
-    for child_a, child_b in [(tree_1.left, tree_2.left), (tree_1.right, tree_2.right)]:
-        result = compare_trees(child_a, child_b)
-        if result['Output'] == 'False':
-            return result
-   
+EMPTY_TREE_HASH = blake2b(b'', digest_size=16).digest()
+
+
+def subtree_hashes(root: Node | None, cache: dict[Node, bytes] | None = None) -> dict[Node, bytes]:
+    """
+    Structural (Merkle) hash of every subtree: hash(value, hash(left), hash(right)). Computed once in
+    iterative post-order; nodes already in the cache are not visited again, so one cache can be shared
+    by many trees. The cache is only valid while the trees are not modified.
+    Values are hashed as their type plus repr(value), so 1 and "1" get different hashes.
+    """
+    if cache is None:
+        cache = {}
+    stack = [(root, False)] if root is not None and root not in cache else []
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            value_type = type(node.value)
+            value = f"{value_type.__module__}.{value_type.__qualname__}:{node.value!r}".encode()
+            digest = blake2b(len(value).to_bytes(8, 'little') + value, digest_size=16)
+            for child in (node.left, node.right):
+                digest.update(EMPTY_TREE_HASH if child is None else cache[child])
+            cache[node] = digest.digest()
+            continue
+        stack.append((node, True))
+        for child in (node.right, node.left):
+            if child is not None and child not in cache:
+                stack.append((child, False))
+    return cache
+
+
+def _hash(node: Node | None, hashes: dict[Node, bytes]) -> bytes:
+    return EMPTY_TREE_HASH if node is None else hashes[node]
+
+
+def first_difference(tree_1: Node | None, tree_2: Node | None, hashes: dict[Node, bytes]) -> tuple[Node | None, Node | None] | None:
+    """
+    First pair of differing subtrees in pre-order, or None if the trees are equal. Equal hashes end the
+    search at once and each step goes down one level, so the cost is O(depth).
+    """
+    if _hash(tree_1, hashes) == _hash(tree_2, hashes):
+        return None
+    while tree_1 is not None and tree_2 is not None and tree_1.value == tree_2.value:
+        if _hash(tree_1.left, hashes) != _hash(tree_2.left, hashes):
+            tree_1, tree_2 = tree_1.left, tree_2.left
+        else:
+            tree_1, tree_2 = tree_1.right, tree_2.right
+    return tree_1, tree_2
+
+
+def compare_trees(tree_1: Node | None, tree_2: Node | None, hashes: dict[Node, bytes] | None = None) -> dict[str, str]:
+    """
+    With a hashes dict (see subtree_hashes), subtrees with equal hashes are skipped without being
+    visited; the subtrees that are visited are still compared with value != value.
+    """
+    if hashes is not None:
+        subtree_hashes(tree_1, hashes)
+        subtree_hashes(tree_2, hashes)
+        difference = first_difference(tree_1, tree_2, hashes)
+        pairs = [] if difference is None else [difference]
+    else:
+        pairs = [(tree_1, tree_2)]
+
+    # Pre-order walk with an explicit stack: the left pair is checked before the right one
+    while pairs:
+        node_a, node_b = pairs.pop()
+        if node_a is None and node_b is None:
+            continue
+        if node_a is None or node_b is None:
+            return {'Output': 'False', 'Explanation': 'As árvores têm estruturas diferentes'}
+        if node_a.value != node_b.value:
+            return {'Output': 'False', 'Explanation': 'As árvores têm a mesma estrutura, porém, com valores de nós diferentes'}
+        pairs.append((node_a.right, node_b.right))
+        pairs.append((node_a.left, node_b.left))
+
     return {'Output': 'True', 'Explanation': 'Ambas as árvores são iguais'}
 
 
+def group_identical_trees(trees: Iterable[Node | None], hashes: dict[Node, bytes] | None = None) -> list[list[int]]:
+    """
+    Groups the positions of identical trees by root hash, in order of first appearance.
+    """
+    if hashes is None:
+        hashes = {}
+    groups: dict[bytes, list[int]] = defaultdict(list)
+    for position, tree in enumerate(trees):
+        subtree_hashes(tree, hashes)
+        groups[_hash(tree, hashes)].append(position)
+    return list(groups.values())
+
+
 def menu(root_identify_1: int = 1, root_identify_2: int = 1) -> None:
     print('#' * 25, f'Compare Trees {root_identify_1} and {root_identify_2}', '#' * 25)
     root_1 = factory_node(tree_identify=root_identify_1)
@@ -89,6 +163,7 @@ def menu(root_identify_1: int = 1, root_identify_2: int = 1) -> None:
     print('\n')
     root_2.print_tree()
     print(compare_trees(root_1, root_2))
+    print(compare_trees(root_1, root_2, hashes={}))
 
 if __name__ == "__main__":
     menu(root_identify_1=1, root_identify_2=1)
@@ -96,4 +171,6 @@ if __name__ == "__main__":
     menu(root_identify_1=1, root_identify_2=1)
     print('\n')
     menu(root_identify_1=1, root_identify_2=3)
+    print('\n')
+    print(group_identical_trees(factory_node(tree_identify=identify) for identify in (1, 2, 1, 3, 2)))
     
\ No newline at end of file
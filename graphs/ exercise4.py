@@ -1,17 +1,15 @@
-class Node:
+import sys
+from typing import Iterator, TextIO
+
+from tree_node import NodeMethods
+
+
+class Node(NodeMethods):
     def __init__(self, value: str):
         self.value: str = value
         self.right: Node | None = None
         self.left: Node | None = None
 
-    
-    def print_tree(self, prefix: str = '', is_left: bool = True):
-        if self.right:
-            self.right.print_tree(prefix + ('│   ' if is_left else '    '), False)
-        print(prefix + ('└── ' if is_left else '┌── ') + str(self.value))
-        if self.left:
-            self.left.print_tree(prefix + ('    ' if is_left else '│   '), True)
-
 def factory_node() -> Node:
     root = Node(value="1")
     childre2 = Node(value="2")
@@ -35,21 +33,68 @@ def factory_node() -> Node:
 
     return root
 
-def map_leaf_to_root_path(root: Node) -> str:
-    if not root:
-        return 
-    
-    stack = [(root, [root.value])]
-    
+def iter_leaf_to_root_paths(root: Node | None) -> Iterator[list[str]]:
+    """
+    Leaf-to-root paths from left to right. A single shared stack holds the current root-to-node path
+    and is truncated to each node's depth, so only the yielded paths are copied (one per leaf).
+    """
+    path: list[str] = []
+    stack = [(root, 0)] if root else []
     while stack:
-        node, path = stack.pop()
+        node, depth = stack.pop()
+        del path[depth:]
+        path.append(node.value)
         if not node.left and not node.right:
-            print("->".join(map(str, reversed(path))))
-        
+            yield path[::-1]
         if node.right:
-            stack.append((node.right, path + [node.right.value]))
+            stack.append((node.right, depth + 1))
         if node.left:
-            stack.append((node.left, path + [node.left.value]))
+            stack.append((node.left, depth + 1))
+
+
+def write_leaf_to_root_paths(root: Node | None, writer: TextIO, separator: str = "->", lines_per_write: int = 4096) -> int:
+    """
+    Streams one path per line to a writer (a file, sys.stdout, io.StringIO...), writing blocks of lines at a time.
+
+    Returns:
+        int: The number of paths written.
+    """
+    lines: list[str] = []
+    count = 0
+    for path in iter_leaf_to_root_paths(root):
+        lines.append(separator.join(map(str, path)))
+        count += 1
+        if len(lines) == lines_per_write:
+            writer.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        writer.write("\n".join(lines) + "\n")
+    return count
+
+
+def leaf_to_root_summary(root: Node | None) -> dict[str, int]:
+    """
+    Number of leaf-to-root paths and the sum of their lengths (in nodes), without building any path.
+    """
+    paths = 0
+    total_length = 0
+    stack = [(root, 1)] if root else []
+    while stack:
+        node, length = stack.pop()
+        if not node.left and not node.right:
+            paths += 1
+            total_length += length
+        for child in (node.left, node.right):
+            if child:
+                stack.append((child, length + 1))
+    return {'paths': paths, 'total_length': total_length}
+
+
+def map_leaf_to_root_path(root: Node) -> str:
+    if not root:
+        return 
+
+    write_leaf_to_root_paths(root, sys.stdout)
 
     return 'No elements in the tree'
 
@@ -58,4 +103,5 @@ if __name__ == "__main__":
     root = factory_node()
     root.print_tree()
     print('\n')
-    map_leaf_to_root_path(root)
\ No newline at end of file
+    map_leaf_to_root_path(root)
+    print(leaf_to_root_summary(root))
\ No newline at end of file
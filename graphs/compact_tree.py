@@ -0,0 +1,229 @@
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
+from tree_node import NodeMethods
+
+NO_CHILD = -1
+
+
+class SlotNode(NodeMethods):
+    __slots__ = ('value', 'left', 'right')
+
+    def __init__(self, value: str):
+        self.value: str = value
+        self.right: SlotNode | None = None
+        self.left: SlotNode | None = None
+
+
+class CompactTree:
+    """
+    Binary tree stored in parallel arrays: node i has value values[i] and children left[i] and right[i]
+    (NO_CHILD when missing). Node 0 is the root and nodes are numbered in level order.
+    """
+
+    def __init__(self, values: list[str], left: array, right: array):
+        self.values = values
+        self.left = left
+        self.right = right
+        self.parent = array('i', [NO_CHILD]) * len(values)
+        for index in range(len(values)):
+            if left[index] != NO_CHILD:
+                self.parent[left[index]] = index
+            if right[index] != NO_CHILD:
+                self.parent[right[index]] = index
+
+    @classmethod
+    def from_level_order(cls, items: Iterable[str | None]) -> "CompactTree":
+        """
+        Builds the tree in one pass from a level-order list where None marks a missing child,
+        e.g. ["1", "2", "3", None, "4"]. Children of missing nodes are not listed, so an empty list
+        (or one made only of None) is the empty tree and a None root followed by values raises ValueError.
+        """
+        values: list[str] = []
+        left = array('i')
+        right = array('i')
+        iterator = iter(items)
+        first = next(iterator, None)
+        if first is None:
+            if any(item is not None for item in iterator):
+                raise ValueError("The level-order list has children for missing nodes")
+            return cls(values, left, right)
+        values.append(first)
+        left.append(NO_CHILD)
+        right.append(NO_CHILD)
+        # Nodes waiting for children, in the order their children appear in the list
+        waiting = 0
+        is_left = True
+        for item in iterator:
+            if item is not None:
+                if waiting == len(values):
+                    raise ValueError("The level-order list has children for missing nodes")
+                (left if is_left else right)[waiting] = len(values)
+                values.append(item)
+                left.append(NO_CHILD)
+                right.append(NO_CHILD)
+            if not is_left:
+                waiting += 1
+            is_left = not is_left
+        return cls(values, left, right)
+
+    @classmethod
+    def from_node(cls, root) -> "CompactTree":
+        """
+        Copies a tree of Node-like objects (value, left, right) into the compact form.
+        """
+        values: list[str] = []
+        left = array('i')
+        right = array('i')
+        if root is None:
+            return cls(values, left, right)
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            values.append(node.value)
+            # Children get the next free indexes, the same order in which they leave the queue
+            for child, children in ((node.left, left), (node.right, right)):
+                if child is None:
+                    children.append(NO_CHILD)
+                else:
+                    children.append(len(values) + len(queue))
+                    queue.append(child)
+        return cls(values, left, right)
+
+    def to_nodes(self, node_class=SlotNode):
+        if not self.values:
+            return None
+        nodes = [node_class(value) for value in self.values]
+        for index, node in enumerate(nodes):
+            if self.left[index] != NO_CHILD:
+                node.left = nodes[self.left[index]]
+            if self.right[index] != NO_CHILD:
+                node.right = nodes[self.right[index]]
+        return nodes[0]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def iter_in_order(self) -> Iterator[str]:
+        stack: list[int] = []
+        index = 0 if self.values else NO_CHILD
+        while stack or index != NO_CHILD:
+            while index != NO_CHILD:
+                stack.append(index)
+                index = self.left[index]
+            index = stack.pop()
+            yield self.values[index]
+            index = self.right[index]
+
+    def iter_pre_order(self) -> Iterator[str]:
+        stack = [0] if self.values else []
+        while stack:
+            index = stack.pop()
+            yield self.values[index]
+            if self.right[index] != NO_CHILD:
+                stack.append(self.right[index])
+            if self.left[index] != NO_CHILD:
+                stack.append(self.left[index])
+
+    def iter_post_order(self) -> Iterator[str]:
+        # Reversed (root, right, left) pre-order is post-order; only the indexes are kept
+        order: list[int] = []
+        stack = [0] if self.values else []
+        while stack:
+            index = stack.pop()
+            order.append(index)
+            if self.left[index] != NO_CHILD:
+                stack.append(self.left[index])
+            if self.right[index] != NO_CHILD:
+                stack.append(self.right[index])
+        for index in reversed(order):
+            yield self.values[index]
+
+    def iter_level_order(self) -> Iterator[str]:
+        # Nodes are numbered in level order, so this is just the values list
+        return iter(self.values)
+
+    def in_order(self) -> list[str]:
+        return list(self.iter_in_order())
+
+    def pre_order(self) -> list[str]:
+        return list(self.iter_pre_order())
+
+    def post_order(self) -> list[str]:
+        return list(self.iter_post_order())
+
+    def level_order(self) -> list[str]:
+        return list(self.values)
+
+    def compare(self, other: "CompactTree") -> dict[str, str]:
+        """
+        Same answers as compare_trees, checking node pairs in the same pre-order with an explicit stack.
+        """
+        stack = [(0 if self.values else NO_CHILD, 0 if other.values else NO_CHILD)]
+        while stack:
+            index_a, index_b = stack.pop()
+            if index_a == NO_CHILD and index_b == NO_CHILD:
+                continue
+            if index_a == NO_CHILD or index_b == NO_CHILD:
+                return {'Output': 'False', 'Explanation': 'As árvores têm estruturas diferentes'}
+            if self.values[index_a] != other.values[index_b]:
+                return {'Output': 'False', 'Explanation': 'As árvores têm a mesma estrutura, porém, com valores de nós diferentes'}
+            stack.append((self.right[index_a], other.right[index_b]))
+            stack.append((self.left[index_a], other.left[index_b]))
+        return {'Output': 'True', 'Explanation': 'Ambas as árvores são iguais'}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactTree):
+            return NotImplemented
+        return self.compare(other)['Output'] == 'True'
+
+    def __hash__(self) -> int:
+        """
+        Hashes the same pre-order walk that compare checks, so equal trees hash equally whatever their numbering.
+        Do not change the arrays while the tree is used as a dict key or set member.
+        """
+        shape = []
+        stack = [0] if self.values else []
+        while stack:
+            index = stack.pop()
+            shape.append((self.values[index], self.left[index] != NO_CHILD, self.right[index] != NO_CHILD))
+            if self.right[index] != NO_CHILD:
+                stack.append(self.right[index])
+            if self.left[index] != NO_CHILD:
+                stack.append(self.left[index])
+        return hash(tuple(shape))
+
+    def is_leaf(self, index: int) -> bool:
+        return self.left[index] == NO_CHILD and self.right[index] == NO_CHILD
+
+    def iter_path_to_root(self, index: int) -> Iterator[str]:
+        while index != NO_CHILD:
+            yield self.values[index]
+            index = self.parent[index]
+
+    def iter_leaf_to_root_paths(self) -> Iterator[list[str]]:
+        """
+        Leaf-to-root paths from left to right, following the parent array.
+        """
+        stack = [0] if self.values else []
+        while stack:
+            index = stack.pop()
+            if self.is_leaf(index):
+                yield list(self.iter_path_to_root(index))
+            if self.right[index] != NO_CHILD:
+                stack.append(self.right[index])
+            if self.left[index] != NO_CHILD:
+                stack.append(self.left[index])
+
+
+if __name__ == "__main__":
+    tree = CompactTree.from_level_order(["1", "2", "3", "4", None, "5", "6", None, None, "7", "8"])
+
+    print("In-order:", tree.in_order())
+    print("Pre-order:", tree.pre_order())
+    print("Post-order:", tree.post_order())
+    print("Level-order:", tree.level_order())
+    for path in tree.iter_leaf_to_root_paths():
+        print("->".join(path))
+    print(tree.compare(CompactTree.from_node(tree.to_nodes())))
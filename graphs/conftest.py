@@ -0,0 +1,94 @@
+"""
+    Shared fixtures for the tests of the tree exercises. The exercise files start with a space
+    (" exercise2.py"), so they are loaded by path instead of being imported by name.
+"""
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def load_exercise(number: int):
+    name = f"exercise{number}"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / f" {name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+def build_random_tree(node_class, generator: random.Random, size: int, values: str = "abc"):
+    """
+    Tree of 'size' nodes, each one hung at a free child slot reached by a random walk from the root.
+    A few distinct values make equal subtrees likely.
+    """
+    if size == 0:
+        return None
+    root = node_class(generator.choice(values))
+    for _ in range(size - 1):
+        node = root
+        while True:
+            side = generator.choice(("left", "right"))
+            child = getattr(node, side)
+            if child is None:
+                setattr(node, side, node_class(generator.choice(values)))
+                break
+            node = child
+    return root
+
+
+@pytest.fixture(scope="session")
+def exercise1():
+    return load_exercise(1)
+
+
+@pytest.fixture(scope="session")
+def exercise2():
+    return load_exercise(2)
+
+
+@pytest.fixture(scope="session")
+def exercise4():
+    return load_exercise(4)
+
+
+@pytest.fixture
+def random_tree():
+    return build_random_tree
+
+
+@pytest.fixture
+def random_trees(request):
+    """
+    Random trees from build_random_tree, set up by indirect parametrization:
+
+        @pytest.mark.parametrize("random_trees", [{"exercise": 4, "seed": 16}], indirect=True)
+
+    Settings: 'exercise' (whose Node is used, 1 by default), 'seed', 'count', 'sizes' (smallest and
+    largest size), 'values', and 'with_example' to put the exercise's factory_node() first.
+    """
+    settings = {"exercise": 1, "seed": 0, "count": 50, "sizes": (1, 80), "values": "abc", "with_example": False}
+    settings.update(getattr(request, "param", {}))
+    exercise = load_exercise(settings["exercise"])
+    generator = random.Random(settings["seed"])
+    trees = [exercise.factory_node()] if settings["with_example"] else []
+    trees += [
+        build_random_tree(exercise.Node, generator, generator.randint(*settings["sizes"]), settings["values"])
+        for _ in range(settings["count"])
+    ]
+    return trees
+
+
+@pytest.fixture
+def random_tree_pairs(exercise2):
+    generator = random.Random(15)
+    # Small trees over two values, so that equal trees and both kinds of difference all happen
+    return [
+        (build_random_tree(exercise2.Node, generator, generator.randint(0, 7), "ab"),
+         build_random_tree(exercise2.Node, generator, generator.randint(0, 7), "ab"))
+        for _ in range(300)
+    ]
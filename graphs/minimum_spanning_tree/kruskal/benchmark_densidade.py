@@ -0,0 +1,83 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Medir o tempo de cada algoritmo de MST em grafos de densidades diferentes (E/V²),
+        mostrando onde cada um vence e qual deles 'escolher_algoritmo' usaria.
+
+    Execução:
+        ➜ python benchmark_densidade.py
+'''
+
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from mst import ALGORITMOS_MST, escolher_algoritmo
+
+NUMERO_VERTICES = 1500
+DENSIDADES = [0.001, 0.01, 0.05, 0.1, 0.25, 0.5]
+# Prim com heap é interpretado em Python; acima desta densidade ele leva segundos e é omitido
+DENSIDADE_MAXIMA_PRIM_HEAP = 0.1
+
+CENARIOS = ("reais", "inteiros", "iguais")
+
+def gerar_grafo(numero_vertices: int, densidade: float, cenario: str, gerador: np.random.Generator):
+    """
+    Gera um grafo aleatório com aproximadamente 'densidade * V²' arestas; densidade 0.5 produz o grafo completo.
+
+    Cenários de peso:
+        - "reais": pesos aleatórios distintos.
+        - "inteiros": pesos aleatórios entre 0 e 4, com muitos empates.
+        - "iguais": todos os pesos iguais e arestas ordenadas de forma adversária para o Kruskal
+          (as arestas do vértice 0 vêm por último, então a árvore só se completa no fim da varredura).
+    """
+    if densidade >= 0.5:
+        origens, destinos = np.triu_indices(numero_vertices, 1)
+    else:
+        numero_arestas = int(densidade * numero_vertices * numero_vertices)
+        origens = gerador.integers(0, numero_vertices, numero_arestas)
+        destinos = gerador.integers(0, numero_vertices, numero_arestas)
+    if cenario == "iguais":
+        ordem = np.argsort(-np.minimum(origens, destinos), kind="stable")
+        origens, destinos = origens[ordem], destinos[ordem]
+        pesos = np.ones(len(origens))
+    elif cenario == "inteiros":
+        pesos = gerador.integers(0, 5, len(origens))
+    else:
+        pesos = gerador.random(len(origens))
+    return origens.astype(np.int32), destinos.astype(np.int32), pesos
+
+def medir(numero_vertices: int, densidade: float, cenario: str) -> Dict[str, float]:
+    """
+    Executa todos os algoritmos sobre o mesmo grafo e devolve o tempo de cada um em segundos.
+    """
+    origens, destinos, pesos = gerar_grafo(numero_vertices, densidade, cenario, np.random.default_rng(0))
+    tempos: Dict[str, float] = {}
+    pesos_totais: List[float] = []
+    for nome, algoritmo in ALGORITMOS_MST.items():
+        if nome == "prim" and densidade > DENSIDADE_MAXIMA_PRIM_HEAP:
+            continue
+        inicio = time.perf_counter()
+        indices_mst, _ = algoritmo(numero_vertices, origens, destinos, pesos)
+        tempos[nome] = time.perf_counter() - inicio
+        pesos_totais.append(float(pesos[indices_mst].sum()))
+    assert np.allclose(pesos_totais, pesos_totais[0]), "Os algoritmos produziram MSTs de pesos diferentes"
+    return tempos
+
+def main() -> None:
+    nomes = list(ALGORITMOS_MST)
+    print(f"V = {NUMERO_VERTICES}")
+    print(f"{'densidade':>10} {'pesos':>9} " + " ".join(f"{nome:>11}" for nome in nomes) + f" {'vencedor':>11} {'escolhido':>11}")
+    for densidade in DENSIDADES:
+        for cenario in CENARIOS:
+            tempos = medir(NUMERO_VERTICES, densidade, cenario)
+            colunas = " ".join(f"{tempos[nome]:>10.3f}s" if nome in tempos else f"{'-':>11}" for nome in nomes)
+            vencedor = min(tempos, key=tempos.__getitem__)
+            numero_arestas = NUMERO_VERTICES * (NUMERO_VERTICES - 1) // 2 if densidade >= 0.5 else int(densidade * NUMERO_VERTICES ** 2)
+            escolhido = escolher_algoritmo(NUMERO_VERTICES, numero_arestas)
+            print(f"{densidade:>10} {cenario:>9} {colunas} {vencedor:>11} {escolhido:>11}")
+
+if __name__ == "__main__":
+    main()
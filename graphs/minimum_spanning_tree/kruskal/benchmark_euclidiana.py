@@ -0,0 +1,67 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Comparar a MST euclidiana por vizinhos mais próximos (euclidiana.py) com o Kruskal sobre o grafo
+        completo, conferindo que os pesos totais são idênticos. Acima de FORCA_BRUTA_MAXIMA pontos o
+        grafo completo não cabe em memória e só o caminho esparso é medido.
+
+    Execução:
+        ➜ python benchmark_euclidiana.py
+'''
+
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from euclidiana import arestas_grafo_completo, arvore_geradora_minima_euclidiana
+from kruskal import kruskal_vetorial
+
+TAMANHOS = [500, 1000, 2000, 4000, 20_000, 100_000]
+DIMENSOES = [2, 3]
+# O grafo completo de n pontos tem n(n-1)/2 arestas: 4000 pontos já são 8 milhões
+FORCA_BRUTA_MAXIMA = 4000
+
+def medir_forca_bruta(pontos: np.ndarray) -> Tuple[float, float]:
+    """
+    Monta o grafo completo e executa o Kruskal sobre ele.
+
+    Returns:
+        tuple: (tempo em segundos, peso total da MST).
+    """
+    inicio = time.perf_counter()
+    origens, destinos, pesos = arestas_grafo_completo(pontos)
+    indices_mst, _ = kruskal_vetorial(len(pontos), origens, destinos, pesos)
+    return time.perf_counter() - inicio, float(pesos[indices_mst].sum())
+
+def medir_esparsa(pontos: np.ndarray) -> Tuple[float, float]:
+    """
+    Executa a MST euclidiana pelos vizinhos mais próximos.
+
+    Returns:
+        tuple: (tempo em segundos, peso total da MST).
+    """
+    inicio = time.perf_counter()
+    _, _, pesos = arvore_geradora_minima_euclidiana(pontos)
+    return time.perf_counter() - inicio, float(pesos.sum())
+
+def main() -> None:
+    gerador = np.random.default_rng(0)
+    print(f"{'pontos':>8} {'d':>3} {'esparso':>10} {'completo':>10} {'ganho':>7}")
+    for dimensoes in DIMENSOES:
+        for numero_pontos in TAMANHOS:
+            pontos = gerador.random((numero_pontos, dimensoes))
+            tempo_esparso, peso_esparso = medir_esparsa(pontos)
+            tempo_completo: Optional[float] = None
+            if numero_pontos <= FORCA_BRUTA_MAXIMA:
+                tempo_completo, peso_completo = medir_forca_bruta(pontos)
+                # Mesmas distâncias e mesma MST: os pesos só podem diferir pela ordem da soma
+                if not np.isclose(peso_esparso, peso_completo, rtol=1e-12):
+                    raise RuntimeError("A MST esparsa difere da MST do grafo completo")
+            completo = f"{tempo_completo:>9.3f}s" if tempo_completo is not None else f"{'-':>10}"
+            ganho = f"{tempo_completo / tempo_esparso:>6.1f}x" if tempo_completo is not None else f"{'-':>7}"
+            print(f"{numero_pontos:>8} {dimensoes:>3} {tempo_esparso:>9.3f}s {completo} {ganho}")
+
+if __name__ == "__main__":
+    main()
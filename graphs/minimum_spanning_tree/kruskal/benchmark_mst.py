@@ -0,0 +1,252 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Medir todos os algoritmos de 'ALGORITMOS_MST' em grafos sintéticos de 10³ a 10⁷ arestas e gravar
+        os resultados em JSON, sinalizando regressões em relação a um arquivo de referência.
+            a. Geradores: esparso aleatório, denso, completo, grade, caminho adversário e pesos iguais.
+            b. Para cada caso são registrados o tempo de parede (melhor de algumas repetições), o pico de
+               memória alocada (tracemalloc, em uma execução separada para não distorcer o tempo) e as
+               arestas processadas por segundo. O Borůvka com vários processos só tem a memória do processo
+               principal contabilizada.
+            c. Com '--base', cada caso presente nos dois arquivos é comparado: tempo ou memória acima da
+               referência mais a tolerância é uma regressão, e o programa termina com código 1.
+
+    Execução:
+        ➜ python benchmark_mst.py --saida resultados.json
+        ➜ python benchmark_mst.py --maximo 10000000 --base resultados.json --saida novos.json
+'''
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mst import ALGORITMOS_MST, VERTICES_MAXIMOS_PRIM_DENSO
+
+TAMANHOS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+TAMANHO_MAXIMO_PADRAO = 10 ** 6
+REPETICOES = 3
+TOLERANCIA_PADRAO = 0.25
+# Tempos abaixo disso variam mais que a tolerância de uma execução para outra e não são comparados
+SEGUNDOS_MINIMOS_COMPARADOS = 0.01
+# Prim com heap é interpretado em Python: acima disso cada execução leva dezenas de segundos
+ARESTAS_MAXIMAS_PRIM_HEAP = 10 ** 5
+
+Grafo = Tuple[int, np.ndarray, np.ndarray, np.ndarray]
+
+def gerar_esparso(numero_arestas: int, gerador: np.random.Generator) -> Grafo:
+    """
+    Grafo aleatório com E = 4V e pesos reais distintos.
+    """
+    numero_vertices = max(2, numero_arestas // 4)
+    origens = gerador.integers(0, numero_vertices, numero_arestas)
+    destinos = gerador.integers(0, numero_vertices, numero_arestas)
+    return numero_vertices, origens, destinos, gerador.random(numero_arestas)
+
+def gerar_denso(numero_arestas: int, gerador: np.random.Generator) -> Grafo:
+    """
+    Grafo aleatório com E = V²/8 (densidade 0.125) e pesos reais.
+    """
+    numero_vertices = max(2, int(np.sqrt(8 * numero_arestas)))
+    origens = gerador.integers(0, numero_vertices, numero_arestas)
+    destinos = gerador.integers(0, numero_vertices, numero_arestas)
+    return numero_vertices, origens, destinos, gerador.random(numero_arestas)
+
+def gerar_completo(numero_arestas: int, gerador: np.random.Generator) -> Grafo:
+    """
+    Grafo completo com V(V-1)/2 ≈ E arestas e pesos reais.
+    """
+    numero_vertices = max(2, int((1 + np.sqrt(1 + 8 * numero_arestas)) / 2))
+    origens, destinos = np.triu_indices(numero_vertices, 1)
+    return numero_vertices, origens, destinos, gerador.random(len(origens))
+
+def gerar_grade(numero_arestas: int, gerador: np.random.Generator) -> Grafo:
+    """
+    Grade quadrada L x L (2L(L-1) ≈ E arestas) com pesos reais.
+    """
+    lado = max(2, int(np.sqrt(numero_arestas / 2)))
+    vertices = np.arange(lado * lado).reshape(lado, lado)
+    origens = np.concatenate((vertices[:, :-1].ravel(), vertices[:-1, :].ravel()))
+    destinos = np.concatenate((vertices[:, 1:].ravel(), vertices[1:, :].ravel()))
+    return lado * lado, origens, destinos, gerador.random(len(origens))
+
+def gerar_caminho(numero_arestas: int, gerador: np.random.Generator) -> Grafo:
+    """
+    Caminho 0-1-...-(V-1) mais cordas aleatórias, com E = 4V. A MST é o próprio caminho, mas a aresta
+    (0, 1) é a mais pesada do grafo: a árvore só se completa na última aresta da varredura e todas as
+    cordas precisam ser rejeitadas antes disso.
+    """
+    numero_vertices = max(3, numero_arestas // 4)
+    numero_cordas = max(0, numero_arestas - (numero_vertices - 1))
+    caminho = np.arange(numero_vertices - 1)
+    origens = np.concatenate((caminho, gerador.integers(1, numero_vertices, numero_cordas)))
+    destinos = np.concatenate((caminho + 1, gerador.integers(1, numero_vertices, numero_cordas)))
+    # Caminho com pesos abaixo de V, cordas entre V e 2V e a primeira aresta do caminho acima de tudo
+    pesos = np.concatenate((np.arange(numero_vertices - 1, dtype=np.float64),
+                            gerador.uniform(numero_vertices, 2 * numero_vertices, numero_cordas)))
+    pesos[0] = 3 * numero_vertices
+    return numero_vertices, origens, destinos, pesos
+
+def gerar_pesos_iguais(numero_arestas: int, gerador: np.random.Generator) -> Grafo:
+    """
+    Grafo aleatório com E = 4V em que quase todos os pesos empatam (inteiros entre 0 e 2).
+    """
+    numero_vertices = max(2, numero_arestas // 4)
+    origens = gerador.integers(0, numero_vertices, numero_arestas)
+    destinos = gerador.integers(0, numero_vertices, numero_arestas)
+    return numero_vertices, origens, destinos, gerador.integers(0, 3, numero_arestas)
+
+GERADORES: Dict[str, Callable[[int, np.random.Generator], Grafo]] = {
+    "esparso": gerar_esparso,
+    "denso": gerar_denso,
+    "completo": gerar_completo,
+    "grade": gerar_grade,
+    "caminho": gerar_caminho,
+    "pesos_iguais": gerar_pesos_iguais,
+}
+
+def gerar_grafo(nome: str, numero_arestas: int, semente: int = 0) -> Grafo:
+    """
+    Gera o grafo de um dos 'GERADORES', com vértices em int32 como nos demais motores vetoriais.
+
+    Returns:
+        tuple: (numero_vertices, origens, destinos, pesos).
+    """
+    numero_vertices, origens, destinos, pesos = GERADORES[nome](numero_arestas, np.random.default_rng(semente))
+    return numero_vertices, origens.astype(np.int32), destinos.astype(np.int32), pesos
+
+def algoritmo_aplicavel(algoritmo: str, numero_vertices: int, numero_arestas: int) -> bool:
+    """
+    Indica se vale a pena executar o algoritmo no caso: Prim com heap é lento demais em grafos grandes
+    e Prim denso monta uma matriz V x V.
+    """
+    if algoritmo == "prim":
+        return numero_arestas <= ARESTAS_MAXIMAS_PRIM_HEAP
+    if algoritmo == "prim_denso":
+        return numero_vertices <= VERTICES_MAXIMOS_PRIM_DENSO
+    return True
+
+def medir(algoritmo: str, grafo: Grafo, repeticoes: int = REPETICOES) -> Dict[str, float]:
+    """
+    Executa um algoritmo sobre o grafo e mede tempo de parede, pico de memória e vazão.
+
+    Returns:
+        dict: 'segundos' (melhor das repetições), 'pico_memoria_bytes', 'arestas_por_segundo' e 'peso_total'.
+    """
+    numero_vertices, origens, destinos, pesos = grafo
+    executar = ALGORITMOS_MST[algoritmo]
+    segundos = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        indices_mst, _ = executar(numero_vertices, origens, destinos, pesos)
+        segundos = min(segundos, time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    try:
+        executar(numero_vertices, origens, destinos, pesos)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "segundos": segundos,
+        "pico_memoria_bytes": pico,
+        "arestas_por_segundo": len(pesos) / segundos if segundos > 0 else float("inf"),
+        "peso_total": float(np.asarray(pesos)[indices_mst].sum()),
+    }
+
+def executar_suite(tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO, geradores: Optional[List[str]] = None,
+                   algoritmos: Optional[List[str]] = None, repeticoes: int = REPETICOES, mostrar: bool = True) -> List[Dict]:
+    """
+    Executa todos os algoritmos em todos os geradores e tamanhos até 'tamanho_maximo' arestas.
+
+    Returns:
+        list: Um dicionário por caso, com gerador, número de arestas e vértices, algoritmo e as medidas de 'medir'.
+
+    Raises:
+        RuntimeError: Se dois algoritmos produzirem MSTs de pesos diferentes no mesmo grafo.
+    """
+    resultados = []
+    for nome_gerador in geradores or list(GERADORES):
+        for tamanho in [tamanho for tamanho in TAMANHOS if tamanho <= tamanho_maximo]:
+            grafo = gerar_grafo(nome_gerador, tamanho)
+            numero_vertices, numero_arestas = grafo[0], len(grafo[3])
+            pesos_totais = []
+            for algoritmo in algoritmos or list(ALGORITMOS_MST):
+                if not algoritmo_aplicavel(algoritmo, numero_vertices, numero_arestas):
+                    continue
+                medidas = medir(algoritmo, grafo, repeticoes)
+                pesos_totais.append(medidas.pop("peso_total"))
+                caso = {"gerador": nome_gerador, "tamanho": tamanho, "arestas": numero_arestas,
+                        "vertices": numero_vertices, "algoritmo": algoritmo, **medidas}
+                resultados.append(caso)
+                if mostrar:
+                    print(f"{nome_gerador:>13} {numero_arestas:>9} {algoritmo:>11} {medidas['segundos']:>9.4f}s "
+                          f"{medidas['pico_memoria_bytes'] / 2 ** 20:>9.1f} MiB {medidas['arestas_por_segundo']:>13.0f} arestas/s", flush=True)
+            # A lista fica vazia quando nenhum dos algoritmos pedidos se aplica ao caso
+            if pesos_totais and not np.allclose(pesos_totais, pesos_totais[0]):
+                raise RuntimeError(f"Os algoritmos produziram MSTs de pesos diferentes em {nome_gerador}/{tamanho}")
+    return resultados
+
+def comparar_com_base(resultados: List[Dict], base: List[Dict], tolerancia: float = TOLERANCIA_PADRAO) -> List[str]:
+    """
+    Compara os casos presentes nos dois conjuntos de resultados.
+
+    Args:
+        resultados (list): Casos medidos agora, como devolvidos por 'executar_suite'.
+        base (list): Casos de referência, no mesmo formato.
+        tolerancia (float): Aumento relativo aceito antes de considerar regressão (0.25 = 25%).
+
+    Returns:
+        list: Uma descrição por regressão de tempo ou de memória; vazia se não houver nenhuma. Tempos abaixo
+        de SEGUNDOS_MINIMOS_COMPARADOS não são comparados.
+    """
+    referencia = {(caso["gerador"], caso["tamanho"], caso["algoritmo"]): caso for caso in base}
+    regressoes = []
+    for caso in resultados:
+        anterior = referencia.get((caso["gerador"], caso["tamanho"], caso["algoritmo"]))
+        if anterior is None:
+            continue
+        for medida, unidade in (("segundos", "s"), ("pico_memoria_bytes", " bytes")):
+            if medida == "segundos" and caso[medida] < SEGUNDOS_MINIMOS_COMPARADOS:
+                continue
+            if caso[medida] > anterior[medida] * (1 + tolerancia):
+                regressoes.append(f"{caso['gerador']}/{caso['tamanho']}/{caso['algoritmo']}: {medida} "
+                                  f"{anterior[medida]:.4g}{unidade} -> {caso[medida]:.4g}{unidade} "
+                                  f"(+{100 * (caso[medida] / anterior[medida] - 1):.0f}%)")
+    return regressoes
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mede os algoritmos de MST em grafos sintéticos.")
+    parser.add_argument("--saida", default="benchmark_mst.json", help="arquivo JSON com os resultados")
+    parser.add_argument("--base", default=None, help="resultados de referência para detectar regressões")
+    parser.add_argument("--maximo", type=int, default=TAMANHO_MAXIMO_PADRAO, help="maior número de arestas medido")
+    parser.add_argument("--geradores", nargs="+", choices=list(GERADORES), default=None)
+    parser.add_argument("--algoritmos", nargs="+", choices=list(ALGORITMOS_MST), default=None)
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES)
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO)
+    argumentos = parser.parse_args()
+
+    resultados = executar_suite(argumentos.maximo, argumentos.geradores, argumentos.algoritmos, argumentos.repeticoes)
+    with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+        json.dump({"python": platform.python_version(), "numpy": np.__version__, "maquina": platform.platform(),
+                   "resultados": resultados}, arquivo, indent=2)
+    print(f"{len(resultados)} casos gravados em {argumentos.saida}")
+
+    if argumentos.base:
+        with open(argumentos.base, "r", encoding="utf-8") as arquivo:
+            base = json.load(arquivo)["resultados"]
+        regressoes = comparar_com_base(resultados, base, argumentos.tolerancia)
+        for regressao in regressoes:
+            print(f"REGRESSÃO {regressao}")
+        if regressoes:
+            sys.exit(1)
+        print(f"Nenhuma regressão acima de {100 * argumentos.tolerancia:.0f}% em relação a {argumentos.base}")
+
+if __name__ == "__main__":
+    main()
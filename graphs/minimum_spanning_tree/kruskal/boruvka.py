@@ -0,0 +1,199 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Implementar o algoritmo de Borůvka para criar uma arvore geradora mínima usando vários processos.
+            a. As arestas ficam em memória compartilhada e cada processo recebe um fragmento delas.
+            b. A cada rodada, cada processo encontra a aresta mais leve que sai de cada componente no seu fragmento.
+            c. O processo principal combina os fragmentos, une os componentes, contrai as arestas restantes e inicia a próxima rodada.
+
+        Os empates são desfeitos pelo índice da aresta, a mesma ordem total do argsort estável de
+        'kruskal_vetorial'. Por isso a MST produzida é exatamente a mesma do Kruskal, inclusive com pesos repetidos.
+'''
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from kruskal import ArestasCircuitoPreguicosas, ConjuntoDisjunto
+
+# Abaixo deste número de arestas o custo de iniciar os processos supera o ganho
+ARESTAS_MINIMAS_PARALELO = 200_000
+
+# Vetores compartilhados anexados por cada processo trabalhador em '_inicializar_trabalhador'
+_vetores_trabalhador: Dict[str, np.ndarray] = {}
+_memorias_trabalhador: List[SharedMemory] = []
+
+def _menores_arestas(origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray, numero_vertices: int,
+                     inicio: int, fim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encontra, para cada componente, a aresta mais leve do fragmento [inicio, fim) que sai dele.
+    As pontas das arestas já são rótulos de componentes e nenhuma aresta é interna (ver '_rodadas').
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - componentes (np.ndarray): Componentes que têm alguma aresta de saída no fragmento.
+            - arestas (np.ndarray): Índice da aresta mais leve (menor peso e, no empate, menor índice) de cada componente.
+    """
+    indices = np.arange(inicio, fim)
+    return _escolher_menores(
+        np.concatenate((origens[inicio:fim], destinos[inicio:fim])),
+        np.concatenate((indices, indices)),
+        pesos,
+        numero_vertices,
+    )
+
+def _escolher_menores(componentes: np.ndarray, arestas: np.ndarray, pesos: np.ndarray, numero_vertices: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dado um conjunto de pares (componente, aresta), mantém apenas a aresta mais leve de cada componente.
+    Usa duas reduções lineares em vez de uma ordenação: primeiro o menor peso e, entre as arestas
+    com esse peso, o menor índice.
+    """
+    pesos_arestas = pesos[arestas]
+    if np.issubdtype(pesos.dtype, np.integer):
+        menor_peso = np.full(numero_vertices, np.iinfo(pesos.dtype).max, dtype=pesos.dtype)
+    else:
+        menor_peso = np.full(numero_vertices, np.inf, dtype=np.result_type(pesos.dtype, np.float64))
+    np.minimum.at(menor_peso, componentes, pesos_arestas)
+    empatadas = pesos_arestas == menor_peso[componentes]
+    sem_aresta = np.iinfo(np.intp).max
+    menor_aresta = np.full(numero_vertices, sem_aresta, dtype=np.intp)
+    np.minimum.at(menor_aresta, componentes[empatadas], arestas[empatadas])
+    com_aresta = np.flatnonzero(menor_aresta != sem_aresta)
+    return com_aresta, menor_aresta[com_aresta]
+
+def _inicializar_trabalhador(descritores: Dict[str, Tuple[str, str, int]]) -> None:
+    """
+    Anexa, uma única vez por processo, os vetores que estão em memória compartilhada.
+    """
+    for nome_vetor, (nome_memoria, tipo, tamanho) in descritores.items():
+        memoria = SharedMemory(name=nome_memoria)
+        _memorias_trabalhador.append(memoria)
+        _vetores_trabalhador[nome_vetor] = np.ndarray(tamanho, dtype=tipo, buffer=memoria.buf)
+
+def _menores_arestas_trabalhador(numero_vertices: int, inicio: int, fim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Executa '_menores_arestas' sobre os vetores compartilhados do processo trabalhador.
+    """
+    vetores = _vetores_trabalhador
+    return _menores_arestas(vetores["origens"], vetores["destinos"], vetores["pesos"], numero_vertices, inicio, fim)
+
+def _compartilhar(vetor: np.ndarray, memorias: List[SharedMemory]) -> Tuple[np.ndarray, Tuple[str, str, int]]:
+    """
+    Copia um vetor para um bloco de memória compartilhada e devolve a cópia e o seu descritor.
+    """
+    memoria = SharedMemory(create=True, size=max(vetor.nbytes, 1))
+    memorias.append(memoria)
+    copia = np.ndarray(len(vetor), dtype=vetor.dtype, buffer=memoria.buf)
+    copia[:] = vetor
+    return copia, (memoria.name, vetor.dtype.str, len(vetor))
+
+def _rodadas(numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray, buscar_fragmentos) -> np.ndarray:
+    """
+    Executa as rodadas de Borůvka até que não reste aresta entre componentes diferentes. Depois de cada
+    rodada o grafo é contraído: as pontas das arestas passam a ser os rótulos dos componentes e as arestas
+    internas são descartadas, de modo que cada rodada percorre apenas as arestas que ainda podem entrar na MST.
+
+    Args:
+        buscar_fragmentos (callable): Recebe os vetores contraídos (origens, destinos, pesos) e devolve, para
+            cada fragmento de arestas, o par (componentes, arestas) de '_menores_arestas'.
+
+    Returns:
+        np.ndarray: Índices das arestas que compõem a MST, em ordem crescente de peso.
+    """
+    conjunto = ConjuntoDisjunto(numero_vertices)
+    vertices = np.arange(numero_vertices, dtype=np.int32)
+    pesos_originais = pesos
+    # Índice original de cada aresta restante; a contração preserva a ordem, e com ela o desempate.
+    # Os laços nunca entram na MST e já ficam de fora da primeira rodada
+    indices = np.flatnonzero(origens != destinos)
+    origens, destinos, pesos = origens[indices], destinos[indices], pesos[indices]
+    partes_mst: List[np.ndarray] = []
+    while len(indices):
+        fragmentos = buscar_fragmentos(origens, destinos, pesos)
+        componentes = np.concatenate([componentes for componentes, _ in fragmentos])
+        _, escolhidas = _escolher_menores(componentes, np.concatenate([arestas for _, arestas in fragmentos]), pesos, numero_vertices)
+        # Uma mesma aresta pode ser a mais leve dos dois componentes que ela liga
+        escolhidas = np.unique(escolhidas)
+        conjunto.union_many(origens[escolhidas], destinos[escolhidas])
+        partes_mst.append(indices[escolhidas])
+        componente = conjunto.find_many(vertices)
+        origens, destinos = componente[origens], componente[destinos]
+        externas = np.flatnonzero(origens != destinos)
+        origens, destinos, pesos, indices = origens[externas], destinos[externas], pesos[externas], indices[externas]
+
+    if not partes_mst:
+        return np.zeros(0, dtype=np.intp)
+    indices_mst = np.concatenate(partes_mst)
+    return indices_mst[np.lexsort((indices_mst, pesos_originais[indices_mst]))]
+
+def boruvka_vetorial(numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray,
+                     numero_processos: Optional[int] = None) -> Tuple[np.ndarray, ArestasCircuitoPreguicosas]:
+    """
+    Algoritmo de Borůvka paralelo sobre vetores (origem, destino, peso).
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta.
+        numero_processos (int, opcional): Quantidade de processos trabalhadores. Por padrão, o número de CPUs.
+            Com 1 processo, ou com menos de 'ARESTAS_MINIMAS_PARALELO' arestas, tudo roda no processo atual.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - indices_mst (np.ndarray): Índices das arestas que compõem a MST, em ordem crescente de peso.
+            - indices_circuito (ArestasCircuitoPreguicosas): Índices das demais arestas, calculados apenas quando acessados.
+
+    Raises:
+        ValueError: Se os três vetores não tiverem o mesmo tamanho ou se 'numero_processos' for menor que 1.
+    """
+    origens = np.ascontiguousarray(origens, dtype=np.int32)
+    destinos = np.ascontiguousarray(destinos, dtype=np.int32)
+    pesos = np.ascontiguousarray(pesos)
+    if not len(origens) == len(destinos) == len(pesos):
+        raise ValueError("Os vetores de origens, destinos e pesos devem ter o mesmo tamanho")
+    numero_processos = (os.cpu_count() or 1) if numero_processos is None else numero_processos
+    if numero_processos < 1:
+        raise ValueError("O número de processos deve ser pelo menos 1")
+
+    numero_arestas = len(pesos)
+    if numero_processos == 1 or numero_arestas < ARESTAS_MINIMAS_PARALELO:
+        indices_mst = _rodadas(numero_vertices, origens, destinos, pesos,
+                               lambda origens, destinos, pesos: [_menores_arestas(origens, destinos, pesos, numero_vertices, 0, len(pesos))])
+        return indices_mst, ArestasCircuitoPreguicosas(pesos, indices_mst)
+
+    memorias: List[SharedMemory] = []
+    # Os vetores compartilhados só são referenciados aqui e pela clausura abaixo: assim nenhum quadro de um
+    # traceback os mantém vivos e o 'close' dos blocos funciona mesmo quando um trabalhador falha
+    origens_compartilhadas = destinos_compartilhados = pesos_compartilhados = None
+    try:
+        descritores = {}
+        origens_compartilhadas, descritores["origens"] = _compartilhar(origens, memorias)
+        destinos_compartilhados, descritores["destinos"] = _compartilhar(destinos, memorias)
+        pesos_compartilhados, descritores["pesos"] = _compartilhar(pesos, memorias)
+        with ProcessPoolExecutor(max_workers=numero_processos, initializer=_inicializar_trabalhador, initargs=(descritores,)) as executor:
+            def buscar_fragmentos(origens_rodada, destinos_rodada, pesos_rodada):
+                numero = len(pesos_rodada)
+                # Os blocos já têm as arestas originais, que só mudam quando alguma é descartada;
+                # os trabalhadores leem o prefixo com as arestas contraídas
+                if numero < numero_arestas:
+                    origens_compartilhadas[:numero] = origens_rodada
+                    destinos_compartilhados[:numero] = destinos_rodada
+                    pesos_compartilhados[:numero] = pesos_rodada
+                limites = np.linspace(0, numero, numero_processos + 1).astype(int).tolist()
+                return list(executor.map(_menores_arestas_trabalhador, [numero_vertices] * numero_processos, limites[:-1], limites[1:]))
+            indices_mst = _rodadas(numero_vertices, origens, destinos, pesos, buscar_fragmentos)
+    finally:
+        # Os vetores apontam para os blocos de memória: precisam ser liberados antes do 'close'
+        origens_compartilhadas = destinos_compartilhados = pesos_compartilhados = None
+        # Cada bloco é fechado e removido mesmo que o 'close' de outro bloco falhe
+        with ExitStack() as liberacoes:
+            for memoria in memorias:
+                liberacoes.callback(memoria.unlink)
+                liberacoes.callback(memoria.close)
+    return indices_mst, ArestasCircuitoPreguicosas(pesos, indices_mst)
@@ -0,0 +1,198 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Mostrar os circuitos retirados pelo Kruskal (item "c" de kruskal.py). Para cada aresta rejeitada,
+        o circuito é a própria aresta mais o caminho entre suas extremidades na arvore geradora mínima.
+            a. A MST é enraizada uma única vez e recebe tabelas de ancestrais por saltos binários
+               (binary lifting), com a aresta mais pesada de cada salto.
+            b. O ancestral comum mais baixo (LCA) e a aresta mais pesada do caminho saem em O(log V)
+               por consulta, em lote sobre vetores do NumPy, o que atende milhões de arestas rejeitadas.
+            c. As arestas de cada circuito são montadas subindo pelos pais, em tempo proporcional ao circuito.
+'''
+
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from kruskal import arestas_para_vetores, indices_para_arestas, kruskal_vetorial
+
+class CiclosFundamentais:
+    """
+    Consultas de circuitos fundamentais sobre uma árvore (ou floresta) geradora mínima.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta do grafo.
+        destinos (np.ndarray): Vértices de destino de cada aresta do grafo.
+        pesos (np.ndarray): Peso de cada aresta do grafo.
+        indices_mst (np.ndarray): Índices das arestas da MST, como devolvidos por 'kruskal_vetorial'.
+    """
+
+    def __init__(self, numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray, indices_mst: np.ndarray):
+        self.origens = np.asarray(origens)
+        self.destinos = np.asarray(destinos)
+        self.pesos = np.asarray(pesos)
+        indices_mst = np.asarray(indices_mst, dtype=np.intp)
+
+        # Enraíza cada árvore da floresta com uma busca em largura iterativa
+        extremidades = np.concatenate((self.origens[indices_mst], self.destinos[indices_mst])).astype(np.intp)
+        ordem = np.argsort(extremidades, kind="stable")
+        inicio = np.searchsorted(extremidades[ordem], np.arange(numero_vertices + 1)).tolist()
+        arestas_incidentes = indices_mst[ordem % max(len(indices_mst), 1)].tolist()
+        lista_origens = self.origens.tolist()
+        lista_destinos = self.destinos.tolist()
+
+        pai = list(range(numero_vertices))
+        aresta_pai = [-1] * numero_vertices
+        profundidade = [0] * numero_vertices
+        componente = [-1] * numero_vertices
+        for raiz in range(numero_vertices):
+            if componente[raiz] >= 0:
+                continue
+            componente[raiz] = raiz
+            fila = [raiz]
+            for vertice in fila:
+                for aresta in arestas_incidentes[inicio[vertice]:inicio[vertice + 1]]:
+                    vizinho = lista_destinos[aresta] if lista_origens[aresta] == vertice else lista_origens[aresta]
+                    if componente[vizinho] < 0:
+                        componente[vizinho] = raiz
+                        pai[vizinho] = vertice
+                        aresta_pai[vizinho] = aresta
+                        profundidade[vizinho] = profundidade[vertice] + 1
+                        fila.append(vizinho)
+
+        self.pai = np.array(pai, dtype=np.intp)
+        self.aresta_pai = np.array(aresta_pai, dtype=np.intp)
+        self.profundidade = np.array(profundidade, dtype=np.intp)
+        self.componente = np.array(componente, dtype=np.intp)
+
+        # ancestrais[k][v]: ancestral 2^k níveis acima; mais_pesadas[k][v]: aresta mais pesada nesse trecho (-1 se vazio)
+        self.ancestrais = [self.pai]
+        self.mais_pesadas = [self.aresta_pai]
+        for _ in range(1, max(1, int(self.profundidade.max(initial=0)).bit_length())):
+            anterior, pesada_anterior = self.ancestrais[-1], self.mais_pesadas[-1]
+            self.ancestrais.append(anterior[anterior])
+            self.mais_pesadas.append(self._mais_pesada(pesada_anterior, pesada_anterior[anterior]))
+
+    def _mais_pesada(self, arestas_a: np.ndarray, arestas_b: np.ndarray) -> np.ndarray:
+        """
+        Escolhe, posição a posição, a aresta mais pesada entre duas (-1 representa "nenhuma aresta").
+        """
+        pesos_a = np.where(arestas_a >= 0, self.pesos[arestas_a], -np.inf)
+        pesos_b = np.where(arestas_b >= 0, self.pesos[arestas_b], -np.inf)
+        return np.where(pesos_b > pesos_a, arestas_b, arestas_a)
+
+    def _subir(self, vertices: np.ndarray, niveis: np.ndarray, mais_pesadas: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sobe cada vértice o número de níveis indicado, acumulando a aresta mais pesada do trecho percorrido.
+        """
+        for nivel, (ancestrais, pesadas) in enumerate(zip(self.ancestrais, self.mais_pesadas)):
+            saltar = (niveis >> nivel) & 1 == 1
+            mais_pesadas = np.where(saltar, self._mais_pesada(mais_pesadas, pesadas[vertices]), mais_pesadas)
+            vertices = np.where(saltar, ancestrais[vertices], vertices)
+        return vertices, mais_pesadas
+
+    def consultar(self, vertices_u: np.ndarray, vertices_v: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula, em lote, o ancestral comum mais baixo e a aresta mais pesada do caminho na árvore entre u e v.
+
+        Args:
+            vertices_u (np.ndarray): Primeira extremidade de cada consulta.
+            vertices_v (np.ndarray): Segunda extremidade de cada consulta.
+
+        Returns:
+            tuple: Uma tupla contendo:
+                - ancestrais (np.ndarray): O LCA de cada par, ou -1 se u e v estiverem em árvores diferentes.
+                - mais_pesadas (np.ndarray): Índice da aresta mais pesada do caminho, ou -1 se o caminho for vazio ou não existir.
+        """
+        vertices_u = np.asarray(vertices_u, dtype=np.intp)
+        vertices_v = np.asarray(vertices_v, dtype=np.intp)
+        # Garante que u é o mais profundo e o traz até a profundidade de v
+        trocar = self.profundidade[vertices_u] < self.profundidade[vertices_v]
+        vertices_u, vertices_v = np.where(trocar, vertices_v, vertices_u), np.where(trocar, vertices_u, vertices_v)
+        mais_pesadas = np.full(len(vertices_u), -1, dtype=np.intp)
+        vertices_u, mais_pesadas = self._subir(vertices_u, self.profundidade[vertices_u] - self.profundidade[vertices_v], mais_pesadas)
+
+        for ancestrais, pesadas in zip(reversed(self.ancestrais), reversed(self.mais_pesadas)):
+            saltar = ancestrais[vertices_u] != ancestrais[vertices_v]
+            mais_pesadas = np.where(saltar, self._mais_pesada(mais_pesadas, self._mais_pesada(pesadas[vertices_u], pesadas[vertices_v])), mais_pesadas)
+            vertices_u = np.where(saltar, ancestrais[vertices_u], vertices_u)
+            vertices_v = np.where(saltar, ancestrais[vertices_v], vertices_v)
+
+        # Se ainda são diferentes, os dois estão logo abaixo do LCA
+        diferentes = vertices_u != vertices_v
+        ultimas = self._mais_pesada(self.aresta_pai[vertices_u], self.aresta_pai[vertices_v])
+        mais_pesadas = np.where(diferentes, self._mais_pesada(mais_pesadas, ultimas), mais_pesadas)
+        ancestrais = np.where(diferentes, self.pai[vertices_u], vertices_u)
+
+        mesma_arvore = self.componente[vertices_u] == self.componente[vertices_v]
+        return np.where(mesma_arvore, ancestrais, -1), np.where(mesma_arvore, mais_pesadas, -1)
+
+    def ciclo(self, indice_aresta: int, ancestral: Optional[int] = None) -> np.ndarray:
+        """
+        Monta o circuito fundamental de uma aresta fora da árvore, em tempo proporcional ao seu tamanho.
+
+        Args:
+            indice_aresta (int): Índice da aresta rejeitada.
+            ancestral (int, opcional): O LCA das extremidades, se já tiver sido calculado com 'consultar'.
+
+        Returns:
+            np.ndarray: Índices das arestas do circuito: o caminho de u até o LCA, o caminho do LCA até v
+            e, por fim, a própria aresta rejeitada.
+
+        Raises:
+            ValueError: Se as extremidades da aresta estiverem em árvores diferentes da floresta.
+        """
+        vertice_u, vertice_v = int(self.origens[indice_aresta]), int(self.destinos[indice_aresta])
+        if ancestral is None:
+            ancestral = int(self.consultar(np.array([vertice_u]), np.array([vertice_v]))[0][0])
+        if ancestral < 0:
+            raise ValueError(f"A aresta {indice_aresta} liga árvores diferentes e não fecha nenhum circuito")
+        pai, aresta_pai = self.pai, self.aresta_pai
+        subida: List[int] = []
+        while vertice_u != ancestral:
+            subida.append(int(aresta_pai[vertice_u]))
+            vertice_u = int(pai[vertice_u])
+        descida: List[int] = []
+        while vertice_v != ancestral:
+            descida.append(int(aresta_pai[vertice_v]))
+            vertice_v = int(pai[vertice_v])
+        return np.array(subida + descida[::-1] + [indice_aresta], dtype=np.intp)
+
+    def ciclos(self, indices_rejeitados: np.ndarray) -> Iterator[Tuple[int, np.ndarray, int]]:
+        """
+        Percorre os circuitos fundamentais de várias arestas rejeitadas, calculando os LCAs em um único lote.
+
+        Args:
+            indices_rejeitados (np.ndarray): Índices das arestas fora da árvore (ex.: 'arestas_circuito' do Kruskal).
+
+        Yields:
+            tuple: (indice_rejeitada, arestas_do_ciclo, indice_mais_pesada_do_caminho) para cada aresta.
+        """
+        indices_rejeitados = np.asarray(indices_rejeitados, dtype=np.intp)
+        ancestrais, mais_pesadas = self.consultar(self.origens[indices_rejeitados], self.destinos[indices_rejeitados])
+        for indice, ancestral, mais_pesada in zip(indices_rejeitados.tolist(), ancestrais.tolist(), mais_pesadas.tolist()):
+            yield indice, self.ciclo(indice, ancestral), mais_pesada
+
+def circuitos_retirados(numero_vertices: int, arestas: List[Tuple[int, int, int]]) -> List[Tuple[Tuple[int, int, int], List[Tuple[int, int, int]], Tuple[int, int, int]]]:
+    """
+    Executa o Kruskal e devolve o circuito completo de cada aresta retirada.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        arestas (list): Lista de tuplas representando as arestas no formato (origem, destino, peso).
+
+    Returns:
+        list: Para cada aresta de circuito, em ordem crescente de peso, uma tupla com a aresta retirada,
+        as arestas do circuito que ela fecharia e a aresta mais pesada do caminho na árvore
+        (None se a aresta retirada for um laço).
+    """
+    arestas = list(arestas)
+    origens, destinos, pesos = arestas_para_vetores(arestas)
+    indices_mst, indices_circuito = kruskal_vetorial(numero_vertices, origens, destinos, pesos)
+    consultas = CiclosFundamentais(numero_vertices, origens, destinos, pesos, indices_mst)
+    return [
+        (tuple(arestas[indice]), indices_para_arestas(arestas, ciclo), tuple(arestas[mais_pesada]) if mais_pesada >= 0 else None)
+        for indice, ciclo, mais_pesada in consultas.ciclos(indices_circuito)
+    ]
@@ -0,0 +1,405 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Calcular a arvore geradora mínima euclidiana de um conjunto de pontos (n, d) sem montar as
+        O(n²) arestas do grafo completo.
+            a. Uma grade nas (até) três primeiras coordenadas, dividida nos quantis de cada eixo, encontra
+               os k vizinhos mais próximos de cada ponto olhando só as células ao redor. Se a resposta não
+               estiver garantida, o raio de busca dobra até estar; quando a janela cobriria a grade inteira,
+               usa-se força bruta.
+            b. Rodadas de Borůvka sobre as listas de vizinhos escolhem, para cada componente, a aresta mais
+               curta que sai dele; pela propriedade do corte, as arestas escolhidas formam exatamente a MST
+               do grafo completo. Quando nenhum vizinho listado sai do componente, a distância do k-ésimo
+               vizinho é um limite inferior; só os pontos cujo limite não basta voltam a consultar a grade.
+
+        Para pontos bem espalhados em poucas dimensões o custo é quase linear. Com aglomerados afastados,
+        as caixas envolventes dos componentes descartam o interior de cada aglomerado nas últimas rodadas.
+        Acima de três dimensões a grade só separa as três primeiras coordenadas e o custo cresce bastante.
+
+    Comparação com o grafo completo:
+        ➜ python benchmark_euclidiana.py
+'''
+
+from itertools import product
+from typing import Optional, Tuple
+
+import numpy as np
+
+from kruskal import ConjuntoDisjunto
+
+VIZINHOS_PADRAO = 8
+# Número máximo de pares (consulta, candidato) examinados de uma vez
+PARES_POR_LOTE = 1 << 22
+# Número máximo de distâncias (linhas x colunas x dimensões) calculadas de uma vez na força bruta
+ELEMENTOS_POR_BLOCO = 1 << 23
+# Quantas vezes, no máximo, a grade é construída dobrando as divisões de cada eixo
+REFINAMENTOS_GRADE = 5
+# Quando restam até esse número de componentes, suas caixas envolventes passam a limitar as buscas
+COMPONENTES_COM_CAIXAS = 64
+
+def _distancias(pontos: np.ndarray, origens: np.ndarray, destinos: np.ndarray) -> np.ndarray:
+    """
+    Distância euclidiana entre pares de pontos, com a mesma fórmula usada no grafo completo.
+    """
+    return np.sqrt(((pontos[origens] - pontos[destinos]) ** 2).sum(axis=1))
+
+def arestas_grafo_completo(pontos: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Monta todas as n(n-1)/2 arestas do grafo completo, para comparação e para conjuntos pequenos.
+
+    Returns:
+        tuple: Vetores (origens, destinos, pesos) prontos para 'kruskal_vetorial'.
+    """
+    pontos = np.asarray(pontos, dtype=np.float64)
+    origens, destinos = np.triu_indices(len(pontos), 1)
+    return origens.astype(np.int32), destinos.astype(np.int32), _distancias(pontos, origens, destinos)
+
+def _primeiros_de_cada(consultas: np.ndarray, candidatos: np.ndarray, distancias: np.ndarray, quantidade: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Separa os 'quantidade' pares mais próximos de cada consulta, na ordem (distância, candidato).
+
+    Os pares de cada consulta são espalhados em uma linha de matriz e ordenados linha a linha, o que é
+    bem mais barato que ordenar todos os pares juntos.
+
+    Returns:
+        tuple: (consultas com pelo menos 'quantidade' pares, matriz de candidatos, matriz de distâncias).
+    """
+    ordem = np.argsort(consultas, kind="stable")
+    consultas, candidatos, distancias = consultas[ordem], candidatos[ordem], distancias[ordem]
+    inicios = np.flatnonzero(np.concatenate(([True], consultas[1:] != consultas[:-1]))) if len(consultas) else np.zeros(0, dtype=np.intp)
+    unicas, contagens = consultas[inicios], np.diff(np.append(inicios, len(consultas)))
+    completas = contagens >= quantidade
+    unicas, inicios, contagens = unicas[completas], inicios[completas], contagens[completas]
+    largura = int(contagens.max(initial=quantidade))
+    linhas = np.repeat(np.arange(len(unicas)), contagens)
+    colunas = np.arange(len(linhas)) - np.repeat(np.cumsum(contagens) - contagens, contagens)
+    posicoes = np.repeat(inicios, contagens) + colunas
+    matriz_candidatos = np.full((len(unicas), largura), np.iinfo(np.intp).max, dtype=np.intp)
+    matriz_distancias = np.full((len(unicas), largura), np.inf)
+    matriz_candidatos[linhas, colunas] = candidatos[posicoes]
+    matriz_distancias[linhas, colunas] = distancias[posicoes]
+    # Duas ordenações estáveis por linha: primeiro pelo candidato e depois pela distância
+    por_candidato = np.argsort(matriz_candidatos, axis=1, kind="stable")
+    matriz_candidatos = np.take_along_axis(matriz_candidatos, por_candidato, axis=1)
+    matriz_distancias = np.take_along_axis(matriz_distancias, por_candidato, axis=1)
+    por_distancia = np.argsort(matriz_distancias, axis=1, kind="stable")[:, :quantidade]
+    return unicas, np.take_along_axis(matriz_candidatos, por_distancia, axis=1), np.take_along_axis(matriz_distancias, por_distancia, axis=1)
+
+class _Grade:
+    """
+    Grade sobre as (até) três primeiras coordenadas, com os pontos ordenados por célula.
+
+    As divisões de cada eixo são quantis das coordenadas, então regiões densas recebem células menores.
+    Como os quantis são tomados eixo a eixo, aglomerados ainda deixam células cheias; nesse caso as divisões
+    dobram (até REFINAMENTOS_GRADE vezes) enquanto um ponto típico dividir a célula com muitos outros.
+    Um ponto fora da janela de 'raio' células ao redor de uma consulta está pelo menos tão longe dela quanto
+    a borda mais próxima da janela, pois a distância nas coordenadas da grade nunca supera a distância completa.
+    """
+
+    def __init__(self, pontos: np.ndarray, pontos_por_celula: float):
+        self.pontos = pontos
+        self.projecao = pontos[:, :min(pontos.shape[1], 3)]
+        divisoes = max(1, int(np.ceil((len(pontos) / pontos_por_celula) ** (1 / self.projecao.shape[1]))))
+        for _ in range(REFINAMENTOS_GRADE):
+            self._dividir(divisoes)
+            # Ocupação vista por um ponto típico: cada célula pesa pelo número de pontos que contém
+            if (self.contagens.astype(np.float64) ** 2).sum() / len(pontos) <= 4 * pontos_por_celula:
+                break
+            divisoes *= 2
+        self.pontos_por_celula = len(pontos) / len(self.chaves)
+
+    def _dividir(self, divisoes: int) -> None:
+        """
+        Divide cada eixo em 'divisoes' quantis e ordena os pontos por célula.
+        """
+        self.bordas = []
+        celulas = []
+        for coordenadas in self.projecao.T:
+            bordas = np.unique(np.quantile(coordenadas, np.linspace(0, 1, divisoes + 1)))
+            # A célula i cobre [bordas[i], bordas[i + 1]); a última também inclui o máximo
+            celulas.append(np.clip(np.searchsorted(bordas, coordenadas, side="right") - 1, 0, max(len(bordas) - 2, 0)))
+            self.bordas.append(bordas)
+        self.celulas = np.column_stack(celulas).astype(np.int64)
+        self.tamanhos = np.array([max(len(bordas) - 1, 1) for bordas in self.bordas], dtype=np.int64)
+        self.multiplicadores = np.cumprod(np.concatenate(([1], self.tamanhos[:-1])))
+        chaves = self.celulas @ self.multiplicadores
+        self.ordem = np.argsort(chaves, kind="stable")
+        self.chaves, self.inicios, self.contagens = np.unique(chaves[self.ordem], return_index=True, return_counts=True)
+
+    def cobre_tudo(self, raio: int) -> bool:
+        """
+        Indica se a janela de 'raio' células teria mais células que as ocupadas: nesse caso a força bruta sai mais barata.
+        """
+        return bool((2 * raio + 1) ** len(self.tamanhos) >= len(self.chaves) or (raio >= self.tamanhos).all())
+
+    def tamanho_lote(self, raio: int) -> int:
+        """
+        Quantas consultas cabem em um lote de até PARES_POR_LOTE pares.
+        """
+        return max(1, int(PARES_POR_LOTE // ((2 * raio + 1) ** len(self.tamanhos) * self.pontos_por_celula)))
+
+    def raio_garantido(self, consultas: np.ndarray, raio: int) -> np.ndarray:
+        """
+        Distância de cada consulta até a borda mais próxima da sua janela de 'raio' células.
+        Todo ponto fora da janela está pelo menos a essa distância.
+        """
+        garantido = np.full(len(consultas), np.inf)
+        for eixo, bordas in enumerate(self.bordas):
+            celula = self.celulas[consultas, eixo]
+            coordenada = self.projecao[consultas, eixo]
+            abaixo = celula - raio > 0
+            acima = celula + raio < self.tamanhos[eixo] - 1
+            garantido[abaixo] = np.minimum(garantido[abaixo], coordenada[abaixo] - bordas[celula[abaixo] - raio])
+            garantido[acima] = np.minimum(garantido[acima], bordas[celula[acima] + raio + 1] - coordenada[acima])
+        return garantido
+
+    def pares(self, consultas: np.ndarray, raio: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Todos os pares (consulta, candidato) com o candidato na janela de 'raio' células ao redor da consulta.
+        O próprio ponto consultado não é incluído.
+        """
+        celulas = self.celulas[consultas]
+        partes_consultas, partes_candidatos = [], []
+        for deslocamento in product(range(-raio, raio + 1), repeat=len(self.tamanhos)):
+            vizinha = celulas + np.array(deslocamento)
+            valida = ((vizinha >= 0) & (vizinha < self.tamanhos)).all(axis=1)
+            chave_vizinha = vizinha @ self.multiplicadores
+            posicao = np.minimum(np.searchsorted(self.chaves, chave_vizinha), len(self.chaves) - 1)
+            existe = np.flatnonzero(valida & (self.chaves[posicao] == chave_vizinha))
+            quantidades = self.contagens[posicao[existe]]
+            # Cada consulta gera um par com cada ponto da célula vizinha
+            deslocamentos = np.arange(quantidades.sum()) - np.repeat(np.cumsum(quantidades) - quantidades, quantidades)
+            partes_consultas.append(consultas[np.repeat(existe, quantidades)])
+            partes_candidatos.append(self.ordem[np.repeat(self.inicios[posicao[existe]], quantidades) + deslocamentos])
+        pares_consultas = np.concatenate(partes_consultas)
+        pares_candidatos = np.concatenate(partes_candidatos)
+        diferentes = pares_consultas != pares_candidatos
+        return pares_consultas[diferentes], pares_candidatos[diferentes]
+
+def _forca_bruta(pontos: np.ndarray, consultas: np.ndarray, rotulos: np.ndarray, quantidade: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Força bruta em blocos: os 'quantidade' pontos mais próximos de cada consulta entre os que têm rótulo
+    diferente do dela (para vizinhos comuns, o rótulo de cada ponto é o próprio índice).
+    Os empates de distância são desfeitos pelo índice.
+    """
+    numero_pontos, dimensoes = pontos.shape
+    tamanho_bloco = max(1, ELEMENTOS_POR_BLOCO // max(numero_pontos * dimensoes, 1))
+    vizinhos = np.empty((len(consultas), quantidade), dtype=np.intp)
+    for inicio in range(0, len(consultas), tamanho_bloco):
+        bloco = consultas[inicio:inicio + tamanho_bloco]
+        quadrados = ((pontos[bloco][:, None, :] - pontos[None, :, :]) ** 2).sum(axis=2)
+        quadrados[rotulos[bloco][:, None] == rotulos[None, :]] = np.inf
+        # Todos os pontos até a k-ésima distância, também os empatados com ela, para desempatar pelo índice
+        limite = np.partition(quadrados, quantidade - 1, axis=1)[:, quantidade - 1:quantidade]
+        linhas, colunas = np.nonzero(quadrados <= limite)
+        _, vizinhos[inicio:inicio + len(bloco)], _ = _primeiros_de_cada(linhas, colunas, quadrados[linhas, colunas], quantidade)
+    return vizinhos, np.sqrt(((pontos[consultas][:, None, :] - pontos[vizinhos]) ** 2).sum(axis=2))
+
+def _buscar(grade: _Grade, consultas: np.ndarray, quantidade: int, rotulos: np.ndarray,
+            menor_saida: Optional[np.ndarray] = None, limite_saida: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Os 'quantidade' pontos mais próximos de cada consulta entre os que têm rótulo diferente do dela,
+    dobrando o raio da janela até que a resposta esteja garantida.
+
+    Com 'menor_saida' (a menor aresta de saída conhecida de cada rótulo, atualizada no lugar), a busca de
+    uma consulta para assim que a borda da sua janela, ou o 'limite_saida' do ponto, ficar mais longe que
+    a saída do seu componente: a aresta dela não seria escolhida, e a distância devolvida é infinita. É o
+    que evita varrer o interior de componentes grandes.
+    """
+    vizinhos = np.full((len(grade.pontos), quantidade), -1, dtype=np.intp)
+    distancias = np.full((len(grade.pontos), quantidade), np.inf)
+    pendentes = consultas
+    raio = 1
+    while len(pendentes):
+        if grade.cobre_tudo(raio):
+            vizinhos[pendentes], distancias[pendentes] = _forca_bruta(grade.pontos, pendentes, rotulos, quantidade)
+            if menor_saida is not None:
+                np.minimum.at(menor_saida, rotulos[pendentes], distancias[pendentes, 0])
+            break
+        garantidas = []
+        tamanho_lote = grade.tamanho_lote(raio)
+        for inicio in range(0, len(pendentes), tamanho_lote):
+            lote = pendentes[inicio:inicio + tamanho_lote]
+            pares_consultas, pares_candidatos = grade.pares(lote, raio)
+            fora = rotulos[pares_consultas] != rotulos[pares_candidatos]
+            pares_consultas, pares_candidatos = pares_consultas[fora], pares_candidatos[fora]
+            encontradas, proximos, distancias_proximos = _primeiros_de_cada(
+                pares_consultas, pares_candidatos, _distancias(grade.pontos, pares_consultas, pares_candidatos), quantidade)
+            vizinhos[encontradas], distancias[encontradas] = proximos, distancias_proximos
+            if menor_saida is not None:
+                # Uma aresta encontrada, garantida ou não, já limita a saída do componente
+                np.minimum.at(menor_saida, rotulos[encontradas], distancias_proximos[:, 0])
+            # Estritamente menor: um ponto fora da janela exatamente na borda poderia empatar com índice menor
+            garantidas.append(encontradas[distancias_proximos[:, -1] < grade.raio_garantido(encontradas, raio)])
+        pendentes = np.setdiff1d(pendentes, np.concatenate(garantidas), assume_unique=True)
+        if menor_saida is not None:
+            limite = grade.raio_garantido(pendentes, raio)
+            if limite_saida is not None:
+                limite = np.maximum(limite, limite_saida[pendentes])
+            longe = limite > menor_saida[rotulos[pendentes]]
+            distancias[pendentes[longe]] = np.inf
+            pendentes = pendentes[~longe]
+        raio *= 2
+    return vizinhos[consultas], distancias[consultas]
+
+def k_vizinhos_mais_proximos(pontos: np.ndarray, k: int = VIZINHOS_PADRAO) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encontra, de forma exata, os k vizinhos mais próximos de cada ponto.
+
+    Args:
+        pontos (np.ndarray): Matriz (n, d) de coordenadas.
+        k (int): Número de vizinhos (limitado a n - 1).
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - vizinhos (np.ndarray): Matriz (n, k) com os índices dos vizinhos, do mais próximo ao mais distante
+              e, no empate, do menor índice ao maior.
+            - distancias (np.ndarray): Matriz (n, k) com as distâncias correspondentes.
+    """
+    pontos = np.asarray(pontos, dtype=np.float64)
+    numero_pontos = len(pontos)
+    k = min(k, numero_pontos - 1)
+    if k <= 0:
+        return np.zeros((numero_pontos, 0), dtype=np.intp), np.zeros((numero_pontos, 0))
+    # Com cerca de k/2 pontos por célula, o k-ésimo vizinho típico fica dentro da janela de raio 1
+    grade = _Grade(pontos, max(k / 2, 1))
+    todos = np.arange(numero_pontos)
+    return _buscar(grade, todos, k, todos)
+
+def _caixas_dos_pedacos(pontos: np.ndarray, componente: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Caixas envolventes dos componentes atuais, guardadas como "pedaços" fixos para as próximas rodadas.
+
+    Componentes só se unem, então cada pedaço continua dentro de um componente. Caixas de pedaços
+    continuam pequenas mesmo depois que aglomerados distantes se unem em um mesmo componente.
+
+    Returns:
+        tuple: (um ponto representante de cada pedaço, cantos mínimos, cantos máximos).
+    """
+    rotulos, representantes, rotulo_de = np.unique(componente, return_index=True, return_inverse=True)
+    minimos = np.full((len(rotulos), pontos.shape[1]), np.inf)
+    maximos = np.full((len(rotulos), pontos.shape[1]), -np.inf)
+    np.minimum.at(minimos, rotulo_de, pontos)
+    np.maximum.at(maximos, rotulo_de, pontos)
+    return representantes, minimos, maximos
+
+def _distancia_ate_outras_caixas(pontos: np.ndarray, consultas: np.ndarray, componente: np.ndarray,
+                                 caixas: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Distância de cada consulta até a caixa mais próxima entre as dos pedaços de outros componentes.
+    Todo ponto de outro componente está dentro de uma dessas caixas, logo pelo menos a essa distância.
+    """
+    representantes, minimos, maximos = caixas
+    coordenadas = pontos[consultas]
+    limite = np.full(len(consultas), np.inf)
+    for representante, minimo, maximo in zip(representantes, minimos, maximos):
+        excesso = np.maximum(np.maximum(minimo - coordenadas, coordenadas - maximo), 0)
+        distancia = np.sqrt((excesso ** 2).sum(axis=1))
+        outro = componente[consultas] != componente[representante]
+        limite[outro] = np.minimum(limite[outro], distancia[outro])
+    return limite
+
+def _podar_com_caixas(pontos: np.ndarray, pendentes: np.ndarray, componente: np.ndarray,
+                      caixas: Tuple[np.ndarray, np.ndarray, np.ndarray], melhor_vizinho: np.ndarray,
+                      melhor_distancia: np.ndarray, menor_componente: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve por força bruta, em cada componente, o ponto pendente mais perto das caixas de outros
+    componentes, e descarta os pontos cujo limite pelas caixas já supera a saída encontrada.
+    Atualiza os vetores no lugar.
+
+    Returns:
+        tuple: (pontos que ainda precisam da grade, limite das caixas de cada ponto).
+    """
+    limite_caixas = np.zeros(len(componente))
+    limite_caixas[pendentes] = _distancia_ate_outras_caixas(pontos, pendentes, componente, caixas)
+    ordenados = pendentes[np.lexsort((limite_caixas[pendentes], componente[pendentes]))]
+    primeiros = ordenados[np.concatenate(([True], componente[ordenados[1:]] != componente[ordenados[:-1]]))]
+    melhor_vizinho[primeiros], melhor_distancia[primeiros] = (vetor[:, 0] for vetor in _forca_bruta(pontos, primeiros, componente, 1))
+    np.minimum.at(menor_componente, componente[primeiros], melhor_distancia[primeiros])
+    restantes = np.setdiff1d(pendentes, primeiros, assume_unique=True)
+    longe = limite_caixas[restantes] > menor_componente[componente[restantes]]
+    melhor_distancia[restantes[longe]] = np.inf
+    return restantes[~longe], limite_caixas
+
+def _arestas_boruvka(pontos: np.ndarray, vizinhos: np.ndarray, distancias: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Executa Borůvka sobre as listas de vizinhos e devolve as arestas escolhidas, que formam a MST do grafo completo.
+
+    As arestas são comparadas pela ordem total (distância, menor extremidade, maior extremidade). Com ela,
+    empates de distância (comuns em grades) não fazem dois componentes escolherem arestas que fechem um ciclo.
+    """
+    numero_pontos = len(pontos)
+    conjunto = ConjuntoDisjunto(numero_pontos)
+    todos = np.arange(numero_pontos, dtype=np.int32)
+    linhas = np.arange(numero_pontos)
+    grade = None
+    caixas = None
+    partes_origens, partes_destinos = [], []
+    while conjunto.numero_componentes > 1:
+        componente = conjunto.find_many(todos).astype(np.intp)
+        if caixas is None and conjunto.numero_componentes <= COMPONENTES_COM_CAIXAS:
+            caixas = _caixas_dos_pedacos(pontos, componente)
+        # Primeiro vizinho listado (ordem de distância e, no empate, de índice) que está em outro componente
+        fora = componente[vizinhos] != componente[:, None]
+        tem_fora = fora.any(axis=1)
+        primeiro = fora.argmax(axis=1)
+        melhor_distancia = np.where(tem_fora, distancias[linhas, primeiro], np.inf)
+        melhor_vizinho = np.where(tem_fora, vizinhos[linhas, primeiro], -1)
+        limite_inferior = distancias[:, -1]
+
+        menor_componente = np.full(numero_pontos, np.inf)
+        np.minimum.at(menor_componente, componente, melhor_distancia)
+        # Sem vizinho listado fora do componente, a aresta de saída do ponto mede pelo menos o k-ésimo vizinho.
+        # No empate com o k-ésimo vizinho, pode haver um ponto não listado de índice menor: o ponto também é incerto.
+        incertos = np.flatnonzero(~tem_fora | (melhor_distancia == limite_inferior))
+        # Os que nem o limite inferior deixa competir com a saída já conhecida do componente não são buscados
+        pendentes = incertos[limite_inferior[incertos] <= menor_componente[componente[incertos]]]
+        limite_caixas = None
+        if len(pendentes) and caixas is not None:
+            pendentes, limite_caixas = _podar_com_caixas(
+                pontos, pendentes, componente, caixas, melhor_vizinho, melhor_distancia, menor_componente)
+        if len(pendentes):
+            if grade is None:
+                grade = _Grade(pontos, max(vizinhos.shape[1] / 2, 1))
+            encontrados, distancias_encontradas = _buscar(grade, pendentes, 1, componente, menor_componente, limite_caixas)
+            melhor_vizinho[pendentes], melhor_distancia[pendentes] = encontrados[:, 0], distancias_encontradas[:, 0]
+
+        # Entre as arestas de menor distância de cada componente, a de menor par (menor extremidade, maior extremidade)
+        candidatos = np.flatnonzero(melhor_distancia == menor_componente[componente])
+        extremidade_a = np.minimum(candidatos, melhor_vizinho[candidatos]).astype(np.int64)
+        extremidade_b = np.maximum(candidatos, melhor_vizinho[candidatos]).astype(np.int64)
+        sem_aresta = np.iinfo(np.int64).max
+        chaves = np.full(numero_pontos, sem_aresta)
+        np.minimum.at(chaves, componente[candidatos], extremidade_a * numero_pontos + extremidade_b)
+        escolhidas = np.unique(chaves[chaves != sem_aresta])
+        origens, destinos = escolhidas // numero_pontos, escolhidas % numero_pontos
+        conjunto.union_many(origens, destinos)
+        partes_origens.append(origens)
+        partes_destinos.append(destinos)
+    if not partes_origens:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    return np.concatenate(partes_origens), np.concatenate(partes_destinos)
+
+def arvore_geradora_minima_euclidiana(pontos: np.ndarray, k: int = VIZINHOS_PADRAO) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Árvore geradora mínima euclidiana de um conjunto de pontos, por Borůvka sobre as listas dos k vizinhos.
+
+    Args:
+        pontos (np.ndarray): Matriz (n, d) de coordenadas.
+        k (int): Número de vizinhos mais próximos listados para cada ponto.
+
+    Returns:
+        tuple: Vetores (origens, destinos, pesos) das n - 1 arestas da MST, em ordem crescente de peso.
+
+    Raises:
+        ValueError: Se 'pontos' não for uma matriz (n, d).
+    """
+    pontos = np.asarray(pontos, dtype=np.float64)
+    if pontos.ndim != 2:
+        raise ValueError("Os pontos devem ser uma matriz (n, d) de coordenadas")
+    vizinhos, distancias = k_vizinhos_mais_proximos(pontos, k)
+    origens, destinos = _arestas_boruvka(pontos, vizinhos, distancias)
+    pesos = _distancias(pontos, origens, destinos)
+    ordem = np.argsort(pesos, kind="stable")
+    return origens[ordem].astype(np.int32), destinos[ordem].astype(np.int32), pesos[ordem]
@@ -0,0 +1,248 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Gravar e carregar listas de arestas em um formato binário compacto, evitando converter texto
+        em toda execução. O carregamento usa numpy.memmap e não copia os dados: os vetores devolvidos
+        podem ser passados diretamente para 'kruskal_vetorial' e para os demais motores vetoriais.
+
+    Formato (little-endian):
+        Cabeçalho de 32 bytes:
+            bytes 0-7    assinatura b"ARESTAS\\0"
+            bytes 8-11   versão do formato (uint32, atualmente 1)
+            bytes 12-15  tipo do peso (uint32): 0 = float64, 1 = int64
+            bytes 16-23  número de vértices (uint64)
+            bytes 24-31  número de arestas E (uint64)
+        Colunas de largura fixa, uma após a outra:
+            origens   int32[E]
+            destinos  int32[E]
+            pesos     float64[E] ou int64[E]
+        Com o cabeçalho de 32 bytes, cada coluna começa alinhada ao tamanho do seu tipo.
+
+    Conversão pela linha de comando:
+        ➜ python formato_binario.py arestas.csv arestas.bin --delimitador ,
+'''
+
+import argparse
+import os
+import shutil
+import struct
+import tempfile
+import warnings
+from itertools import islice
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+ASSINATURA = b"ARESTAS\0"
+VERSAO = 1
+CABECALHO = struct.Struct("<8sIIQQ")
+TIPOS_PESO = {0: np.dtype("<f8"), 1: np.dtype("<i8")}
+
+class ArestasBinarias(NamedTuple):
+    """
+    Grafo carregado de um arquivo binário. Os vetores são memmaps somente leitura sobre o arquivo.
+
+    Por ser uma tupla na mesma ordem dos argumentos dos motores vetoriais, pode ser desempacotado
+    diretamente: kruskal_vetorial(*carregar_arestas_binario(caminho)).
+    """
+    numero_vertices: int
+    origens: np.ndarray
+    destinos: np.ndarray
+    pesos: np.ndarray
+
+def _codigo_tipo_peso(tipo: np.dtype) -> int:
+    """
+    Código do tipo de peso gravado no cabeçalho: inteiros viram int64 e os demais, float64.
+    """
+    return 1 if np.issubdtype(tipo, np.integer) else 0
+
+def _gravar_cabecalho(arquivo, codigo_tipo_peso: int, numero_vertices: int, numero_arestas: int) -> None:
+    arquivo.write(CABECALHO.pack(ASSINATURA, VERSAO, codigo_tipo_peso, numero_vertices, numero_arestas))
+
+def ler_cabecalho(caminho: str):
+    """
+    Lê e valida o cabeçalho de um arquivo binário de arestas.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+
+    Returns:
+        tuple: (tipo_peso, numero_vertices, numero_arestas).
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato ou tiver uma versão desconhecida.
+    """
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read(CABECALHO.size)
+    if len(dados) < CABECALHO.size:
+        raise ValueError(f"{caminho} não é um arquivo binário de arestas")
+    assinatura, versao, codigo_tipo_peso, numero_vertices, numero_arestas = CABECALHO.unpack(dados)
+    if assinatura != ASSINATURA:
+        raise ValueError(f"{caminho} não é um arquivo binário de arestas")
+    if versao != VERSAO or codigo_tipo_peso not in TIPOS_PESO:
+        raise ValueError(f"Versão {versao} ou tipo de peso {codigo_tipo_peso} não suportados em {caminho}")
+    return TIPOS_PESO[codigo_tipo_peso], numero_vertices, numero_arestas
+
+def eh_arquivo_binario(caminho: str) -> bool:
+    """
+    Indica se o arquivo começa com a assinatura do formato binário de arestas.
+    """
+    with open(caminho, "rb") as arquivo:
+        return arquivo.read(len(ASSINATURA)) == ASSINATURA
+
+def gravar_arestas_binario(caminho: str, numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray) -> None:
+    """
+    Grava vetores (origem, destino, peso) no formato binário de arestas.
+
+    Args:
+        caminho (str): Caminho do arquivo de saída.
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta; pesos inteiros são gravados como int64 e os demais como float64.
+
+    Raises:
+        ValueError: Se os três vetores não tiverem o mesmo tamanho.
+    """
+    pesos = np.asarray(pesos)
+    if not len(origens) == len(destinos) == len(pesos):
+        raise ValueError("Os vetores de origens, destinos e pesos devem ter o mesmo tamanho")
+    codigo_tipo_peso = _codigo_tipo_peso(pesos.dtype)
+    with open(caminho, "wb") as arquivo:
+        _gravar_cabecalho(arquivo, codigo_tipo_peso, numero_vertices, len(pesos))
+        np.asarray(origens, dtype="<i4").tofile(arquivo)
+        np.asarray(destinos, dtype="<i4").tofile(arquivo)
+        pesos.astype(TIPOS_PESO[codigo_tipo_peso], copy=False).tofile(arquivo)
+
+def carregar_arestas_binario(caminho: str) -> ArestasBinarias:
+    """
+    Carrega um arquivo binário de arestas sem copiar os dados, usando numpy.memmap.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+
+    Returns:
+        ArestasBinarias: Número de vértices e os vetores de origens, destinos e pesos (somente leitura).
+    """
+    tipo_peso, numero_vertices, numero_arestas = ler_cabecalho(caminho)
+    if numero_arestas == 0:
+        vazio = np.zeros(0, dtype="<i4")
+        return ArestasBinarias(numero_vertices, vazio, vazio, np.zeros(0, dtype=tipo_peso))
+    deslocamento = CABECALHO.size
+    origens = np.memmap(caminho, dtype="<i4", mode="r", offset=deslocamento, shape=(numero_arestas,))
+    deslocamento += 4 * numero_arestas
+    destinos = np.memmap(caminho, dtype="<i4", mode="r", offset=deslocamento, shape=(numero_arestas,))
+    deslocamento += 4 * numero_arestas
+    pesos = np.memmap(caminho, dtype=tipo_peso, mode="r", offset=deslocamento, shape=(numero_arestas,))
+    return ArestasBinarias(numero_vertices, origens, destinos, pesos)
+
+def _eh_cabecalho(linha: str, delimitador: Optional[str]) -> bool:
+    """
+    Indica se a linha tem algum campo que não é número, como em "origem,destino,peso".
+    """
+    for campo in linha.split(delimitador):
+        try:
+            float(campo)
+        except ValueError:
+            return True
+    return False
+
+def ler_texto_em_blocos(caminho_texto: str, tamanho_bloco: int, delimitador: Optional[str] = None,
+                        pular_cabecalho: Optional[bool] = None, tipo_campos: np.dtype = np.float64) -> Iterator[np.ndarray]:
+    """
+    Lê um arquivo texto com uma aresta por linha ("origem destino peso") em blocos de até 'tamanho_bloco' linhas.
+    Linhas vazias e comentários iniciados por '#' são ignorados.
+
+    Args:
+        pular_cabecalho (bool, opcional): Se True, descarta a primeira linha com conteúdo; se False, a lê como aresta.
+            Por padrão, ela é descartada apenas se algum campo não for número (ex.: "origem,destino,peso").
+        tipo_campos (np.dtype): Tipo da matriz lida. Com int64, pesos inteiros acima de 2**53 são lidos sem
+            arredondamento, o que não acontece passando por float64.
+
+    Yields:
+        np.ndarray: Matriz (n, 3) do tipo 'tipo_campos' com as colunas origem, destino e peso.
+    """
+    with open(caminho_texto, "r", encoding="utf-8") as arquivo:
+        # Comentários e linhas vazias antes do cabeçalho também são descartados
+        for linha in arquivo:
+            conteudo = linha.split("#", 1)[0].strip()
+            if conteudo:
+                break
+        else:
+            return
+        if pular_cabecalho is None:
+            pular_cabecalho = _eh_cabecalho(conteudo, delimitador)
+        primeira = [] if pular_cabecalho else [linha]
+        while True:
+            linhas = primeira + list(islice(arquivo, tamanho_bloco - len(primeira)))
+            primeira = []
+            if not linhas:
+                return
+            with warnings.catch_warnings():
+                # Blocos só com comentários ou linhas vazias são válidos e apenas não produzem arestas
+                warnings.simplefilter("ignore", UserWarning)
+                campos = np.loadtxt(linhas, delimiter=delimitador, comments="#", ndmin=2, dtype=tipo_campos)
+            if len(campos):
+                yield campos
+
+def converter_texto_para_binario(caminho_texto: str, caminho_binario: str, numero_vertices: Optional[int] = None,
+                                 delimitador: Optional[str] = None, pesos_inteiros: bool = False,
+                                 tamanho_bloco: int = 1_000_000, pular_cabecalho: Optional[bool] = None) -> ArestasBinarias:
+    """
+    Converte um arquivo CSV/texto de arestas para o formato binário, em fluxo e com memória O(tamanho do bloco).
+    Cada coluna é gravada em um arquivo temporário e, ao final, as colunas são concatenadas após o cabeçalho.
+
+    Args:
+        caminho_texto (str): Arquivo de entrada, com uma aresta "origem destino peso" por linha.
+        caminho_binario (str): Arquivo binário de saída.
+        numero_vertices (int, opcional): Número de vértices; por padrão, o maior vértice encontrado mais um.
+        delimitador (str, opcional): Separador dos campos; por padrão, qualquer espaço em branco.
+        pesos_inteiros (bool): Se True, os pesos são gravados como int64; caso contrário, como float64.
+        tamanho_bloco (int): Número de linhas convertidas por vez.
+        pular_cabecalho (bool, opcional): Como em 'ler_texto_em_blocos'; por padrão, o cabeçalho é detectado.
+
+    Returns:
+        ArestasBinarias: O arquivo convertido, já carregado com 'carregar_arestas_binario'.
+    """
+    tipo_peso = TIPOS_PESO[1 if pesos_inteiros else 0]
+    numero_arestas = 0
+    maior_vertice = -1
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(caminho_binario))) as diretorio:
+        caminhos_colunas = [os.path.join(diretorio, nome) for nome in ("origens", "destinos", "pesos")]
+        arquivos_colunas = [open(caminho, "wb") for caminho in caminhos_colunas]
+        try:
+            for campos in ler_texto_em_blocos(caminho_texto, tamanho_bloco, delimitador, pular_cabecalho, tipo_peso):
+                campos[:, 0].astype("<i4").tofile(arquivos_colunas[0])
+                campos[:, 1].astype("<i4").tofile(arquivos_colunas[1])
+                campos[:, 2].astype(tipo_peso).tofile(arquivos_colunas[2])
+                numero_arestas += len(campos)
+                maior_vertice = max(maior_vertice, int(campos[:, :2].max()))
+        finally:
+            for arquivo in arquivos_colunas:
+                arquivo.close()
+
+        if numero_vertices is None:
+            numero_vertices = maior_vertice + 1
+        with open(caminho_binario, "wb") as arquivo:
+            _gravar_cabecalho(arquivo, _codigo_tipo_peso(tipo_peso), numero_vertices, numero_arestas)
+            for caminho in caminhos_colunas:
+                with open(caminho, "rb") as coluna:
+                    shutil.copyfileobj(coluna, arquivo)
+    return carregar_arestas_binario(caminho_binario)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Converte uma lista de arestas CSV/texto para o formato binário.")
+    parser.add_argument("entrada", help="arquivo texto com uma aresta 'origem destino peso' por linha")
+    parser.add_argument("saida", help="arquivo binário de saída")
+    parser.add_argument("--delimitador", default=None, help="separador dos campos (padrão: espaços em branco)")
+    parser.add_argument("--vertices", type=int, default=None, help="número de vértices (padrão: maior vértice + 1)")
+    parser.add_argument("--pesos-inteiros", action="store_true", help="grava os pesos como int64")
+    argumentos = parser.parse_args()
+
+    grafo = converter_texto_para_binario(argumentos.entrada, argumentos.saida, argumentos.vertices,
+                                         argumentos.delimitador, argumentos.pesos_inteiros)
+    print(f"{len(grafo.pesos)} arestas e {grafo.numero_vertices} vértices gravados em {argumentos.saida}")
+
+if __name__ == "__main__":
+    main()
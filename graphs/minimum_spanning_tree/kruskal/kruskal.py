@@ -11,9 +11,11 @@
             e.  O algoritmo deve mostrar ao usuário a formação final da arvore, com os respectivos custos de suas arestas
 '''
 
-import tkinter as tk
-from typing import List, Tuple, Dict
-import math
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 class ConjuntoDisjunto:
     """
@@ -22,25 +24,33 @@ class ConjuntoDisjunto:
     Esta estrutura permite agrupar elementos em conjuntos que não se sobrepõem, 
     sendo muito utilizada para detectar ciclos e unir componentes em algoritmos de grafos, 
     como o de Kruskal para árvore geradora mínima.
+
+    Além das operações elemento a elemento, oferece 'union_many' e 'find_many', que processam
+    lotes inteiros de pares em uma única chamada, e mantém o número de componentes atualizado.
     """
 
     def __init__(self, numero_elementos: int):
         """
         Inicializa a estrutura Union-Find com cada elemento sendo seu próprio pai.
-        O atributo 'pai' é uma lista onde o índice representa o elemento e o valor é o pai dele.
+        O atributo 'pai' é um vetor contíguo de inteiros de 32 bits onde o índice representa
+        o elemento e o valor é o pai dele.
         O atributo 'rank' é usado para otimizar a união dos conjuntos, representando a "altura" da árvore.
+        O atributo 'numero_componentes' guarda quantos conjuntos disjuntos existem no momento.
 
         Args:
             numero_elementos (int): Número total de elementos na estrutura.
         """
-        self.pai = list(range(numero_elementos))
-        self.rank = [0] * numero_elementos
+        self.pai = array('i', range(numero_elementos))
+        self.rank = array('i', bytes(4 * numero_elementos))
+        self.numero_componentes = numero_elementos
+        # Visão NumPy que compartilha a memória de 'pai', usada pelas operações em lote
+        self._pai_vetor = np.frombuffer(self.pai, dtype=np.int32)
 
     def encontrar_raiz(self, elemento: int) -> int:
         """
         Encontra a raiz (representante) do conjunto ao qual o elemento pertence.
-        Aplica compressão de caminho para otimizar futuras buscas, fazendo com que todos os
-        elementos no caminho apontem diretamente para a raiz.
+        Aplica compressão de caminho por divisão ao meio (path halving) de forma iterativa:
+        cada elemento visitado passa a apontar para o seu avô, sem recursão.
 
         Args:
             elemento (int): O elemento para o qual se quer encontrar a raiz.
@@ -48,9 +58,11 @@ class ConjuntoDisjunto:
         Returns:
             int: O representante (raiz) do conjunto.
         """
-        if self.pai[elemento] != elemento:
-            self.pai[elemento] = self.encontrar_raiz(self.pai[elemento])
-        return self.pai[elemento]
+        pai = self.pai
+        while pai[elemento] != elemento:
+            pai[elemento] = pai[pai[elemento]]
+            elemento = pai[elemento]
+        return elemento
 
     def unir_conjuntos(self, elemento_a: int, elemento_b: int) -> bool:
         """
@@ -76,173 +88,290 @@ class ConjuntoDisjunto:
             self.pai[raiz_b] = raiz_a
             if self.rank[raiz_a] == self.rank[raiz_b]:
                 self.rank[raiz_a] += 1
+        self.numero_componentes -= 1
         return True
 
-def algoritmo_kruskal(numero_vertices: int, arestas: List[Tuple[int, int, int]]) -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int, int]], bool]:
+    def union_many(self, elementos_a: np.ndarray, elementos_b: np.ndarray, parar_em_um_componente: bool = False) -> np.ndarray:
+        """
+        Une, em ordem, cada par (elementos_a[i], elementos_b[i]).
+        O resultado é o mesmo de chamar 'unir_conjuntos' par a par, mas a busca e a união
+        são feitas em um único laço, sem o custo de uma chamada de método por par.
+
+        Args:
+            elementos_a (np.ndarray): Primeiros elementos de cada par.
+            elementos_b (np.ndarray): Segundos elementos de cada par.
+            parar_em_um_componente (bool): Se True, interrompe o laço assim que todos os elementos
+                pertencem a um único conjunto; os pares restantes ficam marcados como não unidos.
+
+        Returns:
+            np.ndarray: Máscara booleana indicando, para cada par, se a união foi realizada.
+
+        Raises:
+            ValueError: Se os dois vetores não tiverem o mesmo tamanho.
+        """
+        elementos_a = np.asarray(elementos_a)
+        elementos_b = np.asarray(elementos_b)
+        if len(elementos_a) != len(elementos_b):
+            raise ValueError("Os vetores de elementos devem ter o mesmo tamanho")
+
+        pai = self.pai
+        rank = self.rank
+        unidos = bytearray(len(elementos_a))
+        numero_unioes = 0
+        limite_unioes = self.numero_componentes - 1 if parar_em_um_componente else -1
+        if limite_unioes == 0:
+            return np.frombuffer(unidos, dtype=bool)
+        for posicao, (raiz_a, raiz_b) in enumerate(zip(elementos_a.tolist(), elementos_b.tolist())):
+            while pai[raiz_a] != raiz_a:
+                pai[raiz_a] = pai[pai[raiz_a]]
+                raiz_a = pai[raiz_a]
+            while pai[raiz_b] != raiz_b:
+                pai[raiz_b] = pai[pai[raiz_b]]
+                raiz_b = pai[raiz_b]
+            if raiz_a == raiz_b:
+                continue
+            if rank[raiz_a] < rank[raiz_b]:
+                pai[raiz_a] = raiz_b
+            else:
+                pai[raiz_b] = raiz_a
+                if rank[raiz_a] == rank[raiz_b]:
+                    rank[raiz_a] += 1
+            unidos[posicao] = 1
+            numero_unioes += 1
+            if numero_unioes == limite_unioes:
+                break
+        self.numero_componentes -= numero_unioes
+        return np.frombuffer(unidos, dtype=bool)
+
+    def find_many(self, elementos: np.ndarray) -> np.ndarray:
+        """
+        Encontra a raiz de cada elemento do vetor de forma vetorizada.
+        Sobe todos os elementos um nível por vez (pointer jumping) até que todos alcancem
+        suas raízes e, em seguida, faz os elementos consultados apontarem direto para elas.
+
+        Args:
+            elementos (np.ndarray): Elementos a consultar.
+
+        Returns:
+            np.ndarray: Vetor int32 com o representante (raiz) de cada elemento.
+        """
+        elementos = np.asarray(elementos, dtype=np.int32)
+        pai = self._pai_vetor
+        raizes = pai[elementos]
+        while True:
+            avos = pai[raizes]
+            if np.array_equal(avos, raizes):
+                break
+            raizes = avos
+        pai[elementos] = raizes
+        return raizes
+
+def arestas_para_vetores(arestas: Iterable[Tuple[int, int, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Implementa o algoritmo de Kruskal para encontrar a árvore geradora mínima (MST) de um grafo não dirigido e valorado.
+    Converte uma lista de arestas no formato (origem, destino, peso) para três vetores contíguos do NumPy.
 
     Args:
-        numero_vertices (int): Número de vértices do grafo.
         arestas (list): Lista de tuplas representando as arestas no formato (origem, destino, peso).
 
     Returns:
         tuple: Uma tupla contendo:
-            - arvore_geradora_minima (list): Lista de arestas que compõem a MST.
-            - arestas_circuito (list): Lista de arestas que formariam ciclos e foram removidas.
-            - grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore (sem circuitos).
+            - origens (np.ndarray): Vértices de origem (int32).
+            - destinos (np.ndarray): Vértices de destino (int32).
+            - pesos (np.ndarray): Pesos das arestas, com o tipo inferido pelo NumPy.
     """
-    estrutura_union_find = ConjuntoDisjunto(numero_vertices)
-    arvore_geradora_minima: List[Tuple[int, int, int]] = []
-    arestas_circuito: List[Tuple[int, int, int]] = []
-    arestas_ordenadas = sorted(arestas, key=lambda x: x[2])
-    
-    for vertice_origem, vertice_destino, peso in arestas_ordenadas:
-        if estrutura_union_find.unir_conjuntos(vertice_origem, vertice_destino):
-            arvore_geradora_minima.append((vertice_origem, vertice_destino, peso))
-        else:
-            arestas_circuito.append((vertice_origem, vertice_destino, peso))
-    
-    grafo_original_era_arvore = len(arvore_geradora_minima) == len(arestas)
-    return arvore_geradora_minima, arestas_circuito, grafo_original_era_arvore
+    arestas = list(arestas)
+    origens = np.fromiter((origem for origem, _, _ in arestas), dtype=np.int32, count=len(arestas))
+    destinos = np.fromiter((destino for _, destino, _ in arestas), dtype=np.int32, count=len(arestas))
+    pesos = np.array([peso for _, _, peso in arestas])
+    return origens, destinos, pesos
+
+def indices_para_arestas(arestas: List[Tuple[int, int, int]], indices: np.ndarray) -> List[Tuple[int, int, int]]:
+    """
+    Traduz índices devolvidos pelos motores vetoriais de volta para as tuplas (origem, destino, peso).
+
+    Args:
+        arestas (list): Lista de arestas original.
+        indices (np.ndarray): Índices das arestas desejadas.
+
+    Returns:
+        list: As arestas correspondentes, na ordem dos índices.
+    """
+    return [tuple(arestas[indice]) for indice in np.asarray(indices).tolist()]
+
+MODOS_KRUSKAL = ("completo", "antecipado", "filtrado")
 
-class VisualizadorGrafo(tk.Tk): #TODO: Refatorar para herdar de tk.Tk e remover de dentro dessa arquivo
+class ArestasCircuitoPreguicosas(Sequence):
     """
-    Classe para visualização gráfica do algoritmo de Kruskal usando Tkinter.
+    Sequência das arestas de circuito calculada apenas quando for usada.
 
-    Exibe o grafo original, a árvore geradora mínima (MST) e destaca as arestas removidas (circuitos).
-    Mostra também informações textuais sobre a MST, circuitos e custo total.
+    O tamanho é conhecido de imediato (total de arestas menos as arestas da MST). Os índices das
+    arestas de circuito, em ordem crescente de peso, só são calculados no primeiro acesso aos
+    elementos, de modo que quem precisa apenas da MST não paga por eles.
 
     Args:
-        numero_vertices (int): Número de vértices do grafo.
-        arestas_originais (list): Lista de arestas do grafo original.
-        arvore_geradora_minima (list): Lista de arestas da MST.
-        arestas_circuito (list): Lista de arestas removidas por formarem ciclos.
-        grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore.
+        pesos (np.ndarray): Peso de cada aresta do grafo.
+        indices_mst (np.ndarray): Índices das arestas que compõem a MST.
+        arestas (list, opcional): Arestas originais; quando informadas, os elementos são as tuplas
+            (origem, destino, peso) em vez dos índices.
     """
 
-    def __init__(self, numero_vertices: int, arestas_originais: List[Tuple[int, int, int]], 
-                 arvore_geradora_minima: List[Tuple[int, int, int]], arestas_circuito: List[Tuple[int, int, int]], 
-                 grafo_original_era_arvore: bool):
-        super().__init__()
-        self.title("Kruskal - Visualização Gráfica")
-        self.geometry("900x500")
-        self.numero_vertices = numero_vertices
-        self.arestas_originais = arestas_originais
-        self.arvore_geradora_minima = arvore_geradora_minima
-        self.arestas_circuito = arestas_circuito
-        self.grafo_original_era_arvore = grafo_original_era_arvore
-
-        self.configurar_interface()
-        self.posicoes_vertices = self.calcular_posicoes_vertices(numero_vertices, 180, 200, 200)
-        self.desenhar_grafo(self.canvas_original, arestas_originais, destaque=[])
-        self.desenhar_grafo(self.canvas_mst, arvore_geradora_minima, destaque=arestas_circuito)
-        self.mostrar_informacoes()
-
-    def configurar_interface(self):
-        """
-        Configura os componentes da interface gráfica, incluindo os painéis de desenho dos grafos
-        e a área de informações textuais.
-        """
-        tk.Label(self, text="Grafo Original").pack()
-        self.canvas_original = tk.Canvas(self, width=400, height=400, bg="white")
-        self.canvas_original.pack(side=tk.LEFT, padx=10, pady=10)
-        
-        tk.Label(self, text="Árvore Geradora Mínima (MST)").pack()
-        self.canvas_mst = tk.Canvas(self, width=400, height=400, bg="white")
-        self.canvas_mst.pack(side=tk.LEFT, padx=10, pady=10)
-        
-        self.area_informacoes = tk.Text(self, width=110, height=8)
-        self.area_informacoes.pack(side=tk.BOTTOM, padx=10, pady=10)
-
-    def calcular_posicoes_vertices(self, numero_vertices: int, raio: int, centro_x: int, centro_y: int) -> Dict[int, Tuple[int, int]]:
-        """
-        Calcula as posições dos vértices distribuindo-os em um círculo para visualização no canvas.
+    def __init__(self, pesos: np.ndarray, indices_mst: np.ndarray, arestas: Optional[List[Tuple[int, int, int]]] = None):
+        self._pesos = pesos
+        self._indices_mst = indices_mst
+        self._arestas = arestas
+        self._indices: Optional[np.ndarray] = None
 
-        Args:
-            numero_vertices (int): Número de vértices.
-            raio (int): Raio do círculo.
-            centro_x (int): Coordenada x do centro do círculo.
-            centro_y (int): Coordenada y do centro do círculo.
+    def indices(self) -> np.ndarray:
+        """
+        Calcula (uma única vez) os índices das arestas de circuito, ordenados por peso.
 
         Returns:
-            dict: Dicionário com as posições dos vértices {vertice: (x, y)}.
-        """
-        posicoes = {}
-        angulo_passo = 2 * math.pi / numero_vertices
-        for vertice in range(numero_vertices):
-            angulo = angulo_passo * vertice
-            pos_x = int(centro_x + raio * math.cos(angulo))
-            pos_y = int(centro_y + raio * math.sin(angulo))
-            posicoes[vertice] = (pos_x, pos_y)
-        return posicoes
-
-    def desenhar_grafo(self, canvas: tk.Canvas, arestas: List[Tuple[int, int, int]], destaque: List[Tuple[int, int, int]]):
+            np.ndarray: Índices das arestas que não pertencem à MST.
         """
-        Desenha o grafo (arestas e vértices) no canvas especificado.
-        Arestas presentes na lista 'destaque' são desenhadas em vermelho.
+        if self._indices is None:
+            mascara = np.ones(len(self._pesos), dtype=bool)
+            mascara[self._indices_mst] = False
+            restantes = np.flatnonzero(mascara)
+            self._indices = restantes[np.argsort(self._pesos[restantes], kind="stable")]
+        return self._indices
+
+    def __len__(self) -> int:
+        return len(self._pesos) - len(self._indices_mst)
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return list(self)[posicao]
+        indice = int(self.indices()[posicao])
+        return indice if self._arestas is None else tuple(self._arestas[indice])
+
+    def __iter__(self) -> Iterator:
+        if self._arestas is None:
+            return iter(self.indices().tolist())
+        return (tuple(self._arestas[indice]) for indice in self.indices().tolist())
+
+def _kruskal_filtrado(conjunto: ConjuntoDisjunto, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray, limite_base: int) -> np.ndarray:
+    """
+    Filter-Kruskal: particiona as arestas em torno de um peso pivô, resolve primeiro a parte leve e,
+    antes de ordenar a parte pesada, descarta as arestas cujas extremidades já estão conectadas.
+    A recursão é simulada com uma pilha explícita e termina assim que a árvore está completa.
 
-        Args:
-            canvas (tk.Canvas): Canvas onde o grafo será desenhado.
-            arestas (list): Lista de arestas a serem desenhadas.
-            destaque (list): Lista de arestas a serem destacadas (ex: circuitos).
-        """
-        for origem, destino, peso in arestas:
-            x_origem, y_origem = self.posicoes_vertices[origem]
-            x_destino, y_destino = self.posicoes_vertices[destino]
-            cor = "red" if (origem, destino, peso) in destaque or (destino, origem, peso) in destaque else "black"
-            canvas.create_line(x_origem, y_origem, x_destino, y_destino, fill=cor, width=2 if cor=="red" else 1)
-            self.desenhar_peso_aresta(canvas, x_origem, y_origem, x_destino, y_destino, peso)
-        for vertice, (x, y) in self.posicoes_vertices.items():
-            self.desenhar_vertice(canvas, x, y, vertice)
-
-    def desenhar_vertice(self, canvas: tk.Canvas, x: int, y: int, rotulo: int):
-        """
-        Desenha um vértice (nó) individual no canvas.
+    Args:
+        conjunto (ConjuntoDisjunto): Estrutura Union-Find com um elemento por vértice.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta.
+        limite_base (int): Tamanho abaixo do qual a parte é ordenada e processada diretamente.
 
-        Args:
-            canvas (tk.Canvas): Canvas onde o vértice será desenhado.
-            x (int): Coordenada x do vértice.
-            y (int): Coordenada y do vértice.
-            rotulo (int): Rótulo do vértice.
-        """
-        canvas.create_oval(x-18, y-18, x+18, y+18, fill="lightgray", outline="black", width=2)
-        canvas.create_text(x, y, text=str(rotulo), font=("Arial", 12, "bold"))
+    Returns:
+        np.ndarray: Índices das arestas que compõem a MST, em ordem crescente de peso.
+    """
+    gerador = np.random.default_rng(0)
+    partes_mst: List[np.ndarray] = []
+    pilha = [np.arange(len(pesos))]
+    while pilha and conjunto.numero_componentes > 1:
+        indices = pilha.pop()
+        if len(partes_mst):
+            # Toda aresta já processada é mais leve que as desta parte: as conectadas só fechariam circuitos
+            indices = indices[conjunto.find_many(origens[indices]) != conjunto.find_many(destinos[indices])]
+        if len(indices) > limite_base:
+            pesos_parte = pesos[indices]
+            leves = pesos_parte <= pesos_parte[gerador.integers(len(indices))]
+            if not leves.all():
+                pilha.append(indices[~leves])
+                pilha.append(indices[leves])
+                continue
+        ordem = indices[np.argsort(pesos[indices], kind="stable")]
+        aceitas = conjunto.union_many(origens[ordem], destinos[ordem], parar_em_um_componente=True)
+        partes_mst.append(ordem[aceitas])
+    if not partes_mst:
+        return np.zeros(0, dtype=np.intp)
+    return np.concatenate(partes_mst)
+
+def kruskal_vetorial(numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray,
+                     modo: str = "completo", limite_base: int = 4096) -> Tuple[np.ndarray, Union[np.ndarray, ArestasCircuitoPreguicosas]]:
+    """
+    Motor do algoritmo de Kruskal sobre vetores contíguos (origem, destino, peso).
 
-    def desenhar_peso_aresta(self, canvas: tk.Canvas, x1: int, y1: int, x2: int, y2: int, peso: int):
-        """
-        Desenha o peso de uma aresta no ponto médio entre dois vértices.
+    As arestas são ordenadas com um argsort estável, de modo que arestas de mesmo peso
+    mantêm a ordem de entrada, e a união é feita sobre os vetores int32 de 'ConjuntoDisjunto'.
+    Nenhuma tupla é criada: o resultado são os índices das arestas nos vetores de entrada.
 
-        Args:
-            canvas (tk.Canvas): Canvas onde o peso será desenhado.
-            x1, y1 (int): Coordenadas do primeiro vértice.
-            x2, y2 (int): Coordenadas do segundo vértice.
-            peso (int): Peso da aresta.
-        """
-        ponto_medio_x = (x1 + x2) // 2
-        ponto_medio_y = (y1 + y2) // 2
-        canvas.create_text(ponto_medio_x, ponto_medio_y, text=str(peso), fill="blue", font=("Arial", 10, "bold"))
+    Modos disponíveis (todos produzem a mesma MST):
+        - "completo": ordena e percorre todas as arestas, classificando cada uma.
+        - "antecipado": interrompe a varredura assim que a árvore tem 'numero_vertices - 1' arestas.
+        - "filtrado": Filter-Kruskal, que evita ordenar arestas pesadas que já fecham circuitos.
+    Nos dois últimos, as arestas de circuito são devolvidas como 'ArestasCircuitoPreguicosas'.
 
-    def mostrar_informacoes(self):
-        """
-        Exibe informações textuais sobre a árvore geradora mínima, circuitos removidos
-        e o custo total da MST na área de informações da interface.
-        """
-        self.area_informacoes.insert(tk.END, "=== Resultados do Kruskal ===\n")
-        if self.grafo_original_era_arvore:
-            self.area_informacoes.insert(tk.END, "O grafo original já era uma árvore (não havia circuitos).\n")
-        else:
-            self.area_informacoes.insert(tk.END, f"Circuitos removidos: {len(self.arestas_circuito)}\n")
-            for origem, destino, peso in self.arestas_circuito:
-                self.area_informacoes.insert(tk.END, f"  {origem} --{peso}-- {destino}\n")
-        self.area_informacoes.insert(tk.END, "\nÁrvore Geradora Mínima:\n")
-        custo_total = sum(peso for _, _, peso in self.arvore_geradora_minima)
-        for origem, destino, peso in self.arvore_geradora_minima:
-            self.area_informacoes.insert(tk.END, f"  {origem} --{peso}-- {destino}\n")
-        self.area_informacoes.insert(tk.END, f"\nCusto total: {custo_total}\n")
-        self.area_informacoes.config(state=tk.DISABLED)
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta.
+        modo (str): Um dos valores de 'MODOS_KRUSKAL'.
+        limite_base (int): No modo "filtrado", tamanho da parte a partir do qual ela é particionada.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - indices_mst (np.ndarray): Índices das arestas que compõem a MST, em ordem crescente de peso.
+            - indices_circuito (np.ndarray | ArestasCircuitoPreguicosas): Índices das arestas que formariam ciclos, em ordem crescente de peso.
+
+    Raises:
+        ValueError: Se os três vetores não tiverem o mesmo tamanho ou se o modo for desconhecido.
+    """
+    origens = np.asarray(origens)
+    destinos = np.asarray(destinos)
+    pesos = np.asarray(pesos)
+    if not len(origens) == len(destinos) == len(pesos):
+        raise ValueError("Os vetores de origens, destinos e pesos devem ter o mesmo tamanho")
+    if modo not in MODOS_KRUSKAL:
+        raise ValueError(f"Modo desconhecido: {modo}. Use um de {MODOS_KRUSKAL}")
+
+    conjunto = ConjuntoDisjunto(numero_vertices)
+    if modo == "filtrado":
+        indices_mst = _kruskal_filtrado(conjunto, origens, destinos, pesos, limite_base)
+        return indices_mst, ArestasCircuitoPreguicosas(pesos, indices_mst)
+
+    ordem = np.argsort(pesos, kind="stable")
+    aceitas = conjunto.union_many(origens[ordem], destinos[ordem], parar_em_um_componente=modo == "antecipado")
+    if modo == "antecipado":
+        indices_mst = ordem[aceitas]
+        return indices_mst, ArestasCircuitoPreguicosas(pesos, indices_mst)
+    return ordem[aceitas], ordem[~aceitas]
+
+def algoritmo_kruskal(numero_vertices: int, arestas: List[Tuple[int, int, int]], modo: str = "completo") -> Tuple[List[Tuple[int, int, int]], Sequence, bool]:
+    """
+    Implementa o algoritmo de Kruskal para encontrar a árvore geradora mínima (MST) de um grafo não dirigido e valorado.
+
+    Camada fina sobre 'kruskal_vetorial': converte as tuplas em vetores e traduz os índices de volta para tuplas.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        arestas (list): Lista de tuplas representando as arestas no formato (origem, destino, peso).
+        modo (str): Um dos valores de 'MODOS_KRUSKAL'. Nos modos "antecipado" e "filtrado" as arestas
+            de circuito só são montadas quando acessadas.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - arvore_geradora_minima (list): Lista de arestas que compõem a MST.
+            - arestas_circuito (list | ArestasCircuitoPreguicosas): Arestas que formariam ciclos e foram removidas.
+            - grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore (sem circuitos).
+    """
+    arestas = list(arestas)
+    origens, destinos, pesos = arestas_para_vetores(arestas)
+    indices_mst, indices_circuito = kruskal_vetorial(numero_vertices, origens, destinos, pesos, modo=modo)
+    arvore_geradora_minima = indices_para_arestas(arestas, indices_mst)
+    if isinstance(indices_circuito, ArestasCircuitoPreguicosas):
+        arestas_circuito: Sequence = ArestasCircuitoPreguicosas(pesos, indices_mst, arestas)
+    else:
+        arestas_circuito = indices_para_arestas(arestas, indices_circuito)
+
+    grafo_original_era_arvore = len(arvore_geradora_minima) == len(arestas)
+    return arvore_geradora_minima, arestas_circuito, grafo_original_era_arvore
 
 if __name__ == "__main__":
+    # A janela fica em outro módulo, para que importar kruskal não exija o Tk
+    from visualizador import VisualizadorGrafo
+
     # Configuração do grafo de exemplo
     arestas_exemplo = [
         (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
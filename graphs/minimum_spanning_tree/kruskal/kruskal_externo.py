@@ -0,0 +1,246 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Executar o algoritmo de Kruskal sobre arquivos de arestas maiores que a memória.
+            a. As arestas são lidas do arquivo em blocos de tamanho fixo.
+            b. Cada bloco é ordenado e gravado em disco como uma sequência ordenada (ordenação externa).
+            c. As sequências são intercaladas em fluxo e as arestas passam, em ordem, pelo Union-Find.
+               Se houver mais de 'GRAU_MAXIMO_INTERCALACAO' sequências, elas são antes intercaladas em grupos,
+               em passadas sucessivas, para que cada sequência mantenha um trecho razoável em memória.
+        A memória usada é O(V + tamanho do bloco), independente do número de arestas do arquivo.
+
+    Formato do arquivo de entrada: o formato binário de 'formato_binario.py' ou texto com uma aresta por linha,
+    "origem destino peso", separados por espaços (ou pelo delimitador informado). Linhas vazias e comentários
+    iniciados por '#' são ignorados.
+'''
+
+import os
+import tempfile
+from typing import IO, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from formato_binario import TIPOS_PESO, carregar_arestas_binario, eh_arquivo_binario, ler_cabecalho, ler_texto_em_blocos
+from kruskal import ConjuntoDisjunto
+
+TAMANHO_BLOCO_PADRAO = 1_000_000
+GRAU_MAXIMO_INTERCALACAO = 64
+# Menor trecho de cada sequência mantido em memória durante a intercalação; limita o grau quando o bloco é pequeno
+TRECHO_MINIMO_INTERCALACAO = 1024
+
+def registro_aresta(tipo_peso: np.dtype) -> np.dtype:
+    """
+    Registro gravado nas sequências ordenadas; 'indice' é a posição da aresta no arquivo e desfaz os empates
+    de peso na mesma ordem do argsort estável de 'kruskal_vetorial'. O peso mantém o tipo da entrada:
+    int64 para pesos inteiros, que em float64 perderiam precisão acima de 2**53 e poderiam trocar de ordem.
+    """
+    return np.dtype([("origem", "<i4"), ("destino", "<i4"), ("peso", tipo_peso), ("indice", "<i8")])
+
+def tipo_peso_do_arquivo(caminho_arestas: str, pesos_inteiros: bool = False) -> np.dtype:
+    """
+    Tipo dos pesos de um arquivo de arestas: o do cabeçalho em arquivos binários e, em arquivos texto,
+    int64 se 'pesos_inteiros' for True ou float64 caso contrário.
+    """
+    if eh_arquivo_binario(caminho_arestas):
+        return ler_cabecalho(caminho_arestas)[0]
+    return TIPOS_PESO[1 if pesos_inteiros else 0]
+
+def ler_arestas_em_blocos(caminho_arestas: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                          delimitador: Optional[str] = None, pesos_inteiros: bool = False) -> Iterator[np.ndarray]:
+    """
+    Lê um arquivo de arestas em blocos de até 'tamanho_bloco' arestas.
+    Arquivos no formato de 'formato_binario.py' são lidos por memmap, sem conversão de texto.
+
+    Args:
+        caminho_arestas (str): Caminho do arquivo de arestas, texto ou binário.
+        tamanho_bloco (int): Número máximo de arestas lidas por bloco.
+        delimitador (str, opcional): Separador dos campos de arquivos texto; por padrão, qualquer espaço em branco.
+        pesos_inteiros (bool): Se True, os pesos de arquivos texto são lidos como int64; caso contrário, como float64.
+
+    Yields:
+        np.ndarray: Blocos de registros 'registro_aresta', com o índice global de cada aresta.
+    """
+    tipo_peso = tipo_peso_do_arquivo(caminho_arestas, pesos_inteiros)
+    registro = registro_aresta(tipo_peso)
+    if eh_arquivo_binario(caminho_arestas):
+        grafo = carregar_arestas_binario(caminho_arestas)
+        colunas = ((grafo.origens[inicio:inicio + tamanho_bloco], grafo.destinos[inicio:inicio + tamanho_bloco],
+                    grafo.pesos[inicio:inicio + tamanho_bloco]) for inicio in range(0, len(grafo.pesos), tamanho_bloco))
+    else:
+        colunas = ((campos[:, 0], campos[:, 1], campos[:, 2])
+                   for campos in ler_texto_em_blocos(caminho_arestas, tamanho_bloco, delimitador, tipo_campos=tipo_peso))
+
+    proximo_indice = 0
+    for origens, destinos, pesos in colunas:
+        bloco = np.empty(len(pesos), dtype=registro)
+        bloco["origem"] = origens
+        bloco["destino"] = destinos
+        bloco["peso"] = pesos
+        bloco["indice"] = np.arange(proximo_indice, proximo_indice + len(pesos))
+        proximo_indice += len(pesos)
+        yield bloco
+
+def gerar_sequencias_ordenadas(blocos: Iterator[np.ndarray], diretorio: str) -> Tuple[List[str], int, int]:
+    """
+    Ordena cada bloco por (peso, indice) e o grava em disco como uma sequência ordenada.
+
+    Args:
+        blocos (iterator): Blocos de registros 'registro_aresta'.
+        diretorio (str): Diretório onde as sequências serão gravadas.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - caminhos (list): Caminhos das sequências ordenadas.
+            - numero_arestas (int): Total de arestas lidas.
+            - maior_vertice (int): Maior identificador de vértice encontrado (-1 se não houver arestas).
+    """
+    caminhos: List[str] = []
+    numero_arestas = 0
+    maior_vertice = -1
+    for bloco in blocos:
+        bloco = bloco[np.lexsort((bloco["indice"], bloco["peso"]))]
+        caminho = os.path.join(diretorio, f"sequencia_{len(caminhos):06d}.bin")
+        bloco.tofile(caminho)
+        caminhos.append(caminho)
+        numero_arestas += len(bloco)
+        maior_vertice = max(maior_vertice, int(bloco["origem"].max()), int(bloco["destino"].max()))
+    return caminhos, numero_arestas, maior_vertice
+
+def _ate_o_limite(bloco: np.ndarray, peso, indice: int) -> int:
+    """
+    Quantos registros do início de um bloco ordenado têm chave (peso, indice) menor ou igual à informada.
+    """
+    return int(np.count_nonzero((bloco["peso"] < peso) | ((bloco["peso"] == peso) & (bloco["indice"] <= indice))))
+
+def intercalar_sequencias(caminhos: List[str], registro: np.dtype, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[np.ndarray]:
+    """
+    Intercala sequências ordenadas em disco, produzindo blocos em ordem global de (peso, indice).
+
+    Cada sequência mantém em memória um trecho de 'tamanho_bloco / número de sequências' registros.
+    A cada passo, só saem os registros que não passam da menor "última chave" entre os trechos de
+    sequências ainda não esgotadas, pois nenhum registro futuro pode ser menor que ela.
+
+    Args:
+        caminhos (list): Caminhos das sequências ordenadas.
+        registro (np.dtype): Registro gravado nas sequências, de 'registro_aresta'.
+        tamanho_bloco (int): Número total de registros mantidos em memória.
+
+    Yields:
+        np.ndarray: Blocos de registros 'registro' em ordem crescente de (peso, indice).
+    """
+    por_sequencia = max(tamanho_bloco // max(len(caminhos), 1), 1)
+    arquivos: List[IO[bytes]] = [open(caminho, "rb") for caminho in caminhos]
+    try:
+        trechos = [np.fromfile(arquivo, dtype=registro, count=por_sequencia) for arquivo in arquivos]
+        esgotadas = [len(trecho) < por_sequencia for trecho in trechos]
+        while any(len(trecho) for trecho in trechos):
+            ultimas = [(trecho[-1]["peso"], trecho[-1]["indice"]) for trecho, esgotada in zip(trechos, esgotadas)
+                       if len(trecho) and not esgotada]
+            partes = []
+            for posicao, trecho in enumerate(trechos):
+                quantidade = len(trecho) if not ultimas else _ate_o_limite(trecho, *min(ultimas))
+                partes.append(trecho[:quantidade])
+                trechos[posicao] = trecho[quantidade:]
+                if not len(trechos[posicao]) and not esgotadas[posicao]:
+                    trechos[posicao] = np.fromfile(arquivos[posicao], dtype=registro, count=por_sequencia)
+                    esgotadas[posicao] = len(trechos[posicao]) < por_sequencia
+            bloco = np.concatenate(partes)
+            yield bloco[np.lexsort((bloco["indice"], bloco["peso"]))]
+    finally:
+        for arquivo in arquivos:
+            arquivo.close()
+
+def reduzir_sequencias(caminhos: List[str], diretorio: str, registro: np.dtype, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                       grau_maximo: int = GRAU_MAXIMO_INTERCALACAO) -> List[str]:
+    """
+    Intercala as sequências em grupos de até 'grau_maximo', em passadas sucessivas, até restarem no máximo
+    'grau_maximo' sequências. O grau é reduzido quando o bloco é pequeno, para que cada sequência mantenha
+    ao menos 'TRECHO_MINIMO_INTERCALACAO' registros em memória (e nunca fica abaixo de 2).
+    As sequências intercaladas são apagadas assim que deixam de ser necessárias.
+
+    Args:
+        caminhos (list): Caminhos das sequências ordenadas.
+        diretorio (str): Diretório onde as novas sequências serão gravadas.
+        registro (np.dtype): Registro gravado nas sequências, de 'registro_aresta'.
+        tamanho_bloco (int): Número total de registros mantidos em memória.
+        grau_maximo (int): Número máximo de sequências intercaladas de uma só vez.
+
+    Returns:
+        list: Caminhos das sequências restantes.
+    """
+    grau_maximo = max(2, min(grau_maximo, tamanho_bloco // TRECHO_MINIMO_INTERCALACAO))
+    passada = 0
+    while len(caminhos) > grau_maximo:
+        novos_caminhos: List[str] = []
+        for inicio in range(0, len(caminhos), grau_maximo):
+            grupo = caminhos[inicio:inicio + grau_maximo]
+            caminho = os.path.join(diretorio, f"passada_{passada:02d}_{len(novos_caminhos):06d}.bin")
+            with open(caminho, "wb") as arquivo:
+                for bloco in intercalar_sequencias(grupo, registro, tamanho_bloco):
+                    bloco.tofile(arquivo)
+            for caminho_intercalado in grupo:
+                os.remove(caminho_intercalado)
+            novos_caminhos.append(caminho)
+        caminhos = novos_caminhos
+        passada += 1
+    return caminhos
+
+def kruskal_externo(caminho_arestas: str, numero_vertices: Optional[int] = None, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                    delimitador: Optional[str] = None, diretorio_temporario: Optional[str] = None,
+                    caminho_circuitos: Optional[str] = None, pesos_inteiros: bool = False) -> Tuple[np.ndarray, int, bool]:
+    """
+    Algoritmo de Kruskal em fluxo sobre um arquivo de arestas, com ordenação externa em disco.
+
+    Args:
+        caminho_arestas (str): Caminho do arquivo de arestas, texto ou binário.
+        numero_vertices (int, opcional): Número de vértices; por padrão, o do cabeçalho de arquivos binários
+            ou, em arquivos texto, o maior vértice encontrado mais um.
+        tamanho_bloco (int): Número de arestas mantidas em memória em cada etapa.
+        delimitador (str, opcional): Separador dos campos do arquivo; por padrão, espaços em branco.
+        diretorio_temporario (str, opcional): Onde gravar as sequências ordenadas; por padrão, o diretório temporário do sistema.
+        caminho_circuitos (str, opcional): Se informado, as arestas de circuito são gravadas neste arquivo,
+            no mesmo formato da entrada. Sem ele, a varredura para assim que a árvore está completa.
+        pesos_inteiros (bool): Se True, os pesos de arquivos texto são lidos e ordenados como int64, sem a perda de
+            precisão do float64 acima de 2**53. Arquivos binários usam o tipo gravado no cabeçalho.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - arvore_geradora_minima (np.ndarray): Registros 'registro_aresta' da MST, em ordem crescente de peso.
+            - numero_circuitos (int): Quantidade de arestas que formariam ciclos e foram removidas.
+            - grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore (sem circuitos).
+    """
+    if numero_vertices is None and eh_arquivo_binario(caminho_arestas):
+        _, numero_vertices, _ = ler_cabecalho(caminho_arestas)
+    tipo_peso = tipo_peso_do_arquivo(caminho_arestas, pesos_inteiros)
+    registro = registro_aresta(tipo_peso)
+    with tempfile.TemporaryDirectory(dir=diretorio_temporario) as diretorio:
+        caminhos, numero_arestas, maior_vertice = gerar_sequencias_ordenadas(
+            ler_arestas_em_blocos(caminho_arestas, tamanho_bloco, delimitador, pesos_inteiros), diretorio)
+        caminhos = reduzir_sequencias(caminhos, diretorio, registro, tamanho_bloco)
+        if numero_vertices is None:
+            numero_vertices = maior_vertice + 1
+
+        conjunto = ConjuntoDisjunto(numero_vertices)
+        partes_mst: List[np.ndarray] = []
+        arquivo_circuitos = open(caminho_circuitos, "w", encoding="utf-8") if caminho_circuitos else None
+        blocos = intercalar_sequencias(caminhos, registro, tamanho_bloco)
+        try:
+            for bloco in blocos:
+                aceitas = conjunto.union_many(bloco["origem"], bloco["destino"], parar_em_um_componente=arquivo_circuitos is None)
+                partes_mst.append(bloco[aceitas])
+                if arquivo_circuitos is not None:
+                    rejeitadas = bloco[~aceitas]
+                    np.savetxt(arquivo_circuitos, np.column_stack((rejeitadas["origem"], rejeitadas["destino"], rejeitadas["peso"])),
+                               fmt=("%d", "%d", "%d" if np.issubdtype(tipo_peso, np.integer) else "%.17g"),
+                               delimiter=delimitador or " ")
+                elif conjunto.numero_componentes <= 1:
+                    break
+        finally:
+            blocos.close()
+            if arquivo_circuitos is not None:
+                arquivo_circuitos.close()
+
+    arvore_geradora_minima = np.concatenate(partes_mst) if partes_mst else np.zeros(0, dtype=registro)
+    numero_circuitos = numero_arestas - len(arvore_geradora_minima)
+    return arvore_geradora_minima, numero_circuitos, numero_circuitos == 0
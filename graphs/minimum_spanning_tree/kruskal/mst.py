@@ -0,0 +1,99 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Escolher automaticamente o algoritmo de árvore geradora mínima a partir da densidade E/V² do grafo.
+        Os limites abaixo vêm de 'benchmark_densidade.py':
+            a. Filter-Kruskal vence em grafos esparsos e, com pesos aleatórios, também nos densos.
+            b. Prim O(V²) tem custo que não depende dos pesos nem da ordem das arestas. Em grafos densos
+               com muitos empates em ordem adversária ele chega a ser 8x mais rápido que o Kruskal, por isso
+               é escolhido a partir de E/V² = 0.25, enquanto a matriz de adjacência couber na memória.
+            c. Prim com heap é interpretado em Python e não vence em nenhum cenário medido: fica disponível
+               pelo nome, mas não é escolhido automaticamente.
+            d. Borůvka com vários processos também só é usado quando pedido pelo nome, pois o ganho
+               depende do número de núcleos da máquina.
+'''
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from kruskal import arestas_para_vetores, indices_para_arestas, kruskal_vetorial
+from boruvka import boruvka_vetorial
+from prim import prim_denso_vetorial, prim_heap_vetorial
+
+DENSIDADE_MINIMA_PRIM_DENSO = 0.25
+VERTICES_MAXIMOS_PRIM_DENSO = 4096
+
+ALGORITMOS_MST: Dict[str, Callable[..., Tuple[np.ndarray, Sequence]]] = {
+    "kruskal": lambda numero_vertices, origens, destinos, pesos: kruskal_vetorial(numero_vertices, origens, destinos, pesos, modo="filtrado"),
+    "prim": prim_heap_vetorial,
+    "prim_denso": prim_denso_vetorial,
+    "boruvka": boruvka_vetorial,
+}
+
+def escolher_algoritmo(numero_vertices: int, numero_arestas: int) -> str:
+    """
+    Escolhe o algoritmo de MST pela densidade E/V² do grafo.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        numero_arestas (int): Número de arestas do grafo.
+
+    Returns:
+        str: Uma das chaves de 'ALGORITMOS_MST'.
+    """
+    if numero_vertices == 0 or numero_vertices > VERTICES_MAXIMOS_PRIM_DENSO:
+        return "kruskal"
+    densidade = numero_arestas / (numero_vertices * numero_vertices)
+    return "prim_denso" if densidade >= DENSIDADE_MINIMA_PRIM_DENSO else "kruskal"
+
+def arvore_geradora_minima_vetorial(numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray,
+                                    algoritmo: str = "auto") -> Tuple[np.ndarray, Sequence]:
+    """
+    Calcula a MST sobre vetores (origem, destino, peso) com o algoritmo informado ou escolhido pela densidade.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta.
+        algoritmo (str): "auto" ou uma das chaves de 'ALGORITMOS_MST'.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - indices_mst (np.ndarray): Índices das arestas que compõem a MST.
+            - indices_circuito (ArestasCircuitoPreguicosas): Índices das demais arestas, calculados apenas quando acessados.
+
+    Raises:
+        ValueError: Se o algoritmo for desconhecido.
+    """
+    if algoritmo == "auto":
+        algoritmo = escolher_algoritmo(numero_vertices, len(pesos))
+    if algoritmo not in ALGORITMOS_MST:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo}. Use 'auto' ou um de {tuple(ALGORITMOS_MST)}")
+    return ALGORITMOS_MST[algoritmo](numero_vertices, origens, destinos, pesos)
+
+def algoritmo_arvore_geradora_minima(numero_vertices: int, arestas: List[Tuple[int, int, int]],
+                                     algoritmo: str = "auto") -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int, int]], bool]:
+    """
+    Calcula a MST com o mesmo contrato de retorno de 'algoritmo_kruskal', escolhendo o algoritmo pela densidade.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        arestas (list): Lista de tuplas representando as arestas no formato (origem, destino, peso).
+        algoritmo (str): "auto" ou uma das chaves de 'ALGORITMOS_MST'.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - arvore_geradora_minima (list): Lista de arestas que compõem a MST.
+            - arestas_circuito (list): Lista de arestas que formariam ciclos e foram removidas.
+            - grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore (sem circuitos).
+    """
+    arestas = list(arestas)
+    indices_mst, indices_circuito = arvore_geradora_minima_vetorial(numero_vertices, *arestas_para_vetores(arestas), algoritmo=algoritmo)
+    arvore_geradora_minima = indices_para_arestas(arestas, indices_mst)
+    arestas_circuito = indices_para_arestas(arestas, list(indices_circuito))
+
+    grafo_original_era_arvore = len(arvore_geradora_minima) == len(arestas)
+    return arvore_geradora_minima, arestas_circuito, grafo_original_era_arvore
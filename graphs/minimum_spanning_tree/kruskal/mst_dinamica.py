@@ -0,0 +1,268 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Manter a arvore geradora mínima atualizada quando o grafo muda, sem executar o Kruskal de novo.
+            a. Inserir uma aresta: se ela for mais leve que a aresta mais pesada do caminho entre suas
+               extremidades na árvore, as duas trocam de lugar (propriedade do ciclo).
+            b. Remover uma aresta da árvore (ou aumentar o seu peso): a substituta é a aresta de circuito
+               mais leve que cruza o corte criado (propriedade do corte).
+            c. As arestas de circuito e a indicação de que o grafo já é uma árvore acompanham cada operação.
+        As arestas de circuito ficam indexadas pelos seus vértices. Para achar a substituta, o corte é
+        explorado a partir dos dois lados ao mesmo tempo até o menor deles se esgotar, e só as arestas de
+        circuito incidentes a esse lado são examinadas. Uma inserção custa O(V) (o caminho na árvore); uma
+        remoção custa O(S + C_S), onde S é o tamanho do lado menor do corte e C_S o número de arestas de
+        circuito que tocam esse lado, contra O(E log E) de recalcular tudo.
+'''
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from kruskal import algoritmo_kruskal
+
+Aresta = Tuple[int, int, int]
+
+class ArvoreGeradoraDinamica:
+    """
+    Árvore (ou floresta) geradora mínima que aceita inserções, remoções e mudanças de peso de arestas.
+
+    As arestas são identificadas pelas tuplas (origem, destino, peso), como no retorno de 'algoritmo_kruskal'.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        arvore_geradora_minima (list): Arestas da MST, como devolvidas por 'algoritmo_kruskal'.
+        arestas_circuito (list): Arestas de circuito, como devolvidas por 'algoritmo_kruskal'.
+    """
+
+    def __init__(self, numero_vertices: int, arvore_geradora_minima: List[Aresta], arestas_circuito: List[Aresta]):
+        self.numero_vertices = numero_vertices
+        # Para cada vértice, o vizinho na árvore e a aresta que os liga
+        self._adjacencia: List[Dict[int, Aresta]] = [{} for _ in range(numero_vertices)]
+        # Arestas de circuito com a sua multiplicidade, e as de cada vértice para consultar um corte
+        self._circuito: Dict[Aresta, int] = {}
+        self._incidentes: List[Set[Aresta]] = [set() for _ in range(numero_vertices)]
+        for aresta in arestas_circuito:
+            self._guardar_no_circuito(tuple(aresta))
+        for aresta in arvore_geradora_minima:
+            self._ligar(tuple(aresta))
+
+    @classmethod
+    def a_partir_do_grafo(cls, numero_vertices: int, arestas: List[Aresta]) -> "ArvoreGeradoraDinamica":
+        """
+        Calcula a MST inicial com 'algoritmo_kruskal' e a envolve em uma árvore dinâmica.
+        """
+        arvore_geradora_minima, arestas_circuito, _ = algoritmo_kruskal(numero_vertices, arestas)
+        return cls(numero_vertices, arvore_geradora_minima, list(arestas_circuito))
+
+    @property
+    def arvore_geradora_minima(self) -> List[Aresta]:
+        """
+        Arestas da árvore, cada uma listada uma única vez.
+        """
+        return [aresta for vertice, vizinhos in enumerate(self._adjacencia) for vizinho, aresta in vizinhos.items() if vertice < vizinho]
+
+    @property
+    def arestas_circuito(self) -> List[Aresta]:
+        """
+        Arestas que formariam ciclos, em ordem crescente de peso.
+        """
+        return [aresta for aresta in sorted(self._circuito, key=lambda aresta: (aresta[2], aresta)) for _ in range(self._circuito[aresta])]
+
+    @property
+    def grafo_original_era_arvore(self) -> bool:
+        """
+        Indica se o grafo atual é a própria árvore (não há arestas de circuito).
+        """
+        return not self._circuito
+
+    @property
+    def custo_total(self) -> int:
+        return sum(peso for _, _, peso in self.arvore_geradora_minima)
+
+    def _validar_vertices(self, origem: int, destino: int) -> None:
+        if not (0 <= origem < self.numero_vertices and 0 <= destino < self.numero_vertices):
+            raise ValueError(f"Vértices fora do intervalo [0, {self.numero_vertices}): ({origem}, {destino})")
+
+    def _ligar(self, aresta: Aresta) -> None:
+        origem, destino, _ = aresta
+        self._adjacencia[origem][destino] = aresta
+        self._adjacencia[destino][origem] = aresta
+
+    def _desligar(self, aresta: Aresta) -> None:
+        origem, destino, _ = aresta
+        del self._adjacencia[origem][destino]
+        del self._adjacencia[destino][origem]
+
+    def _guardar_no_circuito(self, aresta: Aresta) -> None:
+        origem, destino, _ = aresta
+        self._circuito[aresta] = self._circuito.get(aresta, 0) + 1
+        self._incidentes[origem].add(aresta)
+        self._incidentes[destino].add(aresta)
+
+    def _retirar_do_circuito(self, aresta: Aresta) -> None:
+        origem, destino, _ = aresta
+        self._circuito[aresta] -= 1
+        if not self._circuito[aresta]:
+            del self._circuito[aresta]
+            self._incidentes[origem].discard(aresta)
+            self._incidentes[destino].discard(aresta)
+
+    def _localizar(self, aresta: Aresta) -> Tuple[Aresta, bool]:
+        """
+        A aresta como está guardada, em qualquer ordem das extremidades, e se ela pertence à árvore.
+
+        Raises:
+            KeyError: Se a aresta não pertencer ao grafo.
+        """
+        origem, destino, peso = aresta
+        self._validar_vertices(origem, destino)
+        da_arvore = self._adjacencia[origem].get(destino)
+        if da_arvore is not None and da_arvore[2] == peso:
+            return da_arvore, True
+        for guardada in (aresta, (destino, origem, peso)):
+            if guardada in self._circuito:
+                return guardada, False
+        raise KeyError(f"A aresta {aresta} não pertence ao grafo")
+
+    def _caminho_na_arvore(self, origem: int, destino: int) -> Optional[List[Aresta]]:
+        """
+        Arestas do caminho entre dois vértices na árvore, com busca em profundidade iterativa.
+
+        Returns:
+            list | None: As arestas do caminho, ou None se os vértices estiverem em componentes diferentes.
+        """
+        chegada: Dict[int, Optional[Aresta]] = {origem: None}
+        pilha = [origem]
+        while pilha and destino not in chegada:
+            vertice = pilha.pop()
+            for vizinho, aresta in self._adjacencia[vertice].items():
+                if vizinho not in chegada:
+                    chegada[vizinho] = aresta
+                    pilha.append(vizinho)
+        if destino not in chegada:
+            return None
+        caminho: List[Aresta] = []
+        vertice = destino
+        while vertice != origem:
+            aresta = chegada[vertice]
+            caminho.append(aresta)
+            vertice = aresta[0] if aresta[1] == vertice else aresta[1]
+        return caminho
+
+    def _lado_menor(self, origem: int, destino: int) -> Set[int]:
+        """
+        Vértices do menor dos dois componentes que contêm 'origem' e 'destino' depois que a aresta entre
+        eles sai da árvore. As duas buscas avançam um vértice por vez, então o custo é o do lado menor.
+        """
+        buscas = [({origem}, [origem]), ({destino}, [destino])]
+        while True:
+            for visitados, pilha in buscas:
+                if not pilha:
+                    return visitados
+                for vizinho in self._adjacencia[pilha.pop()]:
+                    if vizinho not in visitados:
+                        visitados.add(vizinho)
+                        pilha.append(vizinho)
+
+    def _substituta(self, lado: Set[int], peso_maximo: Optional[int] = None) -> Optional[Aresta]:
+        """
+        Retira das arestas de circuito e devolve a mais leve que cruza o corte entre 'lado' e o resto do grafo.
+        Só as arestas de circuito incidentes a 'lado' são examinadas.
+        Com 'peso_maximo', só aceita substitutas estritamente mais leves que ele.
+        """
+        cruzam = (
+            aresta
+            for vertice in lado
+            for aresta in self._incidentes[vertice]
+            if (aresta[0] in lado) != (aresta[1] in lado)
+        )
+        substituta = min(cruzam, key=lambda aresta: (aresta[2], aresta), default=None)
+        if substituta is None or (peso_maximo is not None and substituta[2] >= peso_maximo):
+            return None
+        self._retirar_do_circuito(substituta)
+        return substituta
+
+    def inserir_aresta(self, origem: int, destino: int, peso: int) -> bool:
+        """
+        Insere uma aresta no grafo e atualiza a MST.
+
+        Args:
+            origem (int): Vértice de origem.
+            destino (int): Vértice de destino.
+            peso (int): Peso da aresta.
+
+        Returns:
+            bool: True se a aresta entrou na árvore, False se virou aresta de circuito.
+        """
+        self._validar_vertices(origem, destino)
+        aresta = (origem, destino, peso)
+        caminho = self._caminho_na_arvore(origem, destino) if origem != destino else []
+        if caminho is None:
+            # Extremidades em componentes diferentes: a aresta une duas árvores da floresta
+            self._ligar(aresta)
+            return True
+        mais_pesada = max(caminho, key=lambda aresta_caminho: aresta_caminho[2], default=None)
+        if mais_pesada is None or mais_pesada[2] <= peso:
+            self._guardar_no_circuito(aresta)
+            return False
+        self._desligar(mais_pesada)
+        self._guardar_no_circuito(mais_pesada)
+        self._ligar(aresta)
+        return True
+
+    def remover_aresta(self, aresta: Aresta) -> Optional[Aresta]:
+        """
+        Remove uma aresta do grafo e atualiza a MST.
+
+        Args:
+            aresta (tuple): A aresta (origem, destino, peso) a remover, com as extremidades em qualquer ordem.
+
+        Returns:
+            tuple | None: A aresta de circuito que passou a fazer parte da árvore no lugar da removida, se houver.
+
+        Raises:
+            KeyError: Se a aresta não pertencer ao grafo.
+        """
+        aresta, da_arvore = self._localizar(tuple(aresta))
+        if da_arvore:
+            self._desligar(aresta)
+            substituta = self._substituta(self._lado_menor(aresta[0], aresta[1]))
+            if substituta is not None:
+                self._ligar(substituta)
+            return substituta
+        self._retirar_do_circuito(aresta)
+        return None
+
+    def alterar_peso(self, aresta: Aresta, novo_peso: int) -> Aresta:
+        """
+        Altera o peso de uma aresta e atualiza a MST.
+
+        Args:
+            aresta (tuple): A aresta (origem, destino, peso) atual, com as extremidades em qualquer ordem.
+            novo_peso (int): O novo peso.
+
+        Returns:
+            tuple: A aresta com o novo peso, que passa a identificá-la.
+
+        Raises:
+            KeyError: Se a aresta não pertencer ao grafo.
+        """
+        aresta, da_arvore = self._localizar(tuple(aresta))
+        origem, destino, peso = aresta
+        nova_aresta = (origem, destino, novo_peso)
+        if da_arvore:
+            self._desligar(aresta)
+            if novo_peso > peso:
+                # Uma aresta de circuito mais leve que cruze o corte toma o lugar da aresta encarecida
+                substituta = self._substituta(self._lado_menor(origem, destino), peso_maximo=novo_peso)
+                if substituta is not None:
+                    self._ligar(substituta)
+                    self._guardar_no_circuito(nova_aresta)
+                    return nova_aresta
+            self._ligar(nova_aresta)
+            return nova_aresta
+        self._retirar_do_circuito(aresta)
+        if novo_peso < peso:
+            self.inserir_aresta(origem, destino, novo_peso)
+        else:
+            self._guardar_no_circuito(nova_aresta)
+        return nova_aresta
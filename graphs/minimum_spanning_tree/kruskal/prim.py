@@ -0,0 +1,165 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Implementar o algoritmo de Prim para criar uma arvore geradora mínima, com o mesmo contrato
+        de retorno de 'algoritmo_kruskal' (arestas da MST, arestas de circuito e se o grafo já era uma árvore).
+            a. Prim com fila de prioridade (heap), O(E log V), indicado para grafos esparsos.
+            b. Prim com vetor de distâncias, O(V²), indicado para grafos densos ou completos.
+'''
+
+import heapq
+from typing import List, Tuple
+
+import numpy as np
+
+from kruskal import ArestasCircuitoPreguicosas, arestas_para_vetores, indices_para_arestas
+
+def _validar_vetores(origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converte as entradas para vetores do NumPy e confere se têm o mesmo tamanho.
+
+    Raises:
+        ValueError: Se os três vetores não tiverem o mesmo tamanho.
+    """
+    origens = np.asarray(origens)
+    destinos = np.asarray(destinos)
+    pesos = np.asarray(pesos)
+    if not len(origens) == len(destinos) == len(pesos):
+        raise ValueError("Os vetores de origens, destinos e pesos devem ter o mesmo tamanho")
+    return origens, destinos, pesos
+
+def prim_heap_vetorial(numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray) -> Tuple[np.ndarray, ArestasCircuitoPreguicosas]:
+    """
+    Algoritmo de Prim com fila de prioridade (heap) sobre vetores (origem, destino, peso).
+
+    As arestas incidentes a cada vértice são guardadas em formato CSR (vetores de início e de
+    arestas), montado com um único argsort. Se o grafo for desconexo, uma nova árvore é iniciada
+    em cada componente, produzindo a mesma floresta geradora mínima do Kruskal.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - indices_mst (np.ndarray): Índices das arestas da MST, na ordem em que foram incluídas.
+            - indices_circuito (ArestasCircuitoPreguicosas): Índices das demais arestas, em ordem crescente de peso,
+              calculados apenas quando acessados.
+    """
+    origens, destinos, pesos = _validar_vetores(origens, destinos, pesos)
+    numero_arestas = len(pesos)
+
+    # Cada aresta aparece uma vez na lista de cada extremidade
+    extremidades = np.concatenate((origens, destinos)).astype(np.intp)
+    ordem = np.argsort(extremidades, kind="stable")
+    arestas_incidentes = (ordem % max(numero_arestas, 1)).tolist()
+    inicio = np.searchsorted(extremidades[ordem], np.arange(numero_vertices + 1)).tolist()
+    lista_origens = origens.tolist()
+    lista_destinos = destinos.tolist()
+    lista_pesos = pesos.tolist()
+
+    visitado = bytearray(numero_vertices)
+    indices_mst: List[int] = []
+    for raiz in range(numero_vertices):
+        if visitado[raiz]:
+            continue
+        visitado[raiz] = 1
+        fila = [(lista_pesos[aresta], aresta) for aresta in arestas_incidentes[inicio[raiz]:inicio[raiz + 1]]]
+        heapq.heapify(fila)
+        while fila:
+            _, aresta = heapq.heappop(fila)
+            vertice = lista_destinos[aresta] if visitado[lista_origens[aresta]] else lista_origens[aresta]
+            if visitado[vertice]:
+                continue
+            visitado[vertice] = 1
+            indices_mst.append(aresta)
+            for vizinha in arestas_incidentes[inicio[vertice]:inicio[vertice + 1]]:
+                if not (visitado[lista_origens[vizinha]] and visitado[lista_destinos[vizinha]]):
+                    heapq.heappush(fila, (lista_pesos[vizinha], vizinha))
+
+    indices_mst_vetor = np.array(indices_mst, dtype=np.intp)
+    return indices_mst_vetor, ArestasCircuitoPreguicosas(pesos, indices_mst_vetor)
+
+def prim_denso_vetorial(numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray) -> Tuple[np.ndarray, ArestasCircuitoPreguicosas]:
+    """
+    Algoritmo de Prim O(V²) sobre uma matriz de adjacência, indicado para grafos completos.
+
+    A cada passo escolhe, com um argmin vetorizado, o vértice fora da árvore mais próximo dela e
+    atualiza todas as distâncias de uma vez. Grafos desconexos produzem uma floresta, como no Kruskal.
+    A memória extra é uma única matriz V×V de float64 mais vetores O(V + E).
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (np.ndarray): Peso de cada aresta.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - indices_mst (np.ndarray): Índices das arestas da MST, na ordem em que foram incluídas.
+            - indices_circuito (ArestasCircuitoPreguicosas): Índices das demais arestas, em ordem crescente de peso,
+              calculados apenas quando acessados.
+    """
+    origens, destinos, pesos = _validar_vetores(origens, destinos, pesos)
+    # Uma única matriz V×V; entre arestas paralelas fica o menor peso. Os laços caem na diagonal,
+    # que nunca é lida: o vértice já saiu de 'fora_da_arvore' quando a sua linha é consultada
+    matriz_pesos = np.full((numero_vertices, numero_vertices), np.inf)
+    np.minimum.at(matriz_pesos, (origens, destinos), pesos)
+    np.minimum.at(matriz_pesos, (destinos, origens), pesos)
+
+    distancia = np.full(numero_vertices, np.inf)
+    pai = np.full(numero_vertices, -1, dtype=np.intp)
+    fora_da_arvore = np.ones(numero_vertices, dtype=bool)
+    incluidos: List[int] = []
+    for _ in range(numero_vertices):
+        vertice = int(np.argmin(distancia))
+        if distancia[vertice] == np.inf:
+            # Nenhum vértice alcançável: começa a árvore de um novo componente
+            vertice = int(np.argmax(fora_da_arvore))
+        else:
+            incluidos.append(vertice)
+        fora_da_arvore[vertice] = False
+        distancia[vertice] = np.inf
+        linha = matriz_pesos[vertice]
+        melhora = (linha < distancia) & fora_da_arvore
+        distancia[melhora] = linha[melhora]
+        pai[melhora] = vertice
+
+    # A aresta que liga cada vértice ao pai é, entre as paralelas, a de menor peso e, no empate, a de menor índice
+    ligam_ao_pai = np.flatnonzero((pai[origens] == destinos) | (pai[destinos] == origens))
+    linhas, colunas = origens[ligam_ao_pai], destinos[ligam_ao_pai]
+    candidatas = ligam_ao_pai[pesos[ligam_ao_pai] == matriz_pesos[linhas, colunas]]
+    filhos = np.where(pai[origens[candidatas]] == destinos[candidatas], origens[candidatas], destinos[candidatas])
+    aresta_ligacao = np.full(numero_vertices, np.iinfo(np.intp).max, dtype=np.intp)
+    np.minimum.at(aresta_ligacao, filhos, candidatas)
+    indices_mst = aresta_ligacao[np.array(incluidos, dtype=np.intp)]
+    return indices_mst, ArestasCircuitoPreguicosas(pesos, indices_mst)
+
+def algoritmo_prim(numero_vertices: int, arestas: List[Tuple[int, int, int]], denso: bool = False) -> Tuple[List[Tuple[int, int, int]], ArestasCircuitoPreguicosas, bool]:
+    """
+    Implementa o algoritmo de Prim com o mesmo contrato de retorno de 'algoritmo_kruskal'.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        arestas (list): Lista de tuplas representando as arestas no formato (origem, destino, peso).
+        denso (bool): Se True, usa a versão O(V²) com matriz de adjacência; caso contrário, a versão com heap.
+
+    Returns:
+        tuple: Uma tupla contendo:
+            - arvore_geradora_minima (list): Lista de arestas que compõem a MST.
+            - arestas_circuito (ArestasCircuitoPreguicosas): Arestas que formariam ciclos e foram removidas,
+              montadas apenas quando acessadas.
+            - grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore (sem circuitos).
+    """
+    arestas = list(arestas)
+    motor = prim_denso_vetorial if denso else prim_heap_vetorial
+    origens, destinos, pesos = arestas_para_vetores(arestas)
+    indices_mst, _ = motor(numero_vertices, origens, destinos, pesos)
+    arvore_geradora_minima = indices_para_arestas(arestas, indices_mst)
+    arestas_circuito = ArestasCircuitoPreguicosas(pesos, indices_mst, arestas)
+
+    grafo_original_era_arvore = len(arvore_geradora_minima) == len(arestas)
+    return arvore_geradora_minima, arestas_circuito, grafo_original_era_arvore
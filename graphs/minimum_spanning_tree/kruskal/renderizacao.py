@@ -0,0 +1,375 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Desenhar os grafos do Kruskal sem depender de uma tela, gravando o resultado em SVG ou PNG.
+        A mesma "cena" é usada pela janela Tkinter de 'VisualizadorGrafo', para que os dois modos
+        desenhem exatamente as mesmas coisas.
+            a. As arestas destacadas são procuradas em um conjunto (hash), em O(1) por aresta.
+            b. Regras de nível de detalhe mantêm o desenho legível e barato em grafos grandes:
+                - acima de ARESTAS_MAXIMAS_ROTULOS arestas, os pesos deixam de ser escritos;
+                - acima de VERTICES_MAXIMOS_ROTULOS vértices, eles viram pontos sem rótulo
+                  e, acima de VERTICES_MAXIMOS_PONTOS, deixam de ser desenhados;
+                - acima de ARESTAS_MAXIMAS_INDIVIDUAIS arestas, os vértices são agrupados em
+                  SETORES_AGRUPAMENTO setores do círculo e as arestas entre dois setores viram um
+                  único feixe, mais escuro e mais grosso quanto mais arestas ele representa.
+            c. O PNG é rasterizado com NumPy e codificado com zlib, sem bibliotecas gráficas.
+               Ele só escreve textos numéricos (vértices e pesos); os títulos dos painéis saem apenas no SVG.
+
+    Pela linha de comando (arestas em texto ou no formato de formato_binario.py):
+        ➜ python renderizacao.py arestas.bin resultado.png
+'''
+
+import argparse
+import math
+import struct
+import zlib
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+ARESTAS_MAXIMAS_ROTULOS = 200
+ARESTAS_MAXIMAS_INDIVIDUAIS = 3000
+VERTICES_MAXIMOS_ROTULOS = 60
+VERTICES_MAXIMOS_PONTOS = 5000
+SETORES_AGRUPAMENTO = 96
+
+COR_ARESTA = "#000000"
+COR_DESTAQUE = "#ff0000"
+COR_PESO = "#0000ff"
+COR_VERTICE = "#d3d3d3"
+
+TAMANHO_PAINEL = 400
+MARGEM = 10
+ALTURA_TITULO = 30
+
+class Cena(NamedTuple):
+    """
+    Primitivas de desenho de um grafo, já com as regras de nível de detalhe aplicadas.
+
+    Os segmentos estão na ordem de desenho: feixes mais claros antes dos mais escuros e destaques por último.
+    """
+    segmentos: np.ndarray                               # (n, 4): x1, y1, x2, y2
+    cores: List[str]                                    # cor "#rrggbb" de cada segmento
+    larguras: np.ndarray                                # largura de cada segmento, em pixels
+    rotulos_pesos: List[Tuple[float, float, float, float, object]]  # (x1, y1, x2, y2, peso) das arestas rotuladas
+    vertices: np.ndarray                                # (m, 2): centro de cada vértice desenhado
+    raio_vertice: int
+    rotular_vertices: bool
+
+def posicoes_em_circulo(numero_vertices: int, raio: float, centro_x: float, centro_y: float) -> np.ndarray:
+    """
+    Distribui os vértices em um círculo, como 'VisualizadorGrafo.calcular_posicoes_vertices'.
+
+    Returns:
+        np.ndarray: Matriz (numero_vertices, 2) com as coordenadas (x, y) de cada vértice.
+    """
+    angulos = 2 * math.pi / max(numero_vertices, 1) * np.arange(numero_vertices)
+    return np.column_stack((np.trunc(centro_x + raio * np.cos(angulos)), np.trunc(centro_y + raio * np.sin(angulos))))
+
+def vetores_de_arestas(arestas: Sequence[Tuple[int, int, int]]) -> Tuple[np.ndarray, np.ndarray, list]:
+    """
+    Separa uma lista de tuplas (origem, destino, peso) em vetores de vértices e na lista de pesos originais.
+    """
+    if not len(arestas):
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), []
+    origens, destinos, pesos = zip(*arestas)
+    return np.array(origens, dtype=np.intp), np.array(destinos, dtype=np.intp), list(pesos)
+
+def marcar_destaque(arestas: Sequence[Tuple[int, int, int]], destaque: Iterable[Tuple[int, int, int]]) -> np.ndarray:
+    """
+    Indica quais arestas estão em 'destaque', em qualquer orientação, com uma busca em conjunto por aresta.
+
+    Returns:
+        np.ndarray: Vetor booleano com uma posição por aresta de 'arestas'.
+    """
+    chaves = set()
+    for origem, destino, peso in destaque:
+        chaves.add((origem, destino, peso))
+        chaves.add((destino, origem, peso))
+    if not chaves:
+        return np.zeros(len(arestas), dtype=bool)
+    return np.fromiter(((origem, destino, peso) in chaves for origem, destino, peso in arestas), dtype=bool, count=len(arestas))
+
+def _cor_intensidade(cor: str, intensidade: np.ndarray) -> List[str]:
+    """
+    Mistura 'cor' com o branco: intensidade 1 mantém a cor e 0 resulta em branco.
+    """
+    base = np.array([int(cor[posicao:posicao + 2], 16) for posicao in (1, 3, 5)])
+    canais = np.rint(255 - np.outer(intensidade, 255 - base)).astype(int)
+    return ["#%02x%02x%02x" % tuple(canal) for canal in canais.tolist()]
+
+def _feixes(posicoes: np.ndarray, origens: np.ndarray, destinos: np.ndarray, destacadas: np.ndarray) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """
+    Agrupa as arestas em feixes entre setores do círculo de vértices.
+    """
+    numero_vertices = len(posicoes)
+    setores = min(SETORES_AGRUPAMENTO, numero_vertices)
+    setor_origem = origens * setores // numero_vertices
+    setor_destino = destinos * setores // numero_vertices
+    menor, maior = np.minimum(setor_origem, setor_destino), np.maximum(setor_origem, setor_destino)
+    # Arestas dentro de um mesmo setor não aparecem na escala do desenho
+    entre_setores = menor != maior
+    chaves = (destacadas[entre_setores].astype(np.int64) * setores + menor[entre_setores]) * setores + maior[entre_setores]
+    chaves, quantidades = np.unique(chaves, return_counts=True)
+    destacado, resto = np.divmod(chaves, setores * setores)
+    setor_a, setor_b = np.divmod(resto, setores)
+
+    # Cada setor é representado pelo ponto médio dos seus vértices
+    setor_vertice = np.arange(numero_vertices) * setores // numero_vertices
+    contagem = np.bincount(setor_vertice, minlength=setores)
+    centros = np.column_stack([np.bincount(setor_vertice, weights=posicoes[:, eixo], minlength=setores) / contagem for eixo in (0, 1)])
+
+    escala = np.log1p(quantidades) / math.log1p(max(int(quantidades.max(initial=1)), 1))
+    ordem = np.lexsort((escala, destacado))
+    destacado, setor_a, setor_b, escala = destacado[ordem], setor_a[ordem], setor_b[ordem], escala[ordem]
+    segmentos = np.column_stack((centros[setor_a], centros[setor_b]))
+    intensidade = 0.15 + 0.85 * escala
+    cores = np.empty(len(destacado), dtype=object)
+    cores[destacado == 0] = _cor_intensidade(COR_ARESTA, intensidade[destacado == 0])
+    cores[destacado == 1] = _cor_intensidade(COR_DESTAQUE, intensidade[destacado == 1])
+    return segmentos, list(cores), np.rint(1 + 2 * escala)
+
+def montar_cena(posicoes: np.ndarray, origens: np.ndarray, destinos: np.ndarray, pesos: Sequence,
+                destacadas: Optional[np.ndarray] = None) -> Cena:
+    """
+    Monta a cena de um grafo aplicando as regras de nível de detalhe.
+
+    Args:
+        posicoes (np.ndarray): Matriz (V, 2) com a posição de cada vértice.
+        origens (np.ndarray): Vértices de origem de cada aresta.
+        destinos (np.ndarray): Vértices de destino de cada aresta.
+        pesos (Sequence): Peso de cada aresta (usado nos rótulos).
+        destacadas (np.ndarray, opcional): Vetor booleano com as arestas desenhadas em vermelho.
+
+    Returns:
+        Cena: As primitivas a desenhar.
+    """
+    origens = np.asarray(origens, dtype=np.intp)
+    destinos = np.asarray(destinos, dtype=np.intp)
+    destacadas = np.zeros(len(origens), dtype=bool) if destacadas is None else np.asarray(destacadas, dtype=bool)
+    numero_arestas = len(origens)
+
+    if numero_arestas > ARESTAS_MAXIMAS_INDIVIDUAIS:
+        segmentos, cores, larguras = _feixes(posicoes, origens, destinos, destacadas)
+    else:
+        # Destaques por último, para ficarem por cima
+        ordem = np.argsort(destacadas, kind="stable")
+        segmentos = np.column_stack((posicoes[origens[ordem]], posicoes[destinos[ordem]])).reshape(-1, 4)
+        cores = [COR_DESTAQUE if destacada else COR_ARESTA for destacada in destacadas[ordem].tolist()]
+        larguras = np.where(destacadas[ordem], 2.0, 1.0)
+
+    rotulos_pesos = []
+    if numero_arestas <= ARESTAS_MAXIMAS_ROTULOS:
+        pesos = pesos.tolist() if isinstance(pesos, np.ndarray) else list(pesos)
+        rotulos_pesos = [(*posicoes[origem].tolist(), *posicoes[destino].tolist(), peso)
+                         for origem, destino, peso in zip(origens.tolist(), destinos.tolist(), pesos)]
+
+    numero_vertices = len(posicoes)
+    rotular_vertices = numero_vertices <= VERTICES_MAXIMOS_ROTULOS
+    vertices = posicoes if numero_vertices <= VERTICES_MAXIMOS_PONTOS else np.zeros((0, 2))
+    return Cena(segmentos, cores, larguras, rotulos_pesos, vertices, 18 if rotular_vertices else 2, rotular_vertices)
+
+# Fonte 3x5 para os textos numéricos do PNG
+_FONTE = {
+    "0": ("111", "101", "101", "101", "111"), "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"), "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"), "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"), "7": ("111", "001", "010", "010", "010"),
+    "8": ("111", "101", "111", "101", "111"), "9": ("111", "101", "111", "001", "111"),
+    ".": ("000", "000", "000", "000", "010"), "-": ("000", "000", "111", "000", "000"),
+    "+": ("000", "010", "111", "010", "000"), "e": ("000", "111", "111", "100", "111"),
+}
+
+def _rgb(cor: str) -> Tuple[int, int, int]:
+    return int(cor[1:3], 16), int(cor[3:5], 16), int(cor[5:7], 16)
+
+def _pintar_pixels(imagem: np.ndarray, xs: np.ndarray, ys: np.ndarray, cor: Tuple[int, int, int]) -> None:
+    altura, largura, _ = imagem.shape
+    dentro = (xs >= 0) & (xs < largura) & (ys >= 0) & (ys < altura)
+    imagem[ys[dentro], xs[dentro]] = cor
+
+def _pintar_segmentos(imagem: np.ndarray, segmentos: np.ndarray, cor: Tuple[int, int, int], largura: float) -> None:
+    """
+    Rasteriza, de uma só vez, segmentos de mesma cor e largura amostrando um ponto por pixel ao longo de cada um.
+    """
+    x1, y1, x2, y2 = segmentos.T
+    passos = np.ceil(np.maximum(np.abs(x2 - x1), np.abs(y2 - y1))).astype(np.intp) + 1
+    segmento = np.repeat(np.arange(len(segmentos)), passos)
+    posicao = np.arange(len(segmento)) - np.repeat(np.cumsum(passos) - passos, passos)
+    fracao = posicao / np.maximum(passos[segmento] - 1, 1)
+    xs = np.rint(x1[segmento] + fracao * (x2 - x1)[segmento]).astype(np.intp)
+    ys = np.rint(y1[segmento] + fracao * (y2 - y1)[segmento]).astype(np.intp)
+    espessura = int(largura) // 2
+    for deslocamento_x in range(-espessura, int(largura) - espessura):
+        for deslocamento_y in range(-espessura, int(largura) - espessura):
+            _pintar_pixels(imagem, xs + deslocamento_x, ys + deslocamento_y, cor)
+
+def _pintar_texto(imagem: np.ndarray, x: float, y: float, texto: str, cor: Tuple[int, int, int], escala: int) -> None:
+    """
+    Escreve um texto numérico centrado em (x, y) com a fonte 3x5 ampliada por 'escala'.
+    """
+    largura_texto = (4 * len(texto) - 1) * escala
+    esquerda, topo = int(x - largura_texto / 2), int(y - 5 * escala / 2)
+    bloco_y, bloco_x = np.mgrid[0:escala, 0:escala]
+    for posicao, caractere in enumerate(texto):
+        for linha, bits in enumerate(_FONTE.get(caractere, _FONTE["-"])):
+            for coluna, bit in enumerate(bits):
+                if bit == "1":
+                    origem_x = esquerda + (4 * posicao + coluna) * escala
+                    origem_y = topo + linha * escala
+                    _pintar_pixels(imagem, (bloco_x + origem_x).ravel(), (bloco_y + origem_y).ravel(), cor)
+
+def _rasterizar(paineis: Sequence[Tuple[str, Cena]], largura: int, altura: int) -> np.ndarray:
+    imagem = np.full((altura, largura, 3), 255, dtype=np.uint8)
+    for _, cena in paineis:
+        # Segmentos consecutivos com a mesma cor e largura são rasterizados juntos, preservando a ordem de desenho
+        inicio = 0
+        for fim in range(1, len(cena.cores) + 1):
+            if fim == len(cena.cores) or cena.cores[fim] != cena.cores[inicio] or cena.larguras[fim] != cena.larguras[inicio]:
+                _pintar_segmentos(imagem, cena.segmentos[inicio:fim], _rgb(cena.cores[inicio]), cena.larguras[inicio])
+                inicio = fim
+        for x1, y1, x2, y2, peso in cena.rotulos_pesos:
+            _pintar_texto(imagem, (x1 + x2) // 2, (y1 + y2) // 2, str(peso), _rgb(COR_PESO), 2)
+
+        raio = cena.raio_vertice
+        deslocamento_y, deslocamento_x = np.mgrid[-raio:raio + 1, -raio:raio + 1]
+        distancia = np.hypot(deslocamento_x, deslocamento_y).ravel()
+        centros = np.rint(cena.vertices).astype(np.intp)
+        for mascara, cor in ((distancia <= raio, (0, 0, 0)), (distancia <= raio - 2, _rgb(COR_VERTICE))):
+            if cena.rotular_vertices or cor == (0, 0, 0):
+                _pintar_pixels(imagem, (centros[:, :1] + deslocamento_x.ravel()[mascara]).ravel(),
+                               (centros[:, 1:] + deslocamento_y.ravel()[mascara]).ravel(), cor)
+        if cena.rotular_vertices:
+            for vertice, (x, y) in enumerate(cena.vertices.tolist()):
+                _pintar_texto(imagem, x, y, str(vertice), (0, 0, 0), 2)
+    return imagem
+
+def _gravar_png(caminho: str, imagem: np.ndarray) -> None:
+    altura, largura, _ = imagem.shape
+    # Cada linha começa com o byte do filtro 0 (nenhum)
+    linhas = np.concatenate((np.zeros((altura, 1), dtype=np.uint8), imagem.reshape(altura, -1)), axis=1)
+
+    def bloco(tipo: bytes, conteudo: bytes) -> bytes:
+        return struct.pack(">I", len(conteudo)) + tipo + conteudo + struct.pack(">I", zlib.crc32(tipo + conteudo) & 0xFFFFFFFF)
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(b"\x89PNG\r\n\x1a\n")
+        arquivo.write(bloco(b"IHDR", struct.pack(">IIBBBBB", largura, altura, 8, 2, 0, 0, 0)))
+        arquivo.write(bloco(b"IDAT", zlib.compress(linhas.tobytes(), 6)))
+        arquivo.write(bloco(b"IEND", b""))
+
+def _gravar_svg(caminho: str, paineis: Sequence[Tuple[str, Cena]], largura: int, altura: int, posicoes_titulos: List[float]) -> None:
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{largura}" height="{altura}" viewBox="0 0 {largura} {altura}">\n')
+        arquivo.write(f'<rect width="{largura}" height="{altura}" fill="white"/>\n')
+        for (titulo, cena), centro_titulo in zip(paineis, posicoes_titulos):
+            arquivo.write(f'<text x="{centro_titulo:.1f}" y="{ALTURA_TITULO - 10}" text-anchor="middle" font-family="Arial" font-size="14">{titulo}</text>\n')
+            # Um único <path> por sequência de segmentos com a mesma cor e largura
+            inicio = 0
+            for fim in range(1, len(cena.cores) + 1):
+                if fim == len(cena.cores) or cena.cores[fim] != cena.cores[inicio] or cena.larguras[fim] != cena.larguras[inicio]:
+                    caminho_svg = " ".join("M%.1f %.1fL%.1f %.1f" % tuple(segmento) for segmento in cena.segmentos[inicio:fim].tolist())
+                    arquivo.write(f'<path d="{caminho_svg}" stroke="{cena.cores[inicio]}" stroke-width="{cena.larguras[inicio]:g}" fill="none"/>\n')
+                    inicio = fim
+            for x1, y1, x2, y2, peso in cena.rotulos_pesos:
+                arquivo.write(f'<text x="{(x1 + x2) // 2:.1f}" y="{(y1 + y2) // 2:.1f}" text-anchor="middle" dominant-baseline="middle" '
+                              f'font-family="Arial" font-size="10" font-weight="bold" fill="{COR_PESO}">{peso}</text>\n')
+            preenchimento = COR_VERTICE if cena.rotular_vertices else "black"
+            for vertice, (x, y) in enumerate(cena.vertices.tolist()):
+                arquivo.write(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{cena.raio_vertice}" fill="{preenchimento}" stroke="black" stroke-width="{2 if cena.rotular_vertices else 0}"/>\n')
+                if cena.rotular_vertices:
+                    arquivo.write(f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle" dominant-baseline="middle" '
+                                  f'font-family="Arial" font-size="12" font-weight="bold">{vertice}</text>\n')
+        arquivo.write("</svg>\n")
+
+def _extensao(caminho: str) -> str:
+    """
+    Formato da imagem pela extensão do arquivo.
+
+    Raises:
+        ValueError: Se a extensão não for ".svg" nem ".png".
+    """
+    extensao = caminho.lower().rsplit(".", 1)[-1]
+    if extensao not in ("svg", "png"):
+        raise ValueError(f"Formato de imagem não suportado: {caminho} (use .svg ou .png)")
+    return extensao
+
+def _gravar_paineis(caminho: str, extensao: str, numero_vertices: int, paineis: Sequence, tamanho_painel: int) -> None:
+    largura = len(paineis) * (tamanho_painel + MARGEM) + MARGEM
+    altura = tamanho_painel + ALTURA_TITULO
+    raio = tamanho_painel * 0.45
+    cenas, centros = [], []
+    for numero_painel, (titulo, origens, destinos, pesos, destacadas) in enumerate(paineis):
+        centro_x = MARGEM + numero_painel * (tamanho_painel + MARGEM) + tamanho_painel / 2
+        posicoes = posicoes_em_circulo(numero_vertices, raio, centro_x, ALTURA_TITULO + tamanho_painel / 2)
+        cenas.append((titulo, montar_cena(posicoes, origens, destinos, pesos, destacadas)))
+        centros.append(centro_x)
+    if extensao == "svg":
+        _gravar_svg(caminho, cenas, largura, altura, centros)
+    else:
+        _gravar_png(caminho, _rasterizar(cenas, largura, altura))
+
+def renderizar_vetores(caminho: str, numero_vertices: int, origens: np.ndarray, destinos: np.ndarray, pesos: np.ndarray,
+                       indices_mst: np.ndarray, indices_circuito: Sequence, tamanho_painel: int = TAMANHO_PAINEL) -> None:
+    """
+    Grava o grafo original, com as arestas de circuito em vermelho, e a árvore geradora mínima lado a lado.
+
+    Args:
+        caminho (str): Arquivo de saída, terminado em ".svg" ou ".png".
+        numero_vertices (int): Número de vértices do grafo.
+        origens, destinos, pesos (np.ndarray): Vetores do grafo, como os usados por 'kruskal_vetorial'.
+        indices_mst (np.ndarray): Índices das arestas da MST.
+        indices_circuito (Sequence): Índices das arestas de circuito.
+        tamanho_painel (int): Largura e altura de cada painel, em pixels.
+    """
+    extensao = _extensao(caminho)
+    origens, destinos, pesos = np.asarray(origens), np.asarray(destinos), np.asarray(pesos)
+    indices_mst = np.asarray(indices_mst, dtype=np.intp)
+    destacadas = np.zeros(len(origens), dtype=bool)
+    destacadas[np.asarray(indices_circuito, dtype=np.intp)] = True
+    paineis = [
+        ("Grafo Original", origens, destinos, pesos, destacadas),
+        ("Árvore Geradora Mínima (MST)", origens[indices_mst], destinos[indices_mst], pesos[indices_mst], None),
+    ]
+    _gravar_paineis(caminho, extensao, numero_vertices, paineis, tamanho_painel)
+
+def renderizar_resultado(caminho: str, numero_vertices: int, arestas_originais: List[Tuple[int, int, int]],
+                         arvore_geradora_minima: List[Tuple[int, int, int]], arestas_circuito: Sequence[Tuple[int, int, int]],
+                         tamanho_painel: int = TAMANHO_PAINEL) -> None:
+    """
+    Versão sem tela de 'VisualizadorGrafo': recebe as mesmas listas de arestas de 'algoritmo_kruskal'
+    e grava os dois painéis em SVG ou PNG, com as arestas de circuito destacadas no grafo original.
+    """
+    extensao = _extensao(caminho)
+    origens, destinos, pesos = vetores_de_arestas(arestas_originais)
+    origens_mst, destinos_mst, pesos_mst = vetores_de_arestas(arvore_geradora_minima)
+    paineis = [
+        ("Grafo Original", origens, destinos, pesos, marcar_destaque(arestas_originais, arestas_circuito)),
+        ("Árvore Geradora Mínima (MST)", origens_mst, destinos_mst, pesos_mst, None),
+    ]
+    _gravar_paineis(caminho, extensao, numero_vertices, paineis, tamanho_painel)
+
+def main() -> None:
+    from formato_binario import carregar_arestas_binario, eh_arquivo_binario, ler_texto_em_blocos
+    from mst import arvore_geradora_minima_vetorial
+
+    parser = argparse.ArgumentParser(description="Calcula a MST de uma lista de arestas e grava o desenho em SVG ou PNG.")
+    parser.add_argument("entrada", help="arquivo binário de arestas ou texto com 'origem destino peso' por linha")
+    parser.add_argument("saida", help="imagem de saída (.svg ou .png)")
+    parser.add_argument("--delimitador", default=None, help="separador dos campos do arquivo texto")
+    parser.add_argument("--algoritmo", default="auto", help="algoritmo de MST (padrão: escolhido pela densidade)")
+    argumentos = parser.parse_args()
+
+    if eh_arquivo_binario(argumentos.entrada):
+        numero_vertices, origens, destinos, pesos = carregar_arestas_binario(argumentos.entrada)
+    else:
+        campos = np.concatenate(list(ler_texto_em_blocos(argumentos.entrada, 1_000_000, argumentos.delimitador)) or [np.zeros((0, 3))])
+        origens, destinos, pesos = campos[:, 0].astype(np.int32), campos[:, 1].astype(np.int32), campos[:, 2]
+        numero_vertices = int(campos[:, :2].max(initial=-1)) + 1
+    indices_mst, indices_circuito = arvore_geradora_minima_vetorial(numero_vertices, origens, destinos, pesos, argumentos.algoritmo)
+    renderizar_vetores(argumentos.saida, numero_vertices, origens, destinos, pesos, indices_mst, indices_circuito)
+    print(f"{len(pesos)} arestas desenhadas em {argumentos.saida}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import benchmark_mst
+from benchmark_mst import GERADORES, comparar_com_base, executar_suite, gerar_grafo
+from kruskal import kruskal_vetorial
+
+class TestBenchmarkMst(unittest.TestCase):
+    def test_geradores_produzem_o_tamanho_pedido(self):
+        for nome in GERADORES:
+            with self.subTest(gerador=nome):
+                numero_vertices, origens, destinos, pesos = gerar_grafo(nome, 10_000)
+                self.assertTrue(len(origens) == len(destinos) == len(pesos))
+                self.assertLess(abs(len(pesos) - 10_000), 500)
+                self.assertEqual(origens.dtype, np.int32)
+                self.assertTrue(0 <= origens.min() and max(origens.max(), destinos.max()) < numero_vertices)
+
+    def test_caminho_so_se_completa_na_ultima_aresta(self):
+        numero_vertices, origens, destinos, pesos = gerar_grafo("caminho", 4000)
+        indices_mst, _ = kruskal_vetorial(numero_vertices, origens, destinos, pesos)
+        self.assertEqual(sorted(indices_mst.tolist()), list(range(numero_vertices - 1)))
+        self.assertEqual(pesos.argmax(), 0)
+
+    def test_suite_registra_as_medidas(self):
+        resultados = executar_suite(1000, geradores=["grade", "pesos_iguais"], repeticoes=1, mostrar=False)
+        self.assertTrue(resultados)
+        for caso in resultados:
+            self.assertGreater(caso["segundos"], 0)
+            self.assertGreater(caso["arestas_por_segundo"], 0)
+            self.assertGreaterEqual(caso["pico_memoria_bytes"], 0)
+
+    def test_caso_sem_algoritmo_aplicavel(self):
+        with mock.patch.object(benchmark_mst, "VERTICES_MAXIMOS_PRIM_DENSO", 0):
+            resultados = executar_suite(1000, geradores=["esparso"], algoritmos=["prim_denso"], repeticoes=1, mostrar=False)
+        self.assertEqual(resultados, [])
+
+    def test_pesos_diferentes_entre_algoritmos(self):
+        pesos = iter([1.0, 2.0])
+        def medir_falso(algoritmo, grafo, repeticoes):
+            return {"segundos": 1.0, "pico_memoria_bytes": 0, "arestas_por_segundo": 1.0, "peso_total": next(pesos)}
+        with mock.patch.object(benchmark_mst, "medir", medir_falso):
+            with self.assertRaises(RuntimeError):
+                executar_suite(1000, geradores=["grade"], algoritmos=["kruskal", "prim"], repeticoes=1, mostrar=False)
+
+    def test_regressoes_acima_da_tolerancia(self):
+        base = [{"gerador": "grade", "tamanho": 1000, "algoritmo": "kruskal", "segundos": 1.0, "pico_memoria_bytes": 1000}]
+        dentro = [dict(base[0], segundos=1.2, pico_memoria_bytes=1100)]
+        fora = [dict(base[0], segundos=1.5, pico_memoria_bytes=2000)]
+        sem_referencia = [dict(base[0], algoritmo="prim", segundos=100.0)]
+        self.assertEqual(comparar_com_base(dentro, base, 0.25), [])
+        self.assertEqual(len(comparar_com_base(fora, base, 0.25)), 2)
+        self.assertEqual(comparar_com_base(sem_referencia, base, 0.25), [])
+
+if __name__ == "__main__":
+    unittest.main()
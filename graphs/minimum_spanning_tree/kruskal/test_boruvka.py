@@ -0,0 +1,114 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import multiprocessing
+import unittest
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from unittest import mock
+
+import numpy as np
+
+import boruvka
+from boruvka import boruvka_vetorial
+from kruskal import arestas_para_vetores, kruskal_vetorial
+
+class TestBoruvka(unittest.TestCase):
+    def setUp(self):
+        gerador = np.random.default_rng(13)
+        self.numero_vertices, numero_arestas = 500, 4000
+        self.origens = gerador.integers(0, self.numero_vertices, numero_arestas)
+        self.destinos = gerador.integers(0, self.numero_vertices, numero_arestas)
+        # Pesos com muitos empates: o desempate pelo índice deve reproduzir a MST do Kruskal
+        self.pesos = gerador.integers(0, 10, numero_arestas)
+
+    def test_mesma_mst_do_kruskal(self):
+        indices_mst, _ = kruskal_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos)
+        indices_boruvka, circuitos = boruvka_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos, numero_processos=1)
+        self.assertEqual(indices_boruvka.tolist(), indices_mst.tolist())
+        self.assertEqual(len(indices_boruvka) + len(circuitos), len(self.pesos))
+
+    def test_varios_processos_com_memoria_compartilhada(self):
+        indices_mst, _ = kruskal_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos)
+        with mock.patch.object(boruvka, "ARESTAS_MINIMAS_PARALELO", 0):
+            indices_boruvka, _ = boruvka_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos, numero_processos=2)
+        self.assertEqual(indices_boruvka.tolist(), indices_mst.tolist())
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "a falha precisa ser herdada pelos processos")
+    def test_erro_no_trabalhador_libera_a_memoria_compartilhada(self):
+        nomes = []
+        vetores = []
+        compartilhar = boruvka._compartilhar
+
+        def compartilhar_registrando(vetor, memorias):
+            copia, descritor = compartilhar(vetor, memorias)
+            nomes.append(descritor[0])
+            vetores.append(weakref.ref(copia))
+            return copia, descritor
+
+        with mock.patch.object(boruvka, "ARESTAS_MINIMAS_PARALELO", 0), \
+                mock.patch.object(boruvka, "_compartilhar", compartilhar_registrando), \
+                mock.patch.object(boruvka, "_menores_arestas", side_effect=RuntimeError("falha no trabalhador")):
+            excecao = None
+            # Sem assertRaises, que descarta o traceback: ele é justamente o que poderia reter os vetores
+            try:
+                boruvka_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos, numero_processos=2)
+            except RuntimeError as erro:
+                excecao = erro
+        self.assertIsInstance(excecao, RuntimeError)
+        self.assertEqual(str(excecao), "falha no trabalhador")
+        self.assertIsNotNone(excecao.__traceback__)
+        self.assertEqual([vetor() for vetor in vetores], [None] * 3)
+        self.assertEqual(len(nomes), 3)
+        for nome in nomes:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=nome)
+
+    def test_close_com_erro_nao_impede_liberar_os_demais_blocos(self):
+        nomes = []
+        fechar = SharedMemory.close
+
+        def fechar_com_erro(memoria):
+            nomes.append(memoria.name)
+            fechar(memoria)
+            if len(nomes) == 1:
+                raise OSError("falha no close")
+
+        with mock.patch.object(boruvka, "ARESTAS_MINIMAS_PARALELO", 0), \
+                mock.patch.object(SharedMemory, "close", fechar_com_erro):
+            with self.assertRaisesRegex(OSError, "falha no close"):
+                boruvka_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos, numero_processos=2)
+        self.assertEqual(len(set(nomes)), 3)
+        for nome in nomes:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=nome)
+
+    def test_rodadas_percorrem_so_as_arestas_restantes(self):
+        tamanhos = []
+        menores_arestas = boruvka._menores_arestas
+
+        def menores_arestas_registrando(origens, destinos, pesos, numero_vertices, inicio, fim):
+            tamanhos.append(fim - inicio)
+            return menores_arestas(origens, destinos, pesos, numero_vertices, inicio, fim)
+
+        with mock.patch.object(boruvka, "_menores_arestas", menores_arestas_registrando):
+            indices_boruvka, _ = boruvka_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos, numero_processos=1)
+        lacos = int(np.count_nonzero(self.origens == self.destinos))
+        self.assertEqual(tamanhos[0], len(self.pesos) - lacos)
+        self.assertEqual(tamanhos, sorted(tamanhos, reverse=True))
+        self.assertEqual(len(set(tamanhos)), len(tamanhos))
+        indices_mst, _ = kruskal_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos)
+        self.assertEqual(indices_boruvka.tolist(), indices_mst.tolist())
+
+    def test_grafo_desconexo(self):
+        arestas = [(0, 1, 4), (1, 0, 2), (1, 1, 1), (2, 3, 3), (3, 4, 1), (2, 4, 9)]
+        indices_mst, _ = boruvka_vetorial(6, *arestas_para_vetores(arestas), numero_processos=1)
+        self.assertEqual(sorted(indices_mst.tolist()), [1, 3, 4])
+
+    def test_numero_de_processos_invalido(self):
+        with self.assertRaises(ValueError):
+            boruvka_vetorial(2, np.array([0]), np.array([1]), np.array([1]), numero_processos=0)
+
+if __name__ == "__main__":
+    unittest.main()
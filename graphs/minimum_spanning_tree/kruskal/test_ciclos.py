@@ -0,0 +1,99 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from ciclos import CiclosFundamentais, circuitos_retirados
+from kruskal import arestas_para_vetores, kruskal_vetorial
+
+class TestCiclosFundamentais(unittest.TestCase):
+    def setUp(self):
+        self.arestas = [
+            (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
+            (3, 4, 15), (3, 5, 6), (4, 5, 8), (4, 6, 9), (5, 6, 11)
+        ]
+        self.numero_vertices = 7
+
+    def conferir_ciclo(self, arestas: list, ciclo: list, rejeitada: tuple):
+        # Um circuito fecha: cada vértice aparece um número par de vezes nas extremidades
+        graus = {}
+        for origem, destino, _ in ciclo:
+            graus[origem] = graus.get(origem, 0) + 1
+            graus[destino] = graus.get(destino, 0) + 1
+        self.assertTrue(all(grau == 2 for grau in graus.values()))
+        self.assertEqual(ciclo[-1], rejeitada)
+        self.assertEqual(len(set(ciclo)), len(ciclo))
+
+    def test_circuitos_do_exemplo(self):
+        circuitos = circuitos_retirados(self.numero_vertices, self.arestas)
+        self.assertEqual(len(circuitos), 5)
+        for rejeitada, ciclo, mais_pesada in circuitos:
+            self.conferir_ciclo(self.arestas, ciclo, rejeitada)
+            self.assertEqual(mais_pesada[2], max(peso for _, _, peso in ciclo[:-1]))
+            # Propriedade do ciclo: nenhuma aresta da árvore no circuito é mais pesada que a rejeitada
+            self.assertLessEqual(mais_pesada[2], rejeitada[2])
+        self.assertEqual(circuitos[0][0], (1, 2, 8))
+        self.assertEqual(circuitos[0][1], [(1, 4, 7), (2, 4, 5), (1, 2, 8)])
+
+    def test_lote_aleatorio_igual_ao_percurso_ingenuo(self):
+        gerador = random.Random(9)
+        numero_vertices = 300
+        arestas = [(gerador.randrange(numero_vertices), gerador.randrange(numero_vertices), gerador.random()) for _ in range(2000)]
+        origens, destinos, pesos = arestas_para_vetores(arestas)
+        indices_mst, indices_circuito = kruskal_vetorial(numero_vertices, origens, destinos, pesos)
+        consultas = CiclosFundamentais(numero_vertices, origens, destinos, pesos, indices_mst)
+
+        adjacencia = {vertice: [] for vertice in range(numero_vertices)}
+        for indice in indices_mst.tolist():
+            adjacencia[arestas[indice][0]].append((arestas[indice][1], indice))
+            adjacencia[arestas[indice][1]].append((arestas[indice][0], indice))
+
+        def caminho_ingenuo(origem, destino):
+            chegada = {origem: None}
+            pilha = [origem]
+            while pilha:
+                vertice = pilha.pop()
+                for vizinho, indice in adjacencia[vertice]:
+                    if vizinho not in chegada:
+                        chegada[vizinho] = (vertice, indice)
+                        pilha.append(vizinho)
+            if destino not in chegada:
+                return None
+            caminho = []
+            while destino != origem:
+                destino, indice = chegada[destino]
+                caminho.append(indice)
+            return caminho
+
+        for indice, ciclo, mais_pesada in consultas.ciclos(indices_circuito):
+            caminho = caminho_ingenuo(arestas[indice][0], arestas[indice][1])
+            self.assertEqual(sorted(ciclo[:-1].tolist()), sorted(caminho))
+            self.assertEqual(ciclo[-1], indice)
+            if caminho:
+                self.assertEqual(pesos[mais_pesada], max(pesos[caminho]))
+            else:
+                self.assertEqual(mais_pesada, -1)
+
+    def test_vertices_em_arvores_diferentes(self):
+        origens, destinos, pesos = arestas_para_vetores([(0, 1, 1), (2, 3, 2)])
+        consultas = CiclosFundamentais(4, origens, destinos, pesos, np.array([0, 1]))
+        ancestrais, mais_pesadas = consultas.consultar(np.array([0, 0, 3]), np.array([1, 2, 2]))
+        self.assertEqual(ancestrais[1], -1)
+        self.assertEqual(mais_pesadas.tolist(), [0, -1, 1])
+
+    def test_ciclo_entre_arvores_diferentes_da_floresta(self):
+        # Floresta {0-1, 2-3}; a aresta 2 (1-2) não está nela e liga as duas árvores
+        origens, destinos, pesos = arestas_para_vetores([(0, 1, 1), (2, 3, 2), (1, 2, 3), (0, 1, 4)])
+        consultas = CiclosFundamentais(4, origens, destinos, pesos, np.array([0, 1]))
+        with self.assertRaises(ValueError):
+            consultas.ciclo(2)
+        with self.assertRaises(ValueError):
+            list(consultas.ciclos(np.array([3, 2])))
+        self.assertEqual(consultas.ciclo(3).tolist(), [0, 3])
+
+if __name__ == "__main__":
+    unittest.main()
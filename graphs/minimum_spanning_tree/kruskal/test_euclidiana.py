@@ -0,0 +1,56 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import unittest
+
+import numpy as np
+
+from euclidiana import arestas_grafo_completo, arvore_geradora_minima_euclidiana, k_vizinhos_mais_proximos
+from kruskal import kruskal_vetorial
+
+class TestArvoreEuclidiana(unittest.TestCase):
+    def peso_grafo_completo(self, pontos: np.ndarray) -> float:
+        origens, destinos, pesos = arestas_grafo_completo(pontos)
+        indices_mst, _ = kruskal_vetorial(len(pontos), origens, destinos, pesos)
+        return pesos[indices_mst].sum()
+
+    def test_mesmo_peso_do_grafo_completo(self):
+        gerador = np.random.default_rng(11)
+        conjuntos = {
+            "uniforme_2d": gerador.random((800, 2)),
+            "uniforme_3d": gerador.random((600, 3)),
+            "uniforme_5d": gerador.random((400, 5)),
+            "grade": np.stack(np.meshgrid(np.arange(30), np.arange(25)), axis=-1).reshape(-1, 2).astype(float),
+            "aglomerados": np.concatenate([gerador.normal(centro, 0.01, (200, 2)) for centro in [(0, 0), (5, 5), (10, 0)]]),
+            "repetidos": np.repeat(gerador.random((100, 2)), 4, axis=0),
+            "reta": np.column_stack((gerador.random(400), np.zeros(400))),
+        }
+        for nome, pontos in conjuntos.items():
+            for k in (1, 8):
+                with self.subTest(conjunto=nome, k=k):
+                    origens, destinos, pesos = arvore_geradora_minima_euclidiana(pontos, k)
+                    self.assertEqual(len(pesos), len(pontos) - 1)
+                    self.assertTrue((np.diff(pesos) >= 0).all())
+                    # As arestas ligam todos os pontos, então formam uma árvore
+                    indices_mst, _ = kruskal_vetorial(len(pontos), origens, destinos, pesos)
+                    self.assertEqual(len(indices_mst), len(pontos) - 1)
+                    self.assertAlmostEqual(pesos.sum(), self.peso_grafo_completo(pontos), delta=1e-9)
+
+    def test_k_vizinhos_exatos(self):
+        pontos = np.random.default_rng(12).random((700, 3))
+        _, distancias = k_vizinhos_mais_proximos(pontos, 6)
+        todas = np.sqrt(((pontos[:, None, :] - pontos[None, :, :]) ** 2).sum(axis=2))
+        np.fill_diagonal(todas, np.inf)
+        np.testing.assert_array_equal(distancias, np.sort(todas, axis=1)[:, :6])
+
+    def test_conjuntos_pequenos_e_invalidos(self):
+        self.assertEqual(len(arvore_geradora_minima_euclidiana(np.zeros((0, 2)))[2]), 0)
+        self.assertEqual(len(arvore_geradora_minima_euclidiana(np.zeros((1, 2)))[2]), 0)
+        origens, destinos, pesos = arvore_geradora_minima_euclidiana(np.array([[0.0, 0.0], [3.0, 4.0]]))
+        self.assertEqual((origens.tolist(), destinos.tolist(), pesos.tolist()), ([0], [1], [5.0]))
+        with self.assertRaises(ValueError):
+            arvore_geradora_minima_euclidiana(np.zeros(5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from formato_binario import carregar_arestas_binario, converter_texto_para_binario, gravar_arestas_binario, ler_texto_em_blocos
+from kruskal import arestas_para_vetores, kruskal_vetorial
+from kruskal_externo import kruskal_externo
+
+class TestFormatoBinario(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.arestas = [
+            (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
+            (3, 4, 15), (3, 5, 6), (4, 5, 8), (4, 6, 9), (5, 6, 11)
+        ]
+        self.numero_vertices = 7
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def caminho(self, nome: str) -> str:
+        return os.path.join(self.diretorio.name, nome)
+
+    def test_gravar_e_carregar_sem_copia(self):
+        origens, destinos, pesos = arestas_para_vetores(self.arestas)
+        gravar_arestas_binario(self.caminho("grafo.bin"), self.numero_vertices, origens, destinos, pesos)
+        grafo = carregar_arestas_binario(self.caminho("grafo.bin"))
+        self.assertEqual(grafo.numero_vertices, self.numero_vertices)
+        self.assertIsInstance(grafo.origens, np.memmap)
+        self.assertEqual(grafo.pesos.dtype, np.int64)
+        self.assertEqual(grafo.destinos.tolist(), destinos.tolist())
+        # O grafo carregado pode ser passado diretamente ao motor vetorial
+        indices_mst, _ = kruskal_vetorial(*grafo)
+        self.assertEqual(indices_mst.tolist(), kruskal_vetorial(self.numero_vertices, origens, destinos, pesos)[0].tolist())
+
+    def test_converter_csv(self):
+        with open(self.caminho("grafo.csv"), "w", encoding="utf-8") as arquivo:
+            arquivo.write("# origem,destino,peso\n")
+            arquivo.writelines(f"{origem},{destino},{peso}\n" for origem, destino, peso in self.arestas)
+        grafo = converter_texto_para_binario(self.caminho("grafo.csv"), self.caminho("grafo.bin"), delimitador=",", tamanho_bloco=4)
+        self.assertEqual(grafo.numero_vertices, self.numero_vertices)
+        self.assertEqual(list(zip(grafo.origens.tolist(), grafo.destinos.tolist(), grafo.pesos.tolist())),
+                         [(origem, destino, float(peso)) for origem, destino, peso in self.arestas])
+
+    def test_cabecalho_sem_comentario(self):
+        with open(self.caminho("grafo.csv"), "w", encoding="utf-8") as arquivo:
+            arquivo.write("# exportado pelo sistema\n\norigem,destino,peso\n")
+            arquivo.writelines(f"{origem},{destino},{peso}\n" for origem, destino, peso in self.arestas)
+        grafo = converter_texto_para_binario(self.caminho("grafo.csv"), self.caminho("grafo.bin"), delimitador=",", tamanho_bloco=4)
+        self.assertEqual(list(zip(grafo.origens.tolist(), grafo.destinos.tolist(), grafo.pesos.tolist())),
+                         [(origem, destino, float(peso)) for origem, destino, peso in self.arestas])
+
+        # Sem delimitador, o cabeçalho separado por espaços também é detectado
+        with open(self.caminho("grafo.txt"), "w", encoding="utf-8") as arquivo:
+            arquivo.write("origem destino peso\n0 1 7\n1 2 8\n")
+        self.assertEqual(np.concatenate(list(ler_texto_em_blocos(self.caminho("grafo.txt"), 1))).tolist(), [[0, 1, 7], [1, 2, 8]])
+        with self.assertRaises(ValueError):
+            list(ler_texto_em_blocos(self.caminho("grafo.txt"), 10, pular_cabecalho=False))
+
+    def test_pular_cabecalho_numerico(self):
+        with open(self.caminho("grafo.txt"), "w", encoding="utf-8") as arquivo:
+            arquivo.write("3 11 0\n0 1 7\n1 2 8\n")
+        self.assertEqual(len(np.concatenate(list(ler_texto_em_blocos(self.caminho("grafo.txt"), 10)))), 3)
+        self.assertEqual(np.concatenate(list(ler_texto_em_blocos(self.caminho("grafo.txt"), 10, pular_cabecalho=True))).tolist(),
+                         [[0, 1, 7], [1, 2, 8]])
+
+    def test_kruskal_externo_le_arquivo_binario(self):
+        origens, destinos, pesos = arestas_para_vetores(self.arestas)
+        gravar_arestas_binario(self.caminho("grafo.bin"), 9, origens, destinos, pesos)
+        mst, numero_circuitos, _ = kruskal_externo(self.caminho("grafo.bin"), tamanho_bloco=3)
+        self.assertEqual(mst["indice"].tolist(), kruskal_vetorial(self.numero_vertices, origens, destinos, pesos)[0].tolist())
+        # Os vértices isolados 7 e 8 vêm do cabeçalho e impedem a árvore de ficar completa
+        self.assertEqual(numero_circuitos, len(self.arestas) - (self.numero_vertices - 1))
+
+    def test_arquivo_invalido(self):
+        with open(self.caminho("texto.txt"), "w", encoding="utf-8") as arquivo:
+            arquivo.write("0 1 1\n")
+        with self.assertRaises(ValueError):
+            carregar_arestas_binario(self.caminho("texto.txt"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,12 @@
     Autor: Fernando de Souza Teixeira
 """
 
+import sys
 import unittest
 
-from kruskal import algoritmo_kruskal
+import numpy as np
+
+from kruskal import MODOS_KRUSKAL, ConjuntoDisjunto, algoritmo_kruskal, arestas_para_vetores, kruskal_vetorial
 
 class TestKruskal(unittest.TestCase):
     def test_grafo_ja_e_arvore(self):
@@ -71,5 +74,118 @@ class TestKruskal(unittest.TestCase):
         self.assertEqual(circuitos, [])
         self.assertTrue(eh_arvore)
 
+class TestKruskalVetorial(unittest.TestCase):
+    def setUp(self):
+        self.arestas = [
+            (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
+            (3, 4, 15), (3, 5, 6), (4, 5, 8), (4, 6, 9), (5, 6, 11)
+        ]
+        self.numero_vertices = 7
+
+    def test_retorna_indices(self):
+        """
+        O motor vetorial deve devolver vetores de índices que particionam as arestas de entrada.
+        """
+        indices_mst, indices_circuito = kruskal_vetorial(self.numero_vertices, *arestas_para_vetores(self.arestas))
+        self.assertIsInstance(indices_mst, np.ndarray)
+        self.assertEqual(len(indices_mst), self.numero_vertices - 1)
+        self.assertEqual(sorted(indices_mst.tolist() + indices_circuito.tolist()), list(range(len(self.arestas))))
+        _, _, pesos = arestas_para_vetores(self.arestas)
+        self.assertEqual(int(pesos[indices_mst].sum()), 39)
+
+    def test_mesmo_resultado_da_api_de_tuplas(self):
+        """
+        A API de tuplas deve devolver exatamente as arestas apontadas pelos índices do motor vetorial.
+        """
+        mst, circuitos, _ = algoritmo_kruskal(self.numero_vertices, self.arestas)
+        indices_mst, indices_circuito = kruskal_vetorial(self.numero_vertices, *arestas_para_vetores(self.arestas))
+        self.assertEqual(mst, [self.arestas[i] for i in indices_mst])
+        self.assertEqual(circuitos, [self.arestas[i] for i in indices_circuito])
+
+    def test_modos_produzem_o_mesmo_resultado(self):
+        """
+        Os modos antecipado e filtrado devem devolver a mesma MST e, quando pedidas, as mesmas
+        arestas de circuito que o modo completo, inclusive com muitos pesos repetidos.
+        """
+        gerador = np.random.default_rng(7)
+        numero_vertices, numero_arestas = 300, 20_000
+        origens = gerador.integers(0, numero_vertices, numero_arestas)
+        destinos = gerador.integers(0, numero_vertices, numero_arestas)
+        pesos = gerador.integers(0, 20, numero_arestas)
+        indices_mst, indices_circuito = kruskal_vetorial(numero_vertices, origens, destinos, pesos)
+        for modo in MODOS_KRUSKAL[1:]:
+            with self.subTest(modo=modo):
+                mst_modo, circuito_modo = kruskal_vetorial(numero_vertices, origens, destinos, pesos, modo=modo, limite_base=64)
+                self.assertEqual(mst_modo.tolist(), indices_mst.tolist())
+                self.assertEqual(len(circuito_modo), len(indices_circuito))
+                self.assertEqual(list(circuito_modo), indices_circuito.tolist())
+
+    def test_circuitos_preguicosos_na_api_de_tuplas(self):
+        mst, circuitos, eh_arvore = algoritmo_kruskal(self.numero_vertices, self.arestas)
+        for modo in MODOS_KRUSKAL[1:]:
+            with self.subTest(modo=modo):
+                mst_modo, circuitos_modo, eh_arvore_modo = algoritmo_kruskal(self.numero_vertices, self.arestas, modo=modo)
+                self.assertEqual(mst_modo, mst)
+                self.assertEqual(list(circuitos_modo), circuitos)
+                self.assertIn(circuitos[0], circuitos_modo)
+                self.assertEqual(eh_arvore_modo, eh_arvore)
+
+    def test_modo_desconhecido(self):
+        with self.assertRaises(ValueError):
+            kruskal_vetorial(2, np.array([0]), np.array([1]), np.array([1]), modo="inexistente")
+
+    def test_vetores_de_tamanhos_diferentes(self):
+        with self.assertRaises(ValueError):
+            kruskal_vetorial(3, np.array([0, 1]), np.array([1]), np.array([1, 2]))
+
+class TestConjuntoDisjunto(unittest.TestCase):
+    def test_contador_de_componentes(self):
+        conjunto = ConjuntoDisjunto(5)
+        self.assertEqual(conjunto.numero_componentes, 5)
+        self.assertTrue(conjunto.unir_conjuntos(0, 1))
+        self.assertFalse(conjunto.unir_conjuntos(1, 0))
+        self.assertEqual(conjunto.numero_componentes, 4)
+
+    def test_caminho_longo_sem_recursao(self):
+        """
+        Uma cadeia de pais mais profunda que o limite de recursão deve ser consultada e unida sem erro.
+        A união por rank nunca monta essa cadeia, então ela é escrita diretamente no vetor 'pai'.
+        """
+        numero_elementos = 4 * sys.getrecursionlimit()
+        raiz = numero_elementos - 1
+
+        def cadeia():
+            conjunto = ConjuntoDisjunto(numero_elementos)
+            conjunto._pai_vetor[:-1] = np.arange(1, numero_elementos)
+            conjunto.numero_componentes = 1
+            return conjunto
+
+        conjunto = cadeia()
+        self.assertEqual(conjunto.encontrar_raiz(0), raiz)
+        # A compressão de caminho deixa o primeiro elemento mais perto da raiz
+        self.assertNotEqual(conjunto.pai[0], 1)
+
+        conjunto = cadeia()
+        raizes = conjunto.find_many(np.arange(numero_elementos))
+        self.assertTrue((raizes == raiz).all())
+
+        conjunto = cadeia()
+        self.assertFalse(conjunto.unir_conjuntos(0, raiz))
+        self.assertFalse(conjunto.union_many(np.array([0]), np.array([raiz])).any())
+
+    def test_operacoes_em_lote_equivalem_as_individuais(self):
+        pares_a = np.array([0, 2, 1, 4, 3, 6])
+        pares_b = np.array([1, 3, 0, 5, 2, 0])
+        em_lote = ConjuntoDisjunto(7)
+        individual = ConjuntoDisjunto(7)
+        unidos = em_lote.union_many(pares_a, pares_b)
+        esperado = [individual.unir_conjuntos(a, b) for a, b in zip(pares_a.tolist(), pares_b.tolist())]
+        self.assertEqual(unidos.tolist(), esperado)
+        self.assertEqual(em_lote.numero_componentes, individual.numero_componentes)
+        self.assertEqual(
+            em_lote.find_many(np.arange(7)).tolist(),
+            [individual.encontrar_raiz(elemento) for elemento in range(7)],
+        )
+
 if __name__ == "__main__":
     unittest.main()
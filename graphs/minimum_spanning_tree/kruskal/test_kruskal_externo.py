@@ -0,0 +1,82 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from formato_binario import gravar_arestas_binario
+from kruskal import kruskal_vetorial
+from kruskal_externo import kruskal_externo
+
+class TestKruskalExterno(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        gerador = np.random.default_rng(17)
+        self.numero_vertices, numero_arestas = 300, 5000
+        self.origens = gerador.integers(0, self.numero_vertices, numero_arestas)
+        self.destinos = gerador.integers(0, self.numero_vertices, numero_arestas)
+        self.pesos = gerador.integers(0, 20, numero_arestas)
+        self.caminho_arestas = os.path.join(self.diretorio.name, "arestas.txt")
+        with open(self.caminho_arestas, "w", encoding="utf-8") as arquivo:
+            arquivo.write("# origem destino peso\n")
+            np.savetxt(arquivo, np.column_stack((self.origens, self.destinos, self.pesos)), fmt="%d")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_mesma_mst_com_varias_sequencias(self):
+        """
+        Com blocos pequenos o arquivo vira várias sequências, intercaladas em mais de uma passada;
+        a MST deve ser a mesma do Kruskal em memória, inclusive com pesos repetidos.
+        """
+        indices_mst, indices_circuito = kruskal_vetorial(self.numero_vertices, self.origens, self.destinos, self.pesos)
+        for tamanho_bloco in (100, 1000, 10_000):
+            with self.subTest(tamanho_bloco=tamanho_bloco):
+                mst, numero_circuitos, eh_arvore = kruskal_externo(self.caminho_arestas, tamanho_bloco=tamanho_bloco)
+                self.assertEqual(mst["indice"].tolist(), indices_mst.tolist())
+                self.assertEqual(numero_circuitos, len(indices_circuito))
+                self.assertFalse(eh_arvore)
+
+    def test_grava_arestas_de_circuito(self):
+        caminho_circuitos = os.path.join(self.diretorio.name, "circuitos.txt")
+        _, numero_circuitos, _ = kruskal_externo(self.caminho_arestas, tamanho_bloco=500, caminho_circuitos=caminho_circuitos)
+        circuitos = np.loadtxt(caminho_circuitos, ndmin=2)
+        self.assertEqual(len(circuitos), numero_circuitos)
+
+    def test_arquivo_csv_que_ja_e_arvore(self):
+        caminho = os.path.join(self.diretorio.name, "arvore.csv")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write("0,1,1\n1,2,2\n2,3,3\n")
+        mst, numero_circuitos, eh_arvore = kruskal_externo(caminho, delimitador=",")
+        self.assertEqual([(int(o), int(d), float(p)) for o, d, p, _ in mst.tolist()], [(0, 1, 1.0), (1, 2, 2.0), (2, 3, 3.0)])
+        self.assertEqual(numero_circuitos, 0)
+        self.assertTrue(eh_arvore)
+
+    def test_pesos_inteiros_acima_de_2_elevado_a_53(self):
+        """
+        Em float64 os três pesos viram 2**53 e o empate pelo índice escolheria as arestas 0 e 1;
+        a MST correta usa as duas arestas de peso exato 2**53.
+        """
+        origens, destinos = np.array([0, 1, 0]), np.array([1, 2, 2])
+        pesos = np.array([2**53 + 1, 2**53, 2**53], dtype=np.int64)
+        caminho_texto = os.path.join(self.diretorio.name, "grande.txt")
+        np.savetxt(caminho_texto, np.column_stack((origens, destinos, pesos)), fmt="%d")
+        caminho_binario = os.path.join(self.diretorio.name, "grande.bin")
+        gravar_arestas_binario(caminho_binario, 3, origens, destinos, pesos)
+        caminho_circuitos = os.path.join(self.diretorio.name, "circuitos.txt")
+        self.assertEqual(kruskal_vetorial(3, origens, destinos, pesos)[0].tolist(), [1, 2])
+        for caminho in (caminho_texto, caminho_binario):
+            with self.subTest(caminho=caminho):
+                mst, _, _ = kruskal_externo(caminho, pesos_inteiros=True, caminho_circuitos=caminho_circuitos)
+                self.assertEqual(mst["indice"].tolist(), [1, 2])
+                self.assertEqual(mst["peso"].dtype, np.dtype("<i8"))
+                self.assertEqual(mst["peso"].tolist(), [2**53, 2**53])
+                with open(caminho_circuitos, encoding="utf-8") as arquivo:
+                    self.assertEqual(arquivo.read().split(), ["0", "1", str(2**53 + 1)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import random
+import unittest
+
+from kruskal import algoritmo_kruskal
+from mst_dinamica import ArvoreGeradoraDinamica
+
+class TestArvoreGeradoraDinamica(unittest.TestCase):
+    def setUp(self):
+        self.arestas = [
+            (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
+            (3, 4, 15), (3, 5, 6), (4, 5, 8), (4, 6, 9), (5, 6, 11)
+        ]
+        self.numero_vertices = 7
+
+    def conferir_com_kruskal(self, arvore: ArvoreGeradoraDinamica, arestas: list):
+        mst, circuitos, eh_arvore = algoritmo_kruskal(arvore.numero_vertices, arestas)
+        self.assertEqual(arvore.custo_total, sum(peso for _, _, peso in mst))
+        self.assertEqual(len(arvore.arvore_geradora_minima), len(mst))
+        self.assertEqual(sorted(arvore.arvore_geradora_minima + arvore.arestas_circuito), sorted(arestas))
+        self.assertEqual(len(arvore.arestas_circuito), len(circuitos))
+        self.assertEqual(arvore.grafo_original_era_arvore, eh_arvore)
+
+    def test_inserir_aresta_mais_leve_troca_a_mais_pesada_do_caminho(self):
+        arvore = ArvoreGeradoraDinamica.a_partir_do_grafo(self.numero_vertices, self.arestas)
+        self.assertTrue(arvore.inserir_aresta(5, 6, 1))
+        self.assertIn((4, 6, 9), arvore.arestas_circuito)
+        self.assertFalse(arvore.inserir_aresta(0, 6, 100))
+        self.conferir_com_kruskal(arvore, self.arestas + [(5, 6, 1), (0, 6, 100)])
+
+    def test_remover_aresta_da_arvore_usa_substituta(self):
+        arvore = ArvoreGeradoraDinamica.a_partir_do_grafo(self.numero_vertices, self.arestas)
+        self.assertEqual(arvore.remover_aresta((4, 6, 9)), (5, 6, 11))
+        self.conferir_com_kruskal(arvore, [aresta for aresta in self.arestas if aresta != (4, 6, 9)])
+
+    def test_grafo_vira_arvore_e_floresta(self):
+        arvore = ArvoreGeradoraDinamica.a_partir_do_grafo(3, [(0, 1, 1), (1, 2, 2), (2, 0, 3)])
+        self.assertFalse(arvore.grafo_original_era_arvore)
+        self.assertIsNone(arvore.remover_aresta((2, 0, 3)))
+        self.assertTrue(arvore.grafo_original_era_arvore)
+        self.assertIsNone(arvore.remover_aresta((0, 1, 1)))
+        self.assertEqual(arvore.arvore_geradora_minima, [(1, 2, 2)])
+        with self.assertRaises(KeyError):
+            arvore.remover_aresta((0, 1, 1))
+
+    def test_extremidades_em_qualquer_ordem(self):
+        arvore = ArvoreGeradoraDinamica.a_partir_do_grafo(self.numero_vertices, self.arestas)
+        self.assertEqual(arvore.remover_aresta((6, 4, 9)), (5, 6, 11))
+        self.assertIsNone(arvore.remover_aresta((3, 1, 9)))
+        self.assertEqual(arvore.alterar_peso((5, 3, 6), 2), (3, 5, 2))
+        restantes = [aresta for aresta in self.arestas if aresta not in [(4, 6, 9), (1, 3, 9), (3, 5, 6)]]
+        self.conferir_com_kruskal(arvore, restantes + [(3, 5, 2)])
+        with self.assertRaises(KeyError):
+            arvore.remover_aresta((6, 4, 9))
+
+    def test_sequencia_aleatoria_de_atualizacoes(self):
+        """
+        Após cada inserção, remoção ou mudança de peso, o custo deve ser igual ao de recalcular com Kruskal.
+        """
+        gerador = random.Random(3)
+        numero_vertices = 30
+        arestas = [(gerador.randrange(numero_vertices), gerador.randrange(numero_vertices), gerador.randrange(50)) for _ in range(60)]
+        arvore = ArvoreGeradoraDinamica.a_partir_do_grafo(numero_vertices, arestas)
+        for _ in range(300):
+            operacao = gerador.random()
+            if operacao < 0.4 or not arestas:
+                aresta = (gerador.randrange(numero_vertices), gerador.randrange(numero_vertices), gerador.randrange(50))
+                arvore.inserir_aresta(*aresta)
+                arestas.append(aresta)
+            elif operacao < 0.7:
+                origem, destino, peso = arestas.pop(gerador.randrange(len(arestas)))
+                arvore.remover_aresta((destino, origem, peso) if gerador.random() < 0.5 else (origem, destino, peso))
+            else:
+                posicao = gerador.randrange(len(arestas))
+                arestas[posicao] = arvore.alterar_peso(arestas[posicao], gerador.randrange(50))
+            self.conferir_com_kruskal(arvore, arestas)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from kruskal import algoritmo_kruskal, kruskal_vetorial
+from mst import ALGORITMOS_MST, algoritmo_arvore_geradora_minima, escolher_algoritmo
+from prim import algoritmo_prim, prim_denso_vetorial
+
+class TestPrim(unittest.TestCase):
+    def setUp(self):
+        self.arestas = [
+            (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
+            (3, 4, 15), (3, 5, 6), (4, 5, 8), (4, 6, 9), (5, 6, 11)
+        ]
+        self.numero_vertices = 7
+
+    def test_mesmo_contrato_do_kruskal(self):
+        """
+        Com pesos distintos a MST é única: Prim deve devolver as mesmas arestas e circuitos que o Kruskal.
+        """
+        arestas = [(origem, destino, peso * 100 + indice) for indice, (origem, destino, peso) in enumerate(self.arestas)]
+        mst, circuitos, eh_arvore = algoritmo_kruskal(self.numero_vertices, arestas)
+        for denso in (False, True):
+            with self.subTest(denso=denso):
+                mst_prim, circuitos_prim, eh_arvore_prim = algoritmo_prim(self.numero_vertices, arestas, denso=denso)
+                self.assertEqual(set(mst_prim), set(mst))
+                self.assertEqual(list(circuitos_prim), circuitos)
+                self.assertEqual(eh_arvore_prim, eh_arvore)
+
+    def test_grafo_ja_e_arvore(self):
+        arestas = [(0, 1, 1), (1, 2, 2), (2, 3, 3)]
+        for denso in (False, True):
+            with self.subTest(denso=denso):
+                mst, circuitos, eh_arvore = algoritmo_prim(4, arestas, denso=denso)
+                self.assertEqual(set(mst), set(arestas))
+                self.assertEqual(list(circuitos), [])
+                self.assertTrue(eh_arvore)
+
+    def test_grafo_desconexo_com_lacos_e_arestas_paralelas(self):
+        """
+        Prim deve produzir a mesma floresta de Kruskal, ignorando laços e ficando com a aresta paralela mais leve.
+        """
+        arestas = [(0, 1, 4), (1, 0, 2), (1, 1, 1), (2, 3, 3), (3, 4, 1), (2, 4, 9)]
+        mst, _, _ = algoritmo_kruskal(6, arestas)
+        for denso in (False, True):
+            with self.subTest(denso=denso):
+                mst_prim, circuitos_prim, eh_arvore_prim = algoritmo_prim(6, arestas, denso=denso)
+                self.assertEqual(set(mst_prim), set(mst))
+                self.assertEqual(len(circuitos_prim), 3)
+                self.assertFalse(eh_arvore_prim)
+
+    def test_todos_os_algoritmos_tem_o_mesmo_peso(self):
+        gerador = np.random.default_rng(11)
+        numero_vertices, numero_arestas = 200, 5000
+        origens = gerador.integers(0, numero_vertices, numero_arestas)
+        destinos = gerador.integers(0, numero_vertices, numero_arestas)
+        pesos = gerador.integers(0, 30, numero_arestas)
+        indices_mst, _ = kruskal_vetorial(numero_vertices, origens, destinos, pesos)
+        for nome, algoritmo in ALGORITMOS_MST.items():
+            with self.subTest(algoritmo=nome):
+                indices_algoritmo, circuitos = algoritmo(numero_vertices, origens, destinos, pesos)
+                self.assertEqual(int(pesos[indices_algoritmo].sum()), int(pesos[indices_mst].sum()))
+                self.assertEqual(len(indices_algoritmo) + len(circuitos), numero_arestas)
+
+    def test_prim_denso_escolhe_a_paralela_mais_leve_de_menor_indice(self):
+        origens = np.array([0, 1, 0, 2, 1, 2, 2])
+        destinos = np.array([1, 0, 1, 2, 2, 1, 1])
+        pesos = np.array([5, 3, 3, 0, 4, 4, 9])
+        indices_mst, circuitos = prim_denso_vetorial(3, origens, destinos, pesos)
+        self.assertEqual(indices_mst.tolist(), [1, 4])
+        self.assertEqual(len(circuitos), 5)
+
+    def test_prim_denso_usa_uma_unica_matriz(self):
+        gerador = np.random.default_rng(5)
+        numero_vertices, numero_arestas = 512, 50_000
+        origens = gerador.integers(0, numero_vertices, numero_arestas)
+        destinos = gerador.integers(0, numero_vertices, numero_arestas)
+        pesos = gerador.random(numero_arestas)
+        tracemalloc.start()
+        try:
+            indices_mst, _ = prim_denso_vetorial(numero_vertices, origens, destinos, pesos)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(pico, 1.5 * numero_vertices * numero_vertices * 8)
+        self.assertEqual(sorted(indices_mst.tolist()), sorted(kruskal_vetorial(numero_vertices, origens, destinos, pesos)[0].tolist()))
+
+class TestEscolhaDeAlgoritmo(unittest.TestCase):
+    def test_escolha_pela_densidade(self):
+        self.assertEqual(escolher_algoritmo(1000, 5000), "kruskal")
+        self.assertEqual(escolher_algoritmo(1000, 1000 * 999 // 2), "prim_denso")
+        self.assertEqual(escolher_algoritmo(100_000, 100_000 * 99_999 // 2), "kruskal")
+        self.assertEqual(escolher_algoritmo(0, 0), "kruskal")
+
+    def test_despachante_mantem_o_contrato(self):
+        arestas = [(0, 1, 1), (1, 2, 2), (2, 0, 3), (1, 3, 4)]
+        mst, circuitos, eh_arvore = algoritmo_arvore_geradora_minima(4, arestas)
+        self.assertEqual(len(mst), 3)
+        self.assertEqual(circuitos, [(2, 0, 3)])
+        self.assertFalse(eh_arvore)
+
+    def test_algoritmo_desconhecido(self):
+        with self.assertRaises(ValueError):
+            algoritmo_arvore_geradora_minima(2, [(0, 1, 1)], algoritmo="inexistente")
+
+if __name__ == "__main__":
+    unittest.main()
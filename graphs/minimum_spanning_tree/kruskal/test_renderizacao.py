@@ -0,0 +1,105 @@
+"""
+    Autor: Fernando de Souza Teixeira
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+import zlib
+
+import numpy as np
+
+import renderizacao
+from kruskal import algoritmo_kruskal, kruskal_vetorial
+from renderizacao import marcar_destaque, montar_cena, posicoes_em_circulo, renderizar_resultado, renderizar_vetores
+
+def ler_png(caminho: str) -> np.ndarray:
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    largura, altura = struct.unpack(">II", dados[16:24])
+    inicio = dados.index(b"IDAT") + 4
+    tamanho = struct.unpack(">I", dados[inicio - 8:inicio - 4])[0]
+    linhas = np.frombuffer(zlib.decompress(dados[inicio:inicio + tamanho]), dtype=np.uint8).reshape(altura, -1)
+    return linhas[:, 1:].reshape(altura, largura, 3)
+
+class TestRenderizacao(unittest.TestCase):
+    def setUp(self):
+        self.arestas = [
+            (0, 1, 7), (1, 2, 8), (0, 3, 5), (1, 3, 9), (1, 4, 7), (2, 4, 5),
+            (3, 4, 15), (3, 5, 6), (4, 5, 8), (4, 6, 9), (5, 6, 11)
+        ]
+        self.numero_vertices = 7
+        self.diretorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def caminho(self, nome: str) -> str:
+        return os.path.join(self.diretorio.name, nome)
+
+    def test_marcar_destaque_em_qualquer_orientacao(self):
+        mascara = marcar_destaque(self.arestas, [(1, 0, 7), (6, 5, 11), (0, 1, 99)])
+        self.assertEqual(np.flatnonzero(mascara).tolist(), [0, 10])
+        self.assertFalse(marcar_destaque(self.arestas, []).any())
+
+    def test_svg_e_png_do_exemplo(self):
+        mst, circuitos, eh_arvore = algoritmo_kruskal(self.numero_vertices, self.arestas)
+        renderizar_resultado(self.caminho("exemplo.svg"), self.numero_vertices, self.arestas, mst, circuitos)
+        with open(self.caminho("exemplo.svg"), encoding="utf-8") as arquivo:
+            svg = arquivo.read()
+        self.assertIn('stroke="#ff0000"', svg)
+        self.assertEqual(svg.count("<circle"), 2 * self.numero_vertices)
+        self.assertIn(">15</text>", svg)
+
+        renderizar_resultado(self.caminho("exemplo.png"), self.numero_vertices, self.arestas, mst, circuitos)
+        imagem = ler_png(self.caminho("exemplo.png"))
+        self.assertEqual(imagem.shape, (renderizacao.TAMANHO_PAINEL + renderizacao.ALTURA_TITULO, 2 * renderizacao.TAMANHO_PAINEL + 3 * renderizacao.MARGEM, 3))
+        vermelhos = (imagem[..., 0] == 255) & (imagem[..., 1] == 0) & (imagem[..., 2] == 0)
+        self.assertTrue(vermelhos.any())
+
+    def test_formato_invalido(self):
+        with self.assertRaises(ValueError):
+            renderizar_resultado(self.caminho("exemplo.jpg"), self.numero_vertices, self.arestas, [], [])
+
+    def test_nivel_de_detalhe_em_grafo_grande(self):
+        gerador = np.random.default_rng(10)
+        numero_vertices, numero_arestas = 20_000, 100_000
+        origens = gerador.integers(0, numero_vertices, numero_arestas, dtype=np.int32)
+        destinos = gerador.integers(0, numero_vertices, numero_arestas, dtype=np.int32)
+        pesos = gerador.random(numero_arestas)
+        destacadas = np.zeros(numero_arestas, dtype=bool)
+        destacadas[::7] = True
+
+        cena = montar_cena(posicoes_em_circulo(numero_vertices, 180, 200, 200), origens, destinos, pesos, destacadas)
+        setores = renderizacao.SETORES_AGRUPAMENTO
+        self.assertLessEqual(len(cena.segmentos), setores * (setores - 1))
+        self.assertEqual(cena.rotulos_pesos, [])
+        self.assertEqual(len(cena.vertices), 0)
+        # Os feixes destacados são desenhados por último
+        self.assertTrue(cena.cores[-1].startswith("#ff"))
+
+        indices_mst, indices_circuito = kruskal_vetorial(numero_vertices, origens, destinos, pesos, modo="filtrado")
+        renderizar_vetores(self.caminho("grande.png"), numero_vertices, origens, destinos, pesos, indices_mst, indices_circuito)
+        renderizar_vetores(self.caminho("grande.svg"), numero_vertices, origens, destinos, pesos, indices_mst, indices_circuito)
+        self.assertLess(os.path.getsize(self.caminho("grande.svg")), 5_000_000)
+
+    def test_linha_de_comando_sem_tkinter(self):
+        """
+        O modo sem tela não pode depender do Tk: o comando roda com o import de tkinter bloqueado.
+        """
+        with open(self.caminho("arestas.txt"), "w", encoding="utf-8") as arquivo:
+            arquivo.writelines(f"{origem} {destino} {peso}\n" for origem, destino, peso in self.arestas)
+        bloqueio = "import runpy, sys; sys.modules['tkinter'] = None; sys.argv = sys.argv[1:]; runpy.run_path(sys.argv[0], run_name='__main__')"
+        diretorio = os.path.dirname(os.path.abspath(renderizacao.__file__))
+        resultado = subprocess.run(
+            [sys.executable, "-c", bloqueio, os.path.join(diretorio, "renderizacao.py"), self.caminho("arestas.txt"), self.caminho("saida.svg")],
+            capture_output=True, text=True, cwd=diretorio,
+        )
+        self.assertEqual(resultado.returncode, 0, resultado.stderr)
+        self.assertTrue(os.path.exists(self.caminho("saida.svg")))
+
+if __name__ == "__main__":
+    unittest.main()
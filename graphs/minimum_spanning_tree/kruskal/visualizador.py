@@ -0,0 +1,161 @@
+'''
+    Autor: Fernando de Souza Teixeira
+
+    Objetivo:
+        Janela Tkinter que mostra o resultado de 'algoritmo_kruskal': o grafo original, a árvore geradora
+        mínima com os circuitos retirados em destaque e o custo total. Fica fora de kruskal.py para que o
+        algoritmo e o modo sem tela (renderizacao.py) não dependam do Tk.
+
+    Execução:
+        ➜ python kruskal.py
+'''
+
+import math
+import tkinter as tk
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from renderizacao import marcar_destaque, montar_cena, vetores_de_arestas
+
+class VisualizadorGrafo(tk.Tk):
+    """
+    Classe para visualização gráfica do algoritmo de Kruskal usando Tkinter.
+
+    Exibe o grafo original, a árvore geradora mínima (MST) e destaca as arestas removidas (circuitos).
+    Mostra também informações textuais sobre a MST, circuitos e custo total.
+
+    Args:
+        numero_vertices (int): Número de vértices do grafo.
+        arestas_originais (list): Lista de arestas do grafo original.
+        arvore_geradora_minima (list): Lista de arestas da MST.
+        arestas_circuito (list): Lista de arestas removidas por formarem ciclos.
+        grafo_original_era_arvore (bool): Indica se o grafo original já era uma árvore.
+    """
+
+    def __init__(self, numero_vertices: int, arestas_originais: List[Tuple[int, int, int]], 
+                 arvore_geradora_minima: List[Tuple[int, int, int]], arestas_circuito: List[Tuple[int, int, int]], 
+                 grafo_original_era_arvore: bool):
+        super().__init__()
+        self.title("Kruskal - Visualização Gráfica")
+        self.geometry("900x500")
+        self.numero_vertices = numero_vertices
+        self.arestas_originais = arestas_originais
+        self.arvore_geradora_minima = arvore_geradora_minima
+        self.arestas_circuito = arestas_circuito
+        self.grafo_original_era_arvore = grafo_original_era_arvore
+
+        self.configurar_interface()
+        self.posicoes_vertices = self.calcular_posicoes_vertices(numero_vertices, 180, 200, 200)
+        self.desenhar_grafo(self.canvas_original, arestas_originais, destaque=[])
+        self.desenhar_grafo(self.canvas_mst, arvore_geradora_minima, destaque=arestas_circuito)
+        self.mostrar_informacoes()
+
+    def configurar_interface(self):
+        """
+        Configura os componentes da interface gráfica, incluindo os painéis de desenho dos grafos
+        e a área de informações textuais.
+        """
+        tk.Label(self, text="Grafo Original").pack()
+        self.canvas_original = tk.Canvas(self, width=400, height=400, bg="white")
+        self.canvas_original.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        tk.Label(self, text="Árvore Geradora Mínima (MST)").pack()
+        self.canvas_mst = tk.Canvas(self, width=400, height=400, bg="white")
+        self.canvas_mst.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        self.area_informacoes = tk.Text(self, width=110, height=8)
+        self.area_informacoes.pack(side=tk.BOTTOM, padx=10, pady=10)
+
+    def calcular_posicoes_vertices(self, numero_vertices: int, raio: int, centro_x: int, centro_y: int) -> Dict[int, Tuple[int, int]]:
+        """
+        Calcula as posições dos vértices distribuindo-os em um círculo para visualização no canvas.
+
+        Args:
+            numero_vertices (int): Número de vértices.
+            raio (int): Raio do círculo.
+            centro_x (int): Coordenada x do centro do círculo.
+            centro_y (int): Coordenada y do centro do círculo.
+
+        Returns:
+            dict: Dicionário com as posições dos vértices {vertice: (x, y)}.
+        """
+        posicoes = {}
+        angulo_passo = 2 * math.pi / numero_vertices
+        for vertice in range(numero_vertices):
+            angulo = angulo_passo * vertice
+            pos_x = int(centro_x + raio * math.cos(angulo))
+            pos_y = int(centro_y + raio * math.sin(angulo))
+            posicoes[vertice] = (pos_x, pos_y)
+        return posicoes
+
+    def desenhar_grafo(self, canvas: tk.Canvas, arestas: List[Tuple[int, int, int]], destaque: List[Tuple[int, int, int]]):
+        """
+        Desenha o grafo (arestas e vértices) no canvas especificado.
+        Arestas presentes em 'destaque' são desenhadas em vermelho; a busca é feita em um conjunto.
+        Em grafos grandes valem as regras de nível de detalhe de 'renderizacao.montar_cena'
+        (sem rótulos de peso, vértices como pontos e arestas agrupadas em feixes).
+
+        Args:
+            canvas (tk.Canvas): Canvas onde o grafo será desenhado.
+            arestas (list): Lista de arestas a serem desenhadas.
+            destaque (list): Lista de arestas a serem destacadas (ex: circuitos).
+        """
+        posicoes = np.array([self.posicoes_vertices[vertice] for vertice in range(self.numero_vertices)], dtype=float).reshape(-1, 2)
+        origens, destinos, pesos = vetores_de_arestas(arestas)
+        cena = montar_cena(posicoes, origens, destinos, pesos, marcar_destaque(arestas, destaque))
+        for (x_origem, y_origem, x_destino, y_destino), cor, largura in zip(cena.segmentos.tolist(), cena.cores, cena.larguras.tolist()):
+            canvas.create_line(x_origem, y_origem, x_destino, y_destino, fill=cor, width=largura)
+        for x_origem, y_origem, x_destino, y_destino, peso in cena.rotulos_pesos:
+            self.desenhar_peso_aresta(canvas, x_origem, y_origem, x_destino, y_destino, peso)
+        for vertice, (x, y) in enumerate(cena.vertices.tolist()):
+            if cena.rotular_vertices:
+                self.desenhar_vertice(canvas, x, y, vertice)
+            else:
+                canvas.create_oval(x - cena.raio_vertice, y - cena.raio_vertice, x + cena.raio_vertice, y + cena.raio_vertice, fill="black", outline="")
+
+    def desenhar_vertice(self, canvas: tk.Canvas, x: int, y: int, rotulo: int):
+        """
+        Desenha um vértice (nó) individual no canvas.
+
+        Args:
+            canvas (tk.Canvas): Canvas onde o vértice será desenhado.
+            x (int): Coordenada x do vértice.
+            y (int): Coordenada y do vértice.
+            rotulo (int): Rótulo do vértice.
+        """
+        canvas.create_oval(x-18, y-18, x+18, y+18, fill="lightgray", outline="black", width=2)
+        canvas.create_text(x, y, text=str(rotulo), font=("Arial", 12, "bold"))
+
+    def desenhar_peso_aresta(self, canvas: tk.Canvas, x1: int, y1: int, x2: int, y2: int, peso: int):
+        """
+        Desenha o peso de uma aresta no ponto médio entre dois vértices.
+
+        Args:
+            canvas (tk.Canvas): Canvas onde o peso será desenhado.
+            x1, y1 (int): Coordenadas do primeiro vértice.
+            x2, y2 (int): Coordenadas do segundo vértice.
+            peso (int): Peso da aresta.
+        """
+        ponto_medio_x = (x1 + x2) // 2
+        ponto_medio_y = (y1 + y2) // 2
+        canvas.create_text(ponto_medio_x, ponto_medio_y, text=str(peso), fill="blue", font=("Arial", 10, "bold"))
+
+    def mostrar_informacoes(self):
+        """
+        Exibe informações textuais sobre a árvore geradora mínima, circuitos removidos
+        e o custo total da MST na área de informações da interface.
+        """
+        self.area_informacoes.insert(tk.END, "=== Resultados do Kruskal ===\n")
+        if self.grafo_original_era_arvore:
+            self.area_informacoes.insert(tk.END, "O grafo original já era uma árvore (não havia circuitos).\n")
+        else:
+            self.area_informacoes.insert(tk.END, f"Circuitos removidos: {len(self.arestas_circuito)}\n")
+            for origem, destino, peso in self.arestas_circuito:
+                self.area_informacoes.insert(tk.END, f"  {origem} --{peso}-- {destino}\n")
+        self.area_informacoes.insert(tk.END, "\nÁrvore Geradora Mínima:\n")
+        custo_total = sum(peso for _, _, peso in self.arvore_geradora_minima)
+        for origem, destino, peso in self.arvore_geradora_minima:
+            self.area_informacoes.insert(tk.END, f"  {origem} --{peso}-- {destino}\n")
+        self.area_informacoes.insert(tk.END, f"\nCusto total: {custo_total}\n")
+        self.area_informacoes.config(state=tk.DISABLED)
@@ -0,0 +1,107 @@
+from array import array
+from collections import deque
+
+import pytest
+
+from compact_tree import NO_CHILD, CompactTree
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest test_compact_tree.py
+"""
+
+
+def level_order_list(root) -> list:
+    """
+    Level-order list with None for missing children, in the format of CompactTree.from_level_order.
+    """
+    items = []
+    queue = deque([root] if root else [])
+    if root:
+        items.append(root.value)
+    while queue:
+        node = queue.popleft()
+        for child in (node.left, node.right):
+            items.append(child.value if child else None)
+            if child:
+                queue.append(child)
+    while items and items[-1] is None:
+        items.pop()
+    return items
+
+
+def test_traversals_match_node(random_trees):
+    for root in random_trees:
+        tree = CompactTree.from_node(root)
+
+        assert tree.in_order() == root.in_order()
+        assert tree.pre_order() == root.pre_order()
+        assert tree.post_order() == root.post_order()
+        assert tree.level_order() == root.level_order()
+
+
+def test_slot_node_has_node_methods(random_trees):
+    for root in random_trees:
+        slot_root = CompactTree.from_node(root).to_nodes()
+
+        assert not hasattr(slot_root, "__dict__")
+        assert slot_root.in_order() == root.in_order()
+        assert slot_root.pre_order() == root.pre_order()
+        assert slot_root.post_order() == root.post_order()
+        assert slot_root.level_order() == root.level_order()
+        assert list(slot_root.morris_in_order()) == root.in_order()
+        assert slot_root.render() == root.render()
+
+
+def test_level_order_list_and_round_trip(exercise1, random_trees):
+    for root in random_trees:
+        tree = CompactTree.from_node(root)
+
+        assert CompactTree.from_level_order(level_order_list(root)) == tree
+        assert tree.to_nodes(exercise1.Node).pre_order() == root.pre_order()
+        assert CompactTree.from_node(tree.to_nodes()) == tree
+
+
+def test_compare_matches_compare_trees(exercise2, random_tree_pairs):
+    for tree_1, tree_2 in random_tree_pairs:
+        expected = exercise2.compare_trees(tree_1, tree_2)
+        assert CompactTree.from_node(tree_1).compare(CompactTree.from_node(tree_2)) == expected
+        assert (CompactTree.from_node(tree_1) == CompactTree.from_node(tree_2)) == (expected["Output"] == "True")
+        if expected["Output"] == "True":
+            assert hash(CompactTree.from_node(tree_1)) == hash(CompactTree.from_node(tree_2))
+
+
+def test_hash_ignores_numbering():
+    tree = CompactTree.from_level_order(["1", "2", "3", None, "4"])
+    # Same tree numbered in pre-order instead of level order
+    renumbered = CompactTree(["1", "2", "4", "3"], array('i', [1, -1, -1, -1]), array('i', [3, 2, -1, -1]))
+
+    assert renumbered == tree
+    assert hash(renumbered) == hash(tree)
+    assert len({tree, renumbered, CompactTree.from_level_order(["1", "3", "2"])}) == 2
+
+
+@pytest.mark.parametrize("random_trees", [{"exercise": 4, "seed": 16}], indirect=True)
+def test_leaf_to_root_paths_match_exercise4(exercise4, random_trees):
+    for root in random_trees:
+        tree = CompactTree.from_node(root)
+
+        assert list(tree.iter_leaf_to_root_paths()) == list(exercise4.iter_leaf_to_root_paths(root))
+        leaves = [index for index in range(len(tree)) if tree.is_leaf(index)]
+        assert len(leaves) == exercise4.leaf_to_root_summary(root)["paths"]
+        assert tree.parent[0] == NO_CHILD
+
+
+def test_empty_tree_and_invalid_level_order():
+    tree = CompactTree.from_level_order([])
+
+    assert len(tree) == 0
+    assert tree.in_order() == tree.pre_order() == tree.post_order() == tree.level_order() == []
+    assert tree.to_nodes() is None
+    assert list(tree.iter_leaf_to_root_paths()) == []
+    with pytest.raises(ValueError):
+        CompactTree.from_level_order(["1", None, None, "2"])
+    assert len(CompactTree.from_level_order([None, None])) == 0
+    with pytest.raises(ValueError):
+        CompactTree.from_level_order([None, "1"])
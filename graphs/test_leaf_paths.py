@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest test_leaf_paths.py
+"""
+
+
+def old_map_leaf_to_root_path(root) -> None:
+    # map_leaf_to_root_path as it was before the paths were streamed
+    if not root:
+        return
+    stack = [(root, [root.value])]
+    while stack:
+        node, path = stack.pop()
+        if not node.left and not node.right:
+            print("->".join(map(str, reversed(path))))
+        if node.right:
+            stack.append((node.right, path + [node.right.value]))
+        if node.left:
+            stack.append((node.left, path + [node.left.value]))
+
+
+class CountingWriter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+leaf_path_trees = pytest.mark.parametrize(
+    "random_trees", [{"exercise": 4, "seed": 16, "values": "0123456789", "with_example": True}], indirect=True
+)
+
+
+@leaf_path_trees
+def test_output_matches_old_map_leaf_to_root_path(exercise4, random_trees, capsys):
+    for root in random_trees:
+        old_map_leaf_to_root_path(root)
+        expected = capsys.readouterr().out
+
+        exercise4.map_leaf_to_root_path(root)
+        assert capsys.readouterr().out == expected
+        assert ["->".join(path) for path in exercise4.iter_leaf_to_root_paths(root)] == expected.splitlines()
+
+
+@leaf_path_trees
+def test_writer_gets_blocks_of_lines(exercise4, random_trees):
+    for root in random_trees:
+        expected = io.StringIO()
+        count = exercise4.write_leaf_to_root_paths(root, expected)
+        writer = CountingWriter()
+
+        assert exercise4.write_leaf_to_root_paths(root, writer, lines_per_write=3) == count
+        assert writer.getvalue() == expected.getvalue()
+        assert writer.writes == -(-count // 3)
+
+
+@leaf_path_trees
+def test_summary_counts(exercise4, random_trees):
+    for root in random_trees:
+        paths = list(exercise4.iter_leaf_to_root_paths(root))
+
+        assert exercise4.leaf_to_root_summary(root) == {
+            "paths": len(paths),
+            "total_length": sum(len(path) for path in paths),
+        }
+    assert exercise4.leaf_to_root_summary(exercise4.factory_node()) == {"paths": 5, "total_length": 17}
+    assert exercise4.leaf_to_root_summary(None) == {"paths": 0, "total_length": 0}
+    assert list(exercise4.iter_leaf_to_root_paths(None)) == []
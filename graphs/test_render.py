@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest test_render.py
+"""
+
+
+def old_print_tree(node, prefix: str = '', is_left: bool = True) -> None:
+    # Node.print_tree as it was before rendering became iterative
+    if node.right:
+        old_print_tree(node.right, prefix + ('│   ' if is_left else '    '), False)
+    print(prefix + ('└── ' if is_left else '┌── ') + str(node.value))
+    if node.left:
+        old_print_tree(node.left, prefix + ('    ' if is_left else '│   '), True)
+
+
+class BlockWriter:
+    def __init__(self):
+        self.blocks: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.blocks.append(text)
+        return len(text)
+
+
+@pytest.fixture(params=["exercise2", "exercise4"])
+def exercise(request):
+    return request.getfixturevalue(request.param)
+
+
+render_trees = pytest.mark.parametrize(
+    "random_trees",
+    [{"exercise": number, "seed": 17, "count": 40, "sizes": (1, 60), "values": "0123456789", "with_example": True}
+     for number in (2, 4)],
+    indirect=True,
+    ids=["exercise2", "exercise4"],
+)
+
+
+@render_trees
+def test_render_matches_old_print_tree(random_trees, capsys):
+    for root in random_trees:
+        for prefix, is_left in (('', True), ('>> ', False)):
+            old_print_tree(root, prefix, is_left)
+            expected = capsys.readouterr().out
+
+            assert root.render(prefix=prefix, is_left=is_left) == expected
+            root.print_tree(prefix, is_left)
+            assert capsys.readouterr().out == expected
+
+
+@render_trees
+def test_writer_gets_blocks_of_lines(random_trees):
+    for root in random_trees:
+        expected = root.render()
+        writer = BlockWriter()
+
+        assert root.render(writer, lines_per_write=4) is None
+        assert ''.join(writer.blocks) == expected
+        lines = expected.count('\n')
+        assert len(writer.blocks) == -(-lines // 4)
+        assert all(block.count('\n') == 4 for block in writer.blocks[:-1])
+
+
+def test_max_depth_marks_cut_subtrees(exercise4):
+    root = exercise4.factory_node()
+
+    assert root.render(max_depth=0) == (
+        '└── 1\n'
+        '    └── …\n'
+    )
+    assert root.render(max_depth=1) == (
+        '│   ┌── 3\n'
+        '│   │   └── …\n'
+        '└── 1\n'
+        '    └── 2\n'
+        '        └── …\n'
+    )
+    # Deep enough for the whole tree: no marker
+    assert root.render(max_depth=3) == root.render()
+
+
+def test_max_nodes_marks_subtrees_left_out(exercise4):
+    root = exercise4.factory_node()
+
+    assert root.render(max_nodes=3) == (
+        '│       ┌── 7\n'
+        '│   ┌── 3\n'
+        '│   │   └── …\n'
+        '└── 1\n'
+        '    └── …\n'
+    )
+    assert root.render(max_nodes=1) == (
+        '│   ┌── …\n'
+        '└── 1\n'
+        '    └── …\n'
+    )
+    assert root.render(max_nodes=9) == root.render()
+
+
+def test_truncated_render_is_bounded(exercise, random_tree):
+    generator = random.Random(170)
+    root = random_tree(exercise.Node, generator, 2_000)
+
+    text = root.render(max_nodes=50)
+    assert sum(1 for line in text.splitlines() if not line.endswith('…')) == 50
+    assert all(line.count('    ') + line.count('│   ') <= 3 for line in root.render(max_depth=2).splitlines())
@@ -0,0 +1,103 @@
+import itertools
+
+import pytest
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest test_traversals.py
+"""
+
+
+def recursive_in_order(node) -> list:
+    return recursive_in_order(node.left) + [node.value] + recursive_in_order(node.right) if node else []
+
+
+def recursive_pre_order(node) -> list:
+    return [node.value] + recursive_pre_order(node.left) + recursive_pre_order(node.right) if node else []
+
+
+def recursive_post_order(node) -> list:
+    return recursive_post_order(node.left) + recursive_post_order(node.right) + [node.value] if node else []
+
+
+def recursive_level_order(node) -> list:
+    levels: list[list] = []
+
+    def visit(node, depth):
+        if node:
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(node.value)
+            visit(node.left, depth + 1)
+            visit(node.right, depth + 1)
+
+    visit(node, 0)
+    return [value for level in levels for value in level]
+
+
+def structure(root) -> list:
+    """
+    Identity of every node with its children, to detect links left behind by a traversal. Nodes are
+    visited once, so a leftover thread back to an ancestor does not loop forever.
+    """
+    nodes = []
+    seen = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes.append((id(node), id(node.left), id(node.right)))
+        stack.extend(child for child in (node.left, node.right) if child)
+    return nodes
+
+
+# Distinct values, so that a traversal in the wrong order cannot pass by chance
+distinct_value_trees = pytest.mark.parametrize(
+    "random_trees", [{"seed": 13, "sizes": (1, 60), "values": "abcdefghijklmnopqrstuvwxyz0123456789"}], indirect=True
+)
+
+
+@distinct_value_trees
+def test_traversals_match_recursive_versions(random_trees):
+    for root in random_trees:
+        assert list(root.iter_in_order()) == root.in_order() == recursive_in_order(root)
+        assert list(root.iter_pre_order()) == root.pre_order() == recursive_pre_order(root)
+        assert list(root.iter_post_order()) == root.post_order() == recursive_post_order(root)
+        assert list(root.iter_level_order()) == root.level_order() == recursive_level_order(root)
+        assert list(root.morris_in_order()) == recursive_in_order(root)
+
+
+@distinct_value_trees
+def test_morris_restores_the_tree_after_a_full_walk(random_trees):
+    for root in random_trees:
+        before = structure(root)
+        list(root.morris_in_order())
+        assert structure(root) == before
+
+
+@distinct_value_trees
+def test_morris_restores_the_tree_when_stopped_early(random_trees):
+    for root in random_trees:
+        before = structure(root)
+        expected = recursive_in_order(root)
+        for stop in (1, len(expected) // 2, len(expected) - 1):
+            walk = root.morris_in_order()
+            assert list(itertools.islice(walk, stop)) == expected[:stop]
+            walk.close()
+            assert structure(root) == before
+            assert recursive_in_order(root) == expected
+
+
+def test_deep_tree_does_not_recurse(exercise1):
+    root = node = exercise1.Node("0")
+    for value in range(1, 10_000):
+        node.left = exercise1.Node(str(value))
+        node = node.left
+
+    assert root.in_order() == [str(value) for value in reversed(range(10_000))]
+    assert root.post_order() == root.in_order()
+    assert len(root.pre_order()) == len(root.level_order()) == 10_000
+    assert list(root.morris_in_order()) == root.in_order()
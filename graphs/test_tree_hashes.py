@@ -0,0 +1,67 @@
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest test_tree_hashes.py
+"""
+
+
+def pre_order_pairs(tree_1, tree_2):
+    pairs = [(tree_1, tree_2)]
+    while pairs:
+        node_a, node_b = pairs.pop()
+        if node_a is None and node_b is None:
+            continue
+        yield node_a, node_b
+        if node_a is not None and node_b is not None:
+            pairs.append((node_a.right, node_b.right))
+            pairs.append((node_a.left, node_b.left))
+
+
+def test_hashed_comparison_matches_plain_comparison(exercise2, random_tree_pairs):
+    shared: dict = {}
+    for tree_1, tree_2 in random_tree_pairs:
+        expected = exercise2.compare_trees(tree_1, tree_2)
+
+        assert exercise2.compare_trees(tree_1, tree_2, hashes={}) == expected
+        assert exercise2.compare_trees(tree_1, tree_2, hashes=shared) == expected
+
+
+def test_first_difference_is_the_first_differing_pre_order_pair(exercise2, random_tree_pairs):
+    for tree_1, tree_2 in random_tree_pairs:
+        hashes = exercise2.subtree_hashes(tree_2, exercise2.subtree_hashes(tree_1))
+        expected = next(
+            ((node_a, node_b) for node_a, node_b in pre_order_pairs(tree_1, tree_2)
+             if node_a is None or node_b is None or node_a.value != node_b.value),
+            None,
+        )
+        difference = exercise2.first_difference(tree_1, tree_2, hashes)
+
+        if expected is None:
+            assert difference is None
+        else:
+            # Both sides of the pair are the same nodes, or the same missing child
+            assert difference is not None
+            assert difference[0] is expected[0] and difference[1] is expected[1]
+
+
+def test_group_identical_trees(exercise2, random_tree_pairs):
+    trees = [tree for pair in random_tree_pairs[:60] for tree in pair]
+
+    groups = exercise2.group_identical_trees(trees)
+
+    assert sorted(position for group in groups for position in group) == list(range(len(trees)))
+    for group in groups:
+        assert all(exercise2.compare_trees(trees[group[0]], trees[position])["Output"] == "True" for position in group)
+    firsts = [group[0] for group in groups]
+    assert all(
+        exercise2.compare_trees(trees[first], trees[other])["Output"] == "False"
+        for first in firsts for other in firsts if first != other
+    )
+
+
+def test_hashed_comparison_tells_value_types_apart(exercise2):
+    for value_1, value_2 in [(1, "1"), ("a", "'a'"), (1, 1.0), (None, "None")]:
+        tree_1, tree_2 = exercise2.Node("root"), exercise2.Node("root")
+        tree_1.left, tree_2.left = exercise2.Node(value_1), exercise2.Node(value_2)
+
+        assert exercise2.compare_trees(tree_1, tree_2, hashes={}) == exercise2.compare_trees(tree_1, tree_2)
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from compact_tree import CompactTree
+from tree_snapshot import HEADER, load_snapshot, write_snapshot
+
+"""
+    Run the tests with the command:
+    1 - pip install pytest
+    2 - pytest test_tree_snapshot.py
+"""
+
+
+def open_descriptors() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+def test_empty_tree(tmp_path):
+    path = str(tmp_path / "empty.snap")
+
+    assert write_snapshot(None, path) == 0
+    with load_snapshot(path) as snapshot:
+        assert len(snapshot) == 0
+        assert snapshot.root is None
+        assert list(snapshot.iter_pre_order()) == []
+        assert len(snapshot.to_compact_tree()) == 0
+
+
+def test_single_node(tmp_path, exercise2):
+    path = str(tmp_path / "single.snap")
+
+    assert write_snapshot(exercise2.Node("only"), path) == 1
+    with load_snapshot(path) as snapshot:
+        assert snapshot.root.value == "only"
+        assert snapshot.root.left is None and snapshot.root.right is None
+
+
+def test_unicode_values_round_trip(tmp_path):
+    tree = CompactTree.from_level_order(["ção", "日本語", "😀", None, "", "a\nb"])
+    path = str(tmp_path / "unicode.snap")
+
+    write_snapshot(tree.to_nodes(), path)
+    with load_snapshot(path) as snapshot:
+        assert list(snapshot.iter_pre_order()) == tree.pre_order()
+        assert snapshot.to_compact_tree() == tree
+
+
+@pytest.mark.parametrize("random_trees", [{"exercise": 2, "seed": 18, "count": 60, "sizes": (1, 60)}], indirect=True)
+def test_compare_trees_on_snapshot_nodes(tmp_path, exercise2, random_trees):
+    for index, (tree, other) in enumerate(zip(random_trees[::2], random_trees[1::2])):
+        path = str(tmp_path / f"tree_{index}.snap")
+        write_snapshot(tree, path)
+        with load_snapshot(path) as snapshot:
+            assert exercise2.compare_trees(snapshot.root, tree)["Output"] == "True"
+            assert exercise2.compare_trees(snapshot.root, tree, hashes={})["Output"] == "True"
+            assert exercise2.compare_trees(snapshot.root, other) == exercise2.compare_trees(tree, other)
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc to count open files")
+def test_truncated_file_is_rejected_without_leaking(tmp_path):
+    tree = CompactTree.from_level_order([str(value) for value in range(100)])
+    path = tmp_path / "tree.snap"
+    write_snapshot(tree.to_nodes(), str(path))
+    data = path.read_bytes()
+    descriptors = open_descriptors()
+
+    for size in (HEADER.size - 1, HEADER.size, 200, len(data) - 1):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            load_snapshot(str(path))
+    assert open_descriptors() == descriptors
@@ -0,0 +1,117 @@
+import sys
+from collections import deque
+from typing import Iterator, TextIO
+
+from tree_render import render_tree
+
+
+class NodeMethods:
+    """
+    Traversal and drawing methods shared by the exercises' Node and by compact_tree.SlotNode.
+    Subclasses provide value, left and right; the mixin has no slots of its own so SlotNode stays compact.
+    """
+
+    __slots__ = ()
+
+    def iter_in_order(self) -> Iterator[str]:
+        stack: list[NodeMethods] = []
+        node: NodeMethods | None = self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def iter_pre_order(self) -> Iterator[str]:
+        stack: list[NodeMethods] = [self]
+        while stack:
+            node = stack.pop()
+            yield node.value
+            # The right child is pushed first so the left subtree comes out first
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_post_order(self) -> Iterator[str]:
+        stack: list[NodeMethods] = []
+        node: NodeMethods | None = self
+        last_visited: NodeMethods | None = None
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            # Go right only once; on the way back up from the right subtree the node itself is emitted
+            if top.right and top.right is not last_visited:
+                node = top.right
+            else:
+                yield top.value
+                last_visited = stack.pop()
+
+    def iter_level_order(self) -> Iterator[str]:
+        queue: deque[NodeMethods] = deque([self])
+        while queue:
+            node = queue.popleft()
+            yield node.value
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def _morris_walk(self) -> Iterator["NodeMethods"]:
+        node: NodeMethods | None = self
+        while node:
+            if node.left is None:
+                yield node
+                node = node.right
+                continue
+            predecessor = node.left
+            while predecessor.right and predecessor.right is not node:
+                predecessor = predecessor.right
+            if predecessor.right is None:
+                # First visit: thread the predecessor back to this node and descend left
+                predecessor.right = node
+                node = node.left
+            else:
+                # Second visit: the left subtree is done, remove the thread
+                predecessor.right = None
+                yield node
+                node = node.right
+
+    def morris_in_order(self) -> Iterator[str]:
+        """
+        In-order traversal with O(1) extra memory. The tree is modified temporarily while the
+        generator runs; if it is closed early, the rest of the walk runs silently to undo the threads.
+        """
+        walk = self._morris_walk()
+        try:
+            for node in walk:
+                yield node.value
+        finally:
+            for _ in walk:
+                pass
+
+    def in_order(self) -> list[str]:
+        return list(self.iter_in_order())
+
+    def pre_order(self) -> list[str]:
+        return list(self.iter_pre_order())
+
+    def post_order(self) -> list[str]:
+        return list(self.iter_post_order())
+
+    def level_order(self) -> list[str]:
+        return list(self.iter_level_order())
+
+    def render(self, writer: TextIO | None = None, max_depth: int | None = None, max_nodes: int | None = None,
+               prefix: str = '', is_left: bool = True, lines_per_write: int = 4096) -> str | None:
+        """
+        Draws the tree like print_tree; see tree_render.render_tree.
+        """
+        return render_tree(self, writer, max_depth, max_nodes, prefix, is_left, lines_per_write)
+
+    def print_tree(self, prefix: str = '', is_left: bool = True, max_depth: int | None = None, max_nodes: int | None = None):
+        self.render(sys.stdout, max_depth, max_nodes, prefix, is_left)
@@ -0,0 +1,46 @@
+from typing import TextIO
+
+
+def render_tree(root, writer: TextIO | None = None, max_depth: int | None = None, max_nodes: int | None = None,
+                prefix: str = '', is_left: bool = True, lines_per_write: int = 4096) -> str | None:
+    """
+    Draws a tree of Node-like objects (value, left, right) like the recursive print_tree of the
+    exercises, iteratively and into a single buffer, and returns the text. With a writer (a file,
+    sys.stdout...) the lines are written in blocks of lines_per_write instead.
+    Children below max_depth (the root is depth 0) and subtrees left after max_nodes nodes are drawn as "…".
+    """
+    lines: list[str] = []
+    # Nodes still to draw, as (node, prefix, is_left, depth), or lines already built (str)
+    stack: list = [(root, prefix, is_left, 0)]
+    drawn = 0
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            lines.append(entry)
+        else:
+            node, prefix, is_left, depth = entry
+            connector = '└── ' if is_left else '┌── '
+            if max_nodes is not None and drawn >= max_nodes:
+                lines.append(prefix + connector + '…')
+                continue
+            drawn += 1
+            line = prefix + connector + str(node.value)
+            if max_depth is not None and depth >= max_depth and (node.left or node.right):
+                lines.append(line)
+                lines.append(prefix + ('    ' if is_left else '│   ') + '└── …')
+                continue
+            # Right subtree above the node and left subtree below it, as in print_tree
+            if node.left:
+                stack.append((node.left, prefix + ('    ' if is_left else '│   '), True, depth + 1))
+            stack.append(line)
+            if node.right:
+                stack.append((node.right, prefix + ('│   ' if is_left else '    '), False, depth + 1))
+        if writer is not None and len(lines) >= lines_per_write:
+            writer.write('\n'.join(lines) + '\n')
+            lines.clear()
+    text = '\n'.join(lines) + '\n' if lines else ''
+    if writer is None:
+        return text
+    if text:
+        writer.write(text)
+    return None
@@ -0,0 +1,206 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator
+
+from compact_tree import NO_CHILD, CompactTree
+
+# Header: magic, version, node count, size of the values blob (little-endian, 32 bytes)
+MAGIC = b'TREESNAP'
+VERSION = 1
+HEADER = struct.Struct('<8sIxxxxQQ')
+HAS_LEFT = 1
+HAS_RIGHT = 2
+
+# After the header, with nodes numbered in preorder (the root is node 0):
+#     value_offsets  uint64[n + 1]  start of each value in the blob (the offsets table)
+#     right          int32[n]       preorder index of the right child, or -1
+#     flags          uint8[n]       HAS_LEFT | HAS_RIGHT; the left child of node i is always node i + 1
+#     values         UTF-8 blob
+
+
+def write_snapshot(root, path: str) -> int:
+    """
+    Writes a tree of Node-like objects (value, left, right) in the preorder binary format.
+
+    Returns:
+        int: The number of nodes written.
+    """
+    value_offsets = array('Q', [0])
+    right = array('i')
+    flags = array('B')
+    blob = bytearray()
+    # (node, index of the parent whose right child it is, or NO_CHILD)
+    stack = [(root, NO_CHILD)] if root is not None else []
+    while stack:
+        node, right_of = stack.pop()
+        index = len(flags)
+        if right_of != NO_CHILD:
+            right[right_of] = index
+        blob += str(node.value).encode('utf-8')
+        value_offsets.append(len(blob))
+        right.append(NO_CHILD)
+        flags.append((HAS_LEFT if node.left else 0) | (HAS_RIGHT if node.right else 0))
+        if node.right:
+            stack.append((node.right, index))
+        if node.left:
+            stack.append((node.left, NO_CHILD))
+
+    if sys.byteorder != 'little':
+        value_offsets.byteswap()
+        right.byteswap()
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(flags), len(blob)))
+        value_offsets.tofile(file)
+        right.tofile(file)
+        flags.tofile(file)
+        file.write(blob)
+    return len(flags)
+
+
+class SnapshotNode:
+    """
+    Lazy view of one node of a snapshot, with the same value/left/right attributes as Node.
+    Views of the same node compare and hash equal, so they work as keys of subtree_hashes.
+    """
+
+    __slots__ = ('_snapshot', '_index')
+
+    def __init__(self, snapshot: "TreeSnapshot", index: int):
+        self._snapshot = snapshot
+        self._index = index
+
+    @property
+    def value(self) -> str:
+        return self._snapshot.value(self._index)
+
+    @property
+    def left(self) -> "SnapshotNode | None":
+        child = self._snapshot.left_child(self._index)
+        return None if child == NO_CHILD else SnapshotNode(self._snapshot, child)
+
+    @property
+    def right(self) -> "SnapshotNode | None":
+        child = self._snapshot.right_child(self._index)
+        return None if child == NO_CHILD else SnapshotNode(self._snapshot, child)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SnapshotNode) and self._snapshot is other._snapshot and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._snapshot), self._index))
+
+    def __repr__(self) -> str:
+        return f'SnapshotNode({self.value!r})'
+
+
+class TreeSnapshot:
+    """
+    Memory-mapped snapshot file. Nothing is decoded up front: the tables are memoryviews over the
+    mapping and each value is decoded only when it is read.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map = None
+        self._views: list[memoryview] = []
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f'{path} is not a tree snapshot')
+            magic, version, self.size, blob_size = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f'{path} is not a tree snapshot')
+            if version != VERSION:
+                raise ValueError(f'Unsupported tree snapshot version {version} in {path}')
+            # Offsets (8 bytes each, one extra), right children (4 bytes) and flags (1 byte), then the blob
+            flags_end = HEADER.size + 8 * (self.size + 1) + 4 * self.size + self.size
+            if flags_end + blob_size > os.fstat(self._file.fileno()).st_size:
+                raise ValueError(f'{path} is truncated')
+            if not self.size:
+                self._value_offsets, self._right, self._flags, self._values = array('Q', [0]), array('i'), b'', b''
+                return
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(self._map)
+            self._views.append(view)
+            start = HEADER.size
+            offsets_end = start + 8 * (self.size + 1)
+            right_end = offsets_end + 4 * self.size
+            if sys.byteorder == 'little':
+                self._value_offsets = view[start:offsets_end].cast('Q')
+                self._views.append(self._value_offsets)
+                self._right = view[offsets_end:right_end].cast('i')
+                self._views.append(self._right)
+            else:
+                # Big-endian machines pay for one copy of the two tables
+                self._value_offsets = array('Q', view[start:offsets_end])
+                self._right = array('i', view[offsets_end:right_end])
+                self._value_offsets.byteswap()
+                self._right.byteswap()
+            self._flags = view[right_end:flags_end]
+            self._views.append(self._flags)
+            self._values = view[flags_end:flags_end + blob_size]
+            self._views.append(self._values)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "TreeSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def root(self) -> SnapshotNode | None:
+        return SnapshotNode(self, 0) if self.size else None
+
+    def value(self, index: int) -> str:
+        return str(self._values[self._value_offsets[index]:self._value_offsets[index + 1]], 'utf-8')
+
+    def left_child(self, index: int) -> int:
+        return index + 1 if self._flags[index] & HAS_LEFT else NO_CHILD
+
+    def right_child(self, index: int) -> int:
+        return self._right[index]
+
+    def iter_pre_order(self) -> Iterator[str]:
+        # Nodes are stored in preorder, so this is a sequential scan of the blob
+        for index in range(self.size):
+            yield self.value(index)
+
+    def to_compact_tree(self) -> CompactTree:
+        """
+        Copies the snapshot into a CompactTree (renumbered in level order).
+        """
+        return CompactTree.from_node(self.root)
+
+
+def load_snapshot(path: str) -> TreeSnapshot:
+    return TreeSnapshot(path)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    tree = CompactTree.from_level_order(["1", "2", "3", "4", None, "5", "6", None, None, "7", "8"])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tree.snap')
+        print(write_snapshot(tree.to_nodes(), path), 'nodes written')
+        with load_snapshot(path) as snapshot:
+            print("Pre-order:", list(snapshot.iter_pre_order()))
+            print(snapshot.to_compact_tree().compare(tree))